@@ -7,6 +7,7 @@ class ChessGame:
 
     Methods:
         neighbors: Computes the neighboring states of a given chess game state.
+        child: Computes the state reached from a given chess game state with a legal move.
     """
     def neighbors(self, state: StateChessGame):
         """
@@ -18,8 +19,16 @@ class ChessGame:
 
         # Iterate through all legal moves and compute the resulting game state
         for legal_move in state.game_representation.get_all_legal_moves():
-            representation = state.game_representation.make_a_move(legal_move)
-            neighbor = StateChessGame(game_representation=representation, state_parent=state,
-                                      move=legal_move)
-            neighbors.append(neighbor)
+            neighbors.append(self.child(state, legal_move))
         return neighbors
+
+    def child(self, state: StateChessGame, move):
+        """
+        Determines the state reached from the provided chess game state with a legal move.
+        :param state: The current state of the chess game.
+        :param move: A legal move of the current state.
+        :return: The resulting game state.
+        """
+        # The moves come from the legal move generator: no need to check them again.
+        representation = state.game_representation.make_a_legal_move(move)
+        return StateChessGame(game_representation=representation, state_parent=state, move=move)
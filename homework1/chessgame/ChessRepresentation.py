@@ -1,5 +1,7 @@
 import chess
 
+from ZobristHash import push_move, zobrist_hash
+
 
 class ChessRepresentation:
     """
@@ -8,18 +10,23 @@ class ChessRepresentation:
 
     Attributes:
         game_board (chess.Board): The current state of the chess board.
+        key (int): The 64-bit Zobrist key of the board, which also covers the side to move,
+                castling rights and en passant.
     """
 
-    def __init__(self, game_board=None):
+    def __init__(self, game_board=None, key=None):
         """
         Initializes the chess representation with an optional game board.
         :param game_board: The initial state of the chess board.
                 Defaults to a new chess board if not provided.
+        :param key: The Zobrist key of the board, if already computed incrementally.
+                Computed from scratch if not provided.
         """
         self.game_board = game_board
 
         if game_board is None:
             self.game_board = chess.Board()
+        self.key = key if key is not None else zobrist_hash(self.game_board)
 
     def is_victory(self):
         """
@@ -147,22 +154,30 @@ class ChessRepresentation:
         :return: A new chess representation after making the move.
                 None if the move is not legal.
         """
-        if move in self.get_all_legal_moves():
-            new_game_board = self.game_board.copy()
-            new_game_board.push(move)
-            return ChessRepresentation(game_board=new_game_board)
+        if self.game_board.is_legal(move):
+            return self.make_a_legal_move(move)
         return None
 
+    def make_a_legal_move(self, move):
+        """
+        Makes a move already known to be legal (e.g. taken from get_all_legal_moves) without checking it again.
+        :param move: The legal move to be made.
+        :return: A new chess representation after making the move.
+        """
+        new_game_board = self.game_board.copy()
+        key = push_move(new_game_board, self.key, move)
+        return ChessRepresentation(game_board=new_game_board, key=key)
+
     def __eq__(self, other):
         if not isinstance(other, ChessRepresentation):
             return False
-        return str(self.game_board) == str(other.game_board)
+        return self.key == other.key
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(str(self.game_board))
+        return self.key
 
     def __str__(self):
         return str(self.game_board)
@@ -95,4 +95,4 @@ class StateChessGame:
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(str(self.game_representation))
+        return hash(self.game_representation)
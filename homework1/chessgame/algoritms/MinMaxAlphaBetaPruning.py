@@ -1,113 +1,225 @@
+import math
+
 import numpy as np
 
+from ChessRepresentation import ChessRepresentation
+from StateChessGame import StateChessGame
+from ZobristHash import push_move
+from algoritms.TranspositionTable import TranspositionTable, bound_type, EXACT
+
 
 class MinMaxAlphaBetaPruning:
     """
     Implementation of Minimax algorithm with Alpha-Beta pruning.
 
+    The search walks the game tree on a single copy of the board: each move is played with push and taken back
+    with pop, and the legal moves are generated lazily, so none is generated after a cutoff.
+    Only the chosen child of the root is built as a StateChessGame.
+
+    With principal variation search, only the first move of each node is searched with the full window; the
+    following ones are searched with a null window, which only tells whether they are better than the best move
+    so far, and again with the full window when they are.
+
     Attributes:
         game: An instance of a game object that provides interface methods for the game state and its neighbors.
         heuristic: An instance of a heuristic object used to evaluate game states.
         max_depth: Maximum depth for the minimax search. Default is 1.
         prune_count: Count of the times pruning occurred during the search.
         eval_count: Count of the evaluations performed during the search.
+        transposition_table: Table of the positions already searched, keyed by Zobrist key.
+        move_ordering: Sorts the moves of each node, None to search them in generation order.
+        quiescence: Extends the captures at the leaves, None to evaluate the leaves directly.
+        principal_variation: Whether the moves after the first one of each node are searched with a null window.
+        research_count: Count of the null-window searches that had to be repeated with the full window.
+        cursor: The state wrapping the board walked by the current search, passed to the heuristic.
     """
 
-    def __init__(self, game, heuristic, max_depth=1):
+    def __init__(self, game, heuristic, max_depth=1, transposition_table=None, move_ordering=None,
+                 quiescence=None, principal_variation=False):
         """
         Initializes an instance of the MinMaxAlphaBetaPruning class.
         :param game: The game for which the search is performed.
         :param heuristic: The heuristic to evaluate the game states.
         :param max_depth: Maximum depth of the search. Default is 1.
+        :param transposition_table: Transposition table of the searches. Default is a new TranspositionTable.
+        :param move_ordering: Move ordering of the nodes (e.g. MoveOrdering). Defaults to the generation order.
+        :param quiescence: Quiescence search of the leaves (e.g. Quiescence). Defaults to evaluating them directly.
+        :param principal_variation: Whether to use principal variation search. Default is False.
         """
         self.game = game
         self.heuristic = heuristic
         self.max_depth = max_depth
         self.prune_count = 0
         self.eval_count = 0
+        self.transposition_table = transposition_table if transposition_table is not None else TranspositionTable()
+        self.move_ordering = move_ordering
+        self.quiescence = quiescence
+        self.principal_variation = principal_variation
+        self.research_count = 0
+        self.cursor = None
 
     @staticmethod
-    def pick(states, parent_turn):
+    def pick(moves, values, parent_turn):
         """
-        Picks the best state based on the heuristic values.
+        Picks the best move based on the heuristic values.
 
-        This function evaluates a list of game states and selects the state that optimizes
-        the current player's position.
-        If it is the maximizing player's turn (parent_turn is True), the state with the highest heuristic
+        This function selects the move of the root that optimizes the current player's position.
+        If it is the maximizing player's turn (parent_turn is True), the move with the highest heuristic
         value is chosen.
-        Otherwise, if it is the minimizing player's turn (parent_turn is False), the state with the lowest heuristic
+        Otherwise, if it is the minimizing player's turn (parent_turn is False), the move with the lowest heuristic
         value is chosen.
 
-        :param states: List of game states to pick from.
+        :param moves: List of moves to pick from.
+        :param values: The heuristic value of each move.
         :param parent_turn: Indicates whose turn it is: True for maximizing player and False for minimizing player.
-        :return: The best state based on the heuristic value.
+        :return: The best move based on the heuristic value, and its value.
         """
         if parent_turn:
-            # If it's the maximizing player's turn, select the state with the highest heuristic value.
-            return max(states, key=lambda state: state.h)
+            # If it's the maximizing player's turn, select the move with the highest heuristic value.
+            return max(zip(moves, values), key=lambda move_value: move_value[1])
         else:
-            # If it's the minimizing player's turn, select the state with the lowest heuristic value.
-            return min(states, key=lambda state: state.h)
+            # If it's the minimizing player's turn, select the move with the lowest heuristic value.
+            return min(zip(moves, values), key=lambda move_value: move_value[1])
 
-    def evaluate(self, states, parent_turn):
+    def evaluate(self, key, moves, parent_turn, alpha=-np.inf, beta=np.inf):
         """
-        Evaluates a list of game states using the Minimax algorithm with Alpha-Beta pruning.
+        Evaluates a list of moves of the root using the Minimax algorithm with Alpha-Beta pruning.
 
-        This function evaluates a list of game states using the Minimax algorithm with Alpha-Beta pruning.
-        It assigns a heuristic value to each state based on its evaluation at a specified depth in the game tree.
-        The depth of the evaluation is determined by the 'max_depth' attribute of the object.
+        Each move is played on the board of the search and evaluated at the depth given by the 'max_depth'
+        attribute of the object, then taken back. The bound of the best move found so far is carried to the
+        next moves: the value of the best move is exact, the values of the others may be bounds.
+        The best move is the same as with independent full-window searches of the moves.
 
-        :param states: List of game states to evaluate.
+        :param key: The Zobrist key of the root.
+        :param moves: List of moves to evaluate.
         :param parent_turn: Indicates whose turn it is: True for maximizing player and False for minimizing player.
+        :param alpha: The alpha value of the root. Default is -inf.
+        :param beta: The beta value of the root. Default is inf.
+        :return: The heuristic value of each move, up to the move that leaves the window (alpha, beta), if any.
         """
-        for state in states:
-            if state.can_claim_draw():
-                # If the state can claim a draw, assign a heuristic value of 0.
-                state.h = 0.0
+        board = self.cursor.game_representation.game_board
+        values = []
+        for move in moves:
+            child_key = push_move(board, key, move)
+            if board.can_claim_draw():
+                # If a draw can be claimed after the move, assign a heuristic value of 0.
+                value = 0.0
+            else:
+                # Otherwise, use the Minimax algorithm with Alpha-Beta pruning and the bound of the best move so far.
+                value = self.__search_child(child_key, self.max_depth - 1, alpha, beta, parent_turn, not values)
+            board.pop()
+            values.append(value)
+            if parent_turn:
+                alpha = max(alpha, value)
             else:
-                # Otherwise, use the Minimax algorithm with Alpha-Beta pruning to assign a heuristic value.
-                state.h = self.__minmax_alpha_beta(state, self.max_depth - 1, -np.inf, np.inf, not parent_turn)
+                beta = min(beta, value)
+            if alpha >= beta:  # Only with a narrower window (or a mate): the value of the root is out of the window.
+                break
+        return values
+
+    def __search_child(self, key, depth, alpha, beta, parent_turn, first):
+        """
+        Searches the position reached by a move, with a null window if principal variation search is enabled.
+
+        The null window is the smallest one around the bound of the parent. If the move turns out to be better than
+        the best move so far without causing a cutoff, it is searched again with the full window.
+
+        :param key: Zobrist key of the position reached by the move, already played on the board.
+        :param depth: Remaining depth of the search of the position.
+        :param alpha: Alpha value of the parent.
+        :param beta: Beta value of the parent.
+        :param parent_turn: Indicates whose turn it is in the parent: True for maximizing player.
+        :param first: Whether the move is the first one searched in the parent.
+        :return: Heuristic value of the position.
+        """
+        if first or not self.principal_variation:
+            return self.__minmax_alpha_beta(key, depth, alpha, beta, not parent_turn)
+        if parent_turn:
+            value = self.__minmax_alpha_beta(key, depth, alpha, math.nextafter(alpha, math.inf), False)
+        else:
+            value = self.__minmax_alpha_beta(key, depth, math.nextafter(beta, -math.inf), beta, True)
+        if alpha < value < beta:
+            self.research_count += 1  # The move is better than the best one so far: its exact value is needed.
+            value = self.__minmax_alpha_beta(key, depth, alpha, beta, not parent_turn)
+        return value
 
-    def __minmax_alpha_beta(self, state, depth, alpha, beta, turn):
+    def __minmax_alpha_beta(self, key, depth, alpha, beta, turn):
         """
         Recursive helper method to perform Minimax search with Alpha-Beta pruning.
 
         This private method performs a recursive Minimax search with Alpha-Beta pruning to find the optimal move
         in the game tree.
-        It evaluates the provided game state and returns a heuristic value based on the current player's turn.
+        It evaluates the current position of the board and returns a heuristic value based on the current
+        player's turn.
 
-        :param state: Current game state.
+        :param key: Zobrist key of the current position of the board.
         :param depth: Current depth in the search.
         :param alpha: Best already explored option for the maximizer.
         :param beta: Best already explored option for the minimizer.
         :param turn: Indicates whose turn it is: True for maximizing player and False for minimizing player.
-        :return: Heuristic value of the provided game state.
+        :return: Heuristic value of the current position.
         """
         self.eval_count += 1  # Count the number of state evaluations.
-        neighbors = self.game.neighbors(state)  # Generate possible successor states.
+        board = self.cursor.game_representation.game_board
+        self.cursor.game_representation.key = key
+
+        # Reuse the value of the position if it was already searched at least as deep with a compatible bound.
+        value = self.transposition_table.lookup(key, depth, alpha, beta)
+        if value is not None:
+            return value
+
+        if depth == 0 and self.quiescence is not None:
+            # At the horizon, extend the captures and promotions until the position is quiet.
+            # The result depends on the window, so it is stored as a bound.
+            value = self.quiescence.search(self.cursor, alpha, beta, turn)
+            self.transposition_table.store(key, depth, value, bound_type(value, alpha, beta))
+            return value
 
-        if depth == 0 or state.is_endgame():
+        if depth == 0 or board.is_game_over():
             # Base case: If the maximum depth is reached or the state represents an endgame, return the heuristic value.
-            return self.heuristic.h(state)
+            value = self.heuristic.h(self.cursor)
+            self.transposition_table.store(key, depth, value, EXACT)
+            return value
 
+        alpha_start, beta_start = alpha, beta
+        best_move = None
+        moves = board.legal_moves  # Moves are generated one at a time, none after a cutoff.
+        if self.move_ordering is not None:
+            # All the moves are generated and sorted: the most promising ones first.
+            moves = self.move_ordering.order(board, moves, self.max_depth - depth,
+                                             self.transposition_table.best_move(key))
         if turn:  # Maximizing player
             value = -np.inf
-            for neighbor in neighbors:
-                value = max(value, self.__minmax_alpha_beta(neighbor, depth - 1, alpha, beta, False))
+            for move in moves:
+                move_value = self.__search_child(push_move(board, key, move), depth - 1, alpha, beta, True,
+                                                 best_move is None)
+                board.pop()  # Take the move back.
+                if best_move is None or move_value > value:
+                    value, best_move = move_value, move
                 alpha = max(alpha, value)  # Update alpha with the maximum value found so far.
                 if alpha >= beta:  # Alpha-Beta pruning: Stop evaluating if alpha is greater than or equal to beta.
                     self.prune_count += 1  # Count pruned branches.
+                    if self.move_ordering is not None:
+                        self.move_ordering.cutoff(board, move, self.max_depth - depth, depth)
                     break
-            return value
         else:  # Minimizing player
             value = np.inf
-            for neighbor in neighbors:
-                value = min(value, self.__minmax_alpha_beta(neighbor, depth - 1, alpha, beta, True))
+            for move in moves:
+                move_value = self.__search_child(push_move(board, key, move), depth - 1, alpha, beta, False,
+                                                 best_move is None)
+                board.pop()
+                if best_move is None or move_value < value:
+                    value, best_move = move_value, move
                 beta = min(beta, value)  # Update beta with the minimum value found so far.
                 if beta <= alpha:  # Alpha-Beta pruning: Stop evaluating if beta is less than or equal to alpha.
                     self.prune_count += 1  # Count pruned branches.
+                    if self.move_ordering is not None:
+                        self.move_ordering.cutoff(board, move, self.max_depth - depth, depth)
                     break
-            return value
+
+        # Store the value with the bound it has with respect to the window the node was searched with.
+        self.transposition_table.store(key, depth, value, bound_type(value, alpha_start, beta_start), best_move)
+        return value
 
     def search(self, state):
         """
@@ -115,11 +227,21 @@ class MinMaxAlphaBetaPruning:
 
         This method initializes the Minimax search with Alpha-Beta pruning to find the best next game state based on the
         current game state.
-        It evaluates the neighboring states, chooses the best move, and returns the resulting game state.
+        It evaluates the moves of the state on a copy of its board, chooses the best one, and returns the resulting
+        game state.
 
         :param state: The game state to search from.
         :return: Best next game state based on the Minimax algorithm with Alpha-Beta pruning.
         """
-        neighbors = self.game.neighbors(state)  # Generate possible successor states.
-        self.evaluate(neighbors, state.turn())  # Evaluate the neighboring states using Minimax.
-        return self.pick(neighbors, state.turn())  # Choose and return the best next game state.
+        self.transposition_table.new_search()  # Entries of the previous moves are replaced first.
+        if self.move_ordering is not None:
+            self.move_ordering.new_search()
+        representation = state.game_representation
+        self.cursor = StateChessGame(game_representation=ChessRepresentation(
+            game_board=representation.game_board.copy(), key=representation.key))
+        moves = list(representation.get_all_legal_moves())
+        values = self.evaluate(representation.key, moves, state.turn())  # Evaluate the moves using Minimax.
+        move, value = self.pick(moves, values, state.turn())  # Choose the best move.
+        best = self.game.child(state, move)  # Build and return the resulting game state.
+        best.h = value
+        return best
@@ -0,0 +1,95 @@
+import chess
+
+# The values of the pieces used to sort the captures, indexed by piece type (None, pawn, ..., king).
+PIECE_VALUES = (0, 1, 3, 3, 5, 9, 20)
+# The scores of the tiers of the ordering: the history scores of the quiet moves stay below KILLER_SCORE.
+TT_MOVE_SCORE = 3000000
+CAPTURE_SCORE = 2000000
+KILLER_SCORE = 1000000
+HISTORY_LIMIT = KILLER_SCORE - 1
+
+
+class MoveOrdering:
+    """
+    Sorts the moves of a node of an alpha-beta search so that the moves most likely to cause a cutoff come first.
+
+    The moves are searched in four tiers:
+    1. the best move stored in the transposition table for the position;
+    2. the captures and promotions, most valuable victim first and, among equal victims, least valuable attacker
+       first (MVV-LVA);
+    3. the killer moves of the ply, i.e. the last two quiet moves that caused a cutoff at the same distance from
+       the root;
+    4. the other quiet moves, by their history score, which grows with the depth of each cutoff they caused.
+    The sort is stable, so moves with the same score keep the order in which they were generated.
+
+    The searches call cutoff when a move causes a cutoff, and new_search at the start of each move of the game:
+    the killers are then forgotten and the history scores halved.
+
+    Attributes:
+        killers (list): For each ply, the last two quiet moves that caused a cutoff.
+        history (list): The history score of each (side to move, from square, to square).
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty MoveOrdering.
+        """
+        self.killers = []
+        self.history = [0] * (2 * 64 * 64)
+
+    def new_search(self):
+        """
+        Prepares the ordering for the search of a new move: the killers are forgotten and the history scores aged.
+        """
+        self.killers = []
+        self.history = [score >> 1 for score in self.history]
+
+    def order(self, board, moves, ply, tt_move=None):
+        """
+        Sorts the moves of a position.
+        :param board: The chess board of the position.
+        :param moves: The moves of the position to sort.
+        :param ply: The distance of the position from the root.
+        :param tt_move: The best move stored in the transposition table for the position, if any.
+        :return: A list of the moves, from the most to the least promising.
+        """
+        killers = self.killers[ply] if ply < len(self.killers) else ()
+        history = self.history
+        side = 4096 if board.turn else 0
+
+        def score(move):
+            if move == tt_move:
+                return TT_MOVE_SCORE
+            if move.promotion is not None or board.is_capture(move):
+                victim = chess.PAWN if board.is_en_passant(move) else board.piece_type_at(move.to_square)
+                attacker = board.piece_type_at(move.from_square)
+                # A promotion gains the promoted piece, in addition to the captured one if any.
+                gain = PIECE_VALUES[victim or 0] + PIECE_VALUES[move.promotion or 0]
+                return CAPTURE_SCORE + gain * 100 - PIECE_VALUES[attacker]
+            if move in killers:
+                return KILLER_SCORE + (1 if move == killers[0] else 0)
+            return history[side + move.from_square * 64 + move.to_square]
+
+        return sorted(moves, key=score, reverse=True)
+
+    def cutoff(self, board, move, ply, depth):
+        """
+        Records a move that caused a cutoff: quiet moves become killers of the ply and gain history score.
+
+        :param board: The chess board of the position where the move was played.
+        :param move: The move that caused the cutoff.
+        :param ply: The distance of the position from the root.
+        :param depth: The remaining depth of the search of the position.
+        """
+        if move.promotion is not None or board.is_capture(move):
+            return  # Captures and promotions are already sorted first by MVV-LVA.
+        while len(self.killers) <= ply:
+            self.killers.append([None, None])
+        killers = self.killers[ply]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        index = (4096 if board.turn else 0) + move.from_square * 64 + move.to_square
+        self.history[index] += depth * depth
+        if self.history[index] > HISTORY_LIMIT:
+            self.history = [score >> 1 for score in self.history]
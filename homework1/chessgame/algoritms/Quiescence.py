@@ -0,0 +1,154 @@
+import chess
+import numpy as np
+
+from algoritms.MoveOrdering import PIECE_VALUES as ORDER_VALUES
+
+# The material of the pieces in centipawns, the units of HardBoardEvaluationChessGame, indexed by piece type, used by
+# delta pruning.
+DELTA_PIECE_VALUES = (0, 100, 320, 330, 500, 900, 0)
+# The positional gain a capture may bring in addition to the captured material.
+DELTA_MARGIN = 200
+
+
+class Quiescence:
+    """
+    Implements a quiescence search, which extends the leaves of an alpha-beta search until the position is quiet.
+
+    Evaluating a position in the middle of an exchange misjudges it (horizon effect): the quiescence search only
+    plays the captures and promotions (and, optionally, the quiet checks of its first ply) until none is left.
+    - Stand pat: the side to move can decline all the captures, so the heuristic value of the position is a bound of
+      its value and may already cause a cutoff.
+    - Delta pruning: a capture is skipped when even winning the captured piece plus delta_margin can't bring the
+      value back to the window.
+    When the side to move is in check, there is no stand pat and all the evasions are searched.
+
+    The search uses the same white-positive convention as MinMaxAlphaBetaPruning: the maximizing player is white.
+
+    Attributes:
+        heuristic (function): Heuristic function used to evaluate the positions.
+        max_depth (int): Maximum number of plies of the extension.
+        checks (bool): Whether the quiet moves giving check are searched in the first ply of the extension.
+        piece_values (tuple): The material of each piece type in the units of the heuristic, for delta pruning.
+        delta_margin (float): The positional gain a capture may bring in addition to the captured material.
+        eval_count (int): Count of the positions searched by the extension.
+        delta_count (int): Count of the captures skipped by delta pruning.
+    """
+
+    def __init__(self, heuristic, max_depth=6, checks=False, piece_values=DELTA_PIECE_VALUES,
+                 delta_margin=DELTA_MARGIN):
+        """
+        Initializes the Quiescence search with a heuristic and its limits.
+
+        :param heuristic: Heuristic function used to evaluate the positions.
+        :param max_depth: Maximum number of plies of the extension. Defaults to 6.
+        :param checks: Whether the quiet checks are searched in the first ply of the extension. Defaults to False.
+        :param piece_values: The material of each piece type in the units of the heuristic. Defaults to the values
+                             of HardBoardEvaluationChessGame. None disables delta pruning.
+        :param delta_margin: The positional gain a capture may bring in addition to the captured material.
+        """
+        self.heuristic = heuristic
+        self.max_depth = max_depth
+        self.checks = checks
+        self.piece_values = piece_values
+        self.delta_margin = delta_margin
+        self.eval_count = 0
+        self.delta_count = 0
+
+    def search(self, state, alpha, beta, turn):
+        """
+        Searches the captures of a leaf of the main search.
+
+        :param state: The state wrapping the board of the main search, positioned on the leaf.
+        :param alpha: The alpha value of the leaf.
+        :param beta: The beta value of the leaf.
+        :param turn: Flag indicating if it's the maximizing player's turn.
+        :return: The value of the leaf once the position is quiet.
+        """
+        return self.__quiescence(state, self.max_depth, alpha, beta, turn)
+
+    def tactical_moves(self, board, checks):
+        """
+        Generates the moves searched by the extension, the most valuable captures first (MVV-LVA).
+
+        :param board: The chess board.
+        :param checks: Whether the quiet moves giving check are included.
+        :return: A list of the captures, the promotions and, if requested, the quiet checks.
+        """
+        moves = list(board.generate_legal_captures())
+        if checks:
+            quiet_moves = board.generate_legal_moves(to_mask=~board.occupied)
+            moves.extend(move for move in quiet_moves if move.promotion is not None or board.gives_check(move))
+        else:
+            # The quiet promotions: pawn pushes to the last rank.
+            moves.extend(board.generate_legal_moves(from_mask=board.pawns, to_mask=chess.BB_BACKRANKS & ~board.occupied))
+
+        def score(move):
+            victim = chess.PAWN if board.is_en_passant(move) else board.piece_type_at(move.to_square)
+            gain = ORDER_VALUES[victim or 0] + ORDER_VALUES[move.promotion or 0]
+            return gain * 100 - ORDER_VALUES[board.piece_type_at(move.from_square)]
+
+        return sorted(moves, key=score, reverse=True)
+
+    def __quiescence(self, state, depth, alpha, beta, turn):
+        """
+        Private method implementing the quiescence search with stand pat and delta pruning.
+
+        :param state: The state wrapping the board, positioned on the current node.
+        :param depth: The remaining plies of the extension.
+        :param alpha: The alpha value for Alpha-Beta pruning.
+        :param beta: The beta value for Alpha-Beta pruning.
+        :param turn: Flag indicating if it's the maximizing player's turn.
+        :return: The value of the position.
+        """
+        self.eval_count += 1
+        board = state.game_representation.game_board
+
+        if depth > 0 and board.is_check():
+            # In check there is no stand pat: the side to move must answer the check.
+            moves = list(board.legal_moves)
+            if not moves:
+                return self.heuristic.h(state)  # Checkmate.
+            stand_pat = None
+            value = -np.inf if turn else np.inf
+        else:
+            # Stand pat: the side to move can stop capturing, so the value of the position is at least (white) or
+            # at most (black) its heuristic value.
+            stand_pat = self.heuristic.h(state)
+            if depth == 0 or stand_pat in (np.inf, -np.inf):
+                return stand_pat
+            if turn:
+                if stand_pat >= beta:
+                    return stand_pat
+                alpha = max(alpha, stand_pat)
+            else:
+                if stand_pat <= alpha:
+                    return stand_pat
+                beta = min(beta, stand_pat)
+            value = stand_pat
+            moves = self.tactical_moves(board, self.checks and depth == self.max_depth)
+
+        for move in moves:
+            if stand_pat is not None and self.piece_values is not None and \
+                    (move.promotion is not None or board.is_capture(move)):
+                # Delta pruning: skip the capture if even its material gain can't reach the window.
+                victim = chess.PAWN if board.is_en_passant(move) else board.piece_type_at(move.to_square)
+                gain = self.piece_values[victim or 0] + self.delta_margin
+                if move.promotion is not None:
+                    gain += self.piece_values[move.promotion] - self.piece_values[chess.PAWN]
+                if (turn and stand_pat + gain <= alpha) or (not turn and stand_pat - gain >= beta):
+                    self.delta_count += 1
+                    continue
+            board.push(move)
+            move_value = self.__quiescence(state, depth - 1, alpha, beta, not turn)
+            board.pop()
+            if turn:
+                value = max(value, move_value)
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    break
+            else:
+                value = min(value, move_value)
+                beta = min(beta, value)
+                if beta <= alpha:
+                    break
+        return value
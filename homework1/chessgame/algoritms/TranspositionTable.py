@@ -0,0 +1,161 @@
+from collections import OrderedDict
+
+# The bound type of a stored value: exact, a lower bound (fail high) or an upper bound (fail low).
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# The replacement policies of the table.
+DEPTH_PREFERRED = "depth"
+LRU = "lru"
+
+
+def bound_type(value, alpha, beta):
+    """
+    Classifies the value returned by an alpha-beta search with the window (alpha, beta) it was searched with.
+    :param value: The value returned by the search.
+    :param alpha: The alpha value at the start of the search of the node.
+    :param beta: The beta value at the start of the search of the node.
+    :return: UPPER if the search failed low, LOWER if it failed high, EXACT otherwise.
+    """
+    if value <= alpha:
+        return UPPER
+    if value >= beta:
+        return LOWER
+    return EXACT
+
+
+class TranspositionTable:
+    """
+    Implements a bounded transposition table indexed by the Zobrist key of the positions.
+
+    Each entry is (key, depth, value, bound type, best move, generation); the bound type tells whether the value is
+    exact or a bound found with a narrower window, so that it is only reused when it decides the node. The table
+    holds at most size entries, with one of two replacement policies:
+    - DEPTH_PREFERRED: each key maps to a single slot. A new entry replaces the one in its slot if that entry
+      belongs to an older search (i.e. an earlier move of the game) or was searched to a depth not greater than the
+      new one; an entry of the same position is also replaced by an exact value.
+    - LRU: the entries are kept in the order they were last used, and the least recently used one is evicted when
+      the table is full. The entry of a position is replaced as with DEPTH_PREFERRED.
+
+    Attributes:
+        size (int): Maximum number of entries; rounded up to a power of two with DEPTH_PREFERRED.
+        policy (str): The replacement policy, DEPTH_PREFERRED or LRU.
+        entries (list or OrderedDict): The slots, None when empty (DEPTH_PREFERRED), or the entries by key (LRU).
+        generation (int): Number of the current search, incremented by new_search.
+        hits (int): Count of the lookups that returned a stored value.
+        misses (int): Count of the lookups of positions missing, stored too shallow or with a bound that doesn't
+                      decide the node.
+        evictions (int): Count of the entries replaced by the entry of another position.
+    """
+
+    def __init__(self, size=2 ** 20, policy=DEPTH_PREFERRED):
+        """
+        Initializes an empty transposition table.
+        :param size: Maximum number of entries. Defaults to 2^20.
+        :param policy: The replacement policy, DEPTH_PREFERRED or LRU. Defaults to DEPTH_PREFERRED.
+        """
+        if policy not in (DEPTH_PREFERRED, LRU):
+            raise ValueError(f"Unknown replacement policy: {policy}")
+        self.policy = policy
+        if policy == DEPTH_PREFERRED:
+            self.size = 1 << max(0, size - 1).bit_length()  # Round up to a power of two to index with a mask.
+            self.mask = self.size - 1
+            self.entries = [None] * self.size
+        else:
+            self.size = size
+            self.entries = OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def new_search(self):
+        """
+        Marks the start of a new search, so that the entries of the previous ones are replaced first.
+        """
+        self.generation += 1
+
+    def probe(self, key):
+        """
+        Looks up the entry of a position. With LRU, the entry becomes the most recently used.
+        :param key: The Zobrist key of the position.
+        :return: The entry (key, depth, value, bound type, best move, generation), None if not stored.
+        """
+        if self.policy == LRU:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+        entry = self.entries[key & self.mask]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def lookup(self, key, depth, alpha, beta):
+        """
+        Returns the stored value of a position if it decides the search of the node with the given window.
+        :param key: The Zobrist key of the position.
+        :param depth: The remaining depth of the search of the node.
+        :param alpha: The alpha value of the node.
+        :param beta: The beta value of the node.
+        :return: The stored value, None if the entry is missing, too shallow or its bound doesn't cause a cutoff.
+        """
+        entry = self.probe(key)
+        if entry is not None and entry[1] >= depth:
+            value, flag = entry[2], entry[3]
+            if flag == EXACT or (flag == LOWER and value >= beta) or (flag == UPPER and value <= alpha):
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def best_move(self, key):
+        """
+        Returns the best move stored for a position.
+        :param key: The Zobrist key of the position.
+        :return: The best move, None if the position is not stored or has no move (e.g. a leaf).
+        """
+        entry = self.probe(key)
+        return entry[4] if entry is not None else None
+
+    def store(self, key, depth, value, flag, move=None):
+        """
+        Stores the result of the search of a position, following the replacement policy.
+        :param key: The Zobrist key of the position.
+        :param depth: The remaining depth the position was searched with.
+        :param value: The value of the position.
+        :param flag: The bound type of the value (EXACT, LOWER or UPPER).
+        :param move: The best move found, None for a leaf.
+        """
+        if self.policy == LRU:
+            entries = self.entries
+            entry = entries.get(key)
+            if entry is not None:
+                entries.move_to_end(key)
+                # Keep a deeper result of the same search, unless the new value is exact.
+                if entry[5] == self.generation and entry[1] > depth and flag != EXACT:
+                    return
+            elif len(entries) >= self.size:
+                entries.popitem(last=False)  # Evict the least recently used entry.
+                self.evictions += 1
+            entries[key] = (key, depth, value, flag, move, self.generation)
+            return
+        index = key & self.mask
+        entry = self.entries[index]
+        if entry is None or entry[5] != self.generation or entry[1] <= depth or (entry[0] == key and flag == EXACT):
+            if entry is not None and entry[0] != key:
+                self.evictions += 1
+            self.entries[index] = (key, depth, value, flag, move, self.generation)
+
+    def stats(self):
+        """
+        Returns the counters of the table.
+        :return: A tuple (hits, misses, evictions).
+        """
+        return self.hits, self.misses, self.evictions
+
+    def __len__(self):
+        if self.policy == LRU:
+            return len(self.entries)
+        return sum(1 for entry in self.entries if entry is not None)
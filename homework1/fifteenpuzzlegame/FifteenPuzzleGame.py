@@ -1,5 +1,11 @@
 from StateFifteenPuzzleGame import StateFifteenPuzzleGame
 
+# The representation method that performs each move of the empty tile.
+MOVE_METHODS = {"UP": "move_up", "DOWN": "move_down", "LEFT": "move_left", "RIGHT": "move_right"}
+
+# The move that undoes each move of the empty tile.
+INVERSE_MOVES = {"UP": "DOWN", "DOWN": "UP", "LEFT": "RIGHT", "RIGHT": "LEFT"}
+
 
 class FifteenPuzzleGame:
     """
@@ -1,27 +1,102 @@
 import numpy as np
 
+from PuzzleGeometry import PuzzleGeometry, pack
+
+
+def count_inversions(game_board):
+    """
+    Counts the inversions of a game board in linear time with a bitset of the tiles already seen.
+
+    Scanning the board in order, the inversions of a tile are the tiles seen before it that are greater than it,
+    i.e. the set bits of the bitset above the tile's own bit. The empty tile (0) is ignored.
+    :param game_board: The game board as a sequence of tiles.
+    :return: The number of inversions in the game board.
+    """
+    seen = 0
+    inversions = 0
+    for tile in game_board:
+        if tile:
+            tile = int(tile)
+            inversions += bin(seen >> tile).count("1")
+            seen |= 1 << tile
+    return inversions
+
+
+def solvability_parity(game_board, cols=4):
+    """
+    Computes the parity that a move of the empty tile never changes.
+
+    A horizontal move doesn't change the order of the tiles, and a vertical one moves a tile over the cols - 1
+    others between its old and new cells. With an odd number of columns that never changes the parity of the
+    inversions. With an even number it flips it while the row of the empty tile changes by one, so the parity of
+    the inversions plus the row of the empty tile is invariant. A board can reach exactly the boards with the
+    same parity.
+    :param game_board: The game board as a sequence of tiles.
+    :param cols: The number of columns of the board.
+    :return: The invariant parity (0 or 1) of the game board.
+    """
+    inversions = count_inversions(game_board)
+    if cols % 2:
+        return inversions % 2
+    blank_row = list(game_board).index(0) // cols
+    return (inversions + blank_row) % 2
+
+
+def solvable_boards(boards, geometry=None):
+    """
+    Determines with a vectorized evaluation which game boards of an (N, cells) array are solvable.
+    :param boards: The game boards, one per row.
+    :param geometry: The geometry of the boards. Defaults to the square geometry with as many cells as a row.
+    :return: A boolean array with N entries, True where the board is solvable.
+    """
+    boards = np.asarray(boards)
+    if len(boards) == 0:
+        return np.zeros(0, dtype=bool)
+    if geometry is None:
+        geometry = PuzzleGeometry.of_board(boards[0])
+    inversions = np.zeros(len(boards), dtype=np.int64)
+    for i in range(geometry.cells - 1):
+        # The tiles after cell i that are smaller than it, ignoring the empty tile on either side.
+        tile = boards[:, i:i + 1]
+        inversions += np.sum((boards[:, i + 1:] < tile) & (boards[:, i + 1:] > 0), axis=1)
+    if geometry.cols % 2 == 0:
+        inversions += np.argmax(boards == 0, axis=1) // geometry.cols
+    return inversions % 2 == solvability_parity(geometry.end_game_board, geometry.cols)
+
 
 class FifteenPuzzleRepresentation:
     """
     Represents the game board of the Fifteen Puzzle game.
 
     This class provides methods to check if the game board is solvable and to count the number of inversions
-    in the current state of the game board.
+    in the current state of the game board. The board is 4x4 by default, but any size given by a PuzzleGeometry
+    is supported (e.g. 3x3 for the 8-puzzle and 5x5 for the 24-puzzle).
 
     Attributes:
-        end_game_board (tuple): The final configuration of the game board.
+        geometry (PuzzleGeometry): The dimensions of the game board and their precomputed move table.
         game_board (tuple): The current configuration of the game board.
+        blank (int): The index of the empty tile (0).
+        moved_tile (int): The tile moved to reach this configuration, None for an initial board.
+        packed (int): The game board packed as in PackedFifteenPuzzleRepresentation, computed on first access.
     """
 
-    def __init__(self, game_board=None):
+    __slots__ = ("geometry", "game_board", "blank", "moved_tile", "_packed")
+
+    def __init__(self, game_board=None, moved_tile=None, geometry=None):
         """
         Initializes the FifteenPuzzleRepresentation with a game board.
         :param game_board: The initial configuration of the game board.
-                           Defaults to a pre-defined configuration.
+                           Defaults to a pre-defined configuration on a 4x4 board, to the end game otherwise.
+        :param moved_tile: The tile moved to reach this configuration. Defaults to None.
+        :param geometry: The dimensions of the game board. Defaults to the square board with the cells of game_board.
         """
-        self.end_game_board = tuple(range(1, 16)) + (0,)
+        if geometry is None:
+            geometry = PuzzleGeometry.of() if game_board is None else PuzzleGeometry.of_board(game_board)
+        self.geometry = geometry
 
-        if game_board is None:
+        if game_board is None and geometry.cells != 16:
+            self.game_board = geometry.end_game_board
+        elif game_board is None:
             self.game_board = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 0, 15, 13, 14)
             # 1, 2, 3, 4, 5, 6, 7, 9, 8, 10, 11, 12, 14, 13, 0, 15 NOPE
             # 4, 2, 1, 3, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 0 NOPE
@@ -35,29 +110,45 @@ class FifteenPuzzleRepresentation:
         else:
             self.game_board = game_board
 
+        self.blank = self.game_board.index(0)
+        self.moved_tile = moved_tile
+        self._packed = None
+
     def game_is_solvable(self):
         """
         Determines if the current game board configuration is solvable.
-        A game board is solvable if the number of inversions is even.
+        On a board of even width the row of the empty tile matters as well as the inversions: the game board
+        is solvable if the parity of the inversions plus the row of the empty tile is the same as in the
+        end-game board. On a board of odd width only the parity of the inversions matters.
         :return: True if the game board is solvable, False otherwise.
         """
-        # Counts the number of inversions in the state.
-        inversions = self.count_inversions()
-        # If the number of inversions is even, the state is solvable.
-        return inversions % 2 == 0
+        cols = self.geometry.cols
+        return solvability_parity(self.game_board, cols) == solvability_parity(self.end_game_board, cols)
 
     def count_inversions(self):
         """
         Counts the number of inversions in the current state of the game board.
 
-        Inversions are pairs of tiles that are in the wrong order. For the game to be solvable,
-        the number of inversions must be even.
+        Inversions are pairs of tiles that are in the wrong order.
         :return: The number of inversions in the game board.
         """
-        state_array = np.array(self.game_board)
-        state_array = state_array[state_array > 0]
-        inversions = sum(np.sum(state_array[i + 1:] < state_array[i]) for i in range(len(state_array) - 1))
-        return inversions
+        return count_inversions(self.game_board)
+
+    @property
+    def packed(self):
+        """
+        The game board packed into an integer, computed on first access.
+        """
+        if self._packed is None:
+            self._packed = pack(self.game_board, self.geometry.tile_bits)
+        return self._packed
+
+    @property
+    def end_game_board(self):
+        """
+        The final configuration of the game board.
+        """
+        return self.geometry.end_game_board
 
     def is_end_game(self):
         """
@@ -66,6 +157,25 @@ class FifteenPuzzleRepresentation:
         """
         return self.game_board == self.end_game_board
 
+    def move(self, direction):
+        """
+        Attempts to move the empty tile (0) in the given direction and returns a new game representation.
+        :param direction: One of "UP", "DOWN", "LEFT" and "RIGHT".
+        :return: A new game representation if the move is possible; None otherwise.
+        """
+        swap = self.geometry.move_table[direction][self.blank]
+        if swap is None:
+            return None
+        target, target_shift, blank_shift = swap
+        new_board = list(self.game_board)
+        tile = new_board[target]
+        new_board[self.blank], new_board[target] = tile, 0
+        child = FifteenPuzzleRepresentation(game_board=tuple(new_board), moved_tile=tile, geometry=self.geometry)
+        if self._packed is not None:
+            # The packed board of the child is a shift/mask swap of the packed board of its parent.
+            child._packed = self._packed - (tile << target_shift) + (tile << blank_shift)
+        return child
+
     def move_up(self):
         """
         Attempts to move the empty tile (0) up and returns a new game representation.
@@ -74,15 +184,7 @@ class FifteenPuzzleRepresentation:
         the method returns None.
         :return: A new game representation if the move is possible; None otherwise.
         """
-        board = np.array(self.game_board).reshape(4, 4)
-        zero_row, zero_col = np.where(board == 0)  # Finds the position of the empty tile (0).
-        new_row, new_col = zero_row + -1, zero_col
-        if 0 <= new_row < 4 and 0 <= new_col < 4:
-            new_board = board.copy()
-            new_board[zero_row, zero_col], new_board[new_row, new_col] = new_board[new_row, new_col], new_board[
-                zero_row, zero_col]
-            return FifteenPuzzleRepresentation(game_board=tuple(new_board.flatten()))
-        return None
+        return self.move("UP")
 
     def move_down(self):
         """
@@ -92,15 +194,7 @@ class FifteenPuzzleRepresentation:
         the method returns None.
         :return: A new game representation if the move is possible; None otherwise.
         """
-        board = np.array(self.game_board).reshape(4, 4)
-        zero_row, zero_col = np.where(board == 0)  # Finds the position of the empty tile (0).
-        new_row, new_col = zero_row + 1, zero_col
-        if 0 <= new_row < 4 and 0 <= new_col < 4:
-            new_board = board.copy()
-            new_board[zero_row, zero_col], new_board[new_row, new_col] = new_board[new_row, new_col], new_board[
-                zero_row, zero_col]
-            return FifteenPuzzleRepresentation(game_board=tuple(new_board.flatten()))
-        return None
+        return self.move("DOWN")
 
     def move_left(self):
         """
@@ -110,38 +204,22 @@ class FifteenPuzzleRepresentation:
         the method returns None.
         :return: A new game representation if the move is possible; None otherwise.
         """
-        board = np.array(self.game_board).reshape(4, 4)
-        zero_row, zero_col = np.where(board == 0)  # Finds the position of the empty tile (0).
-        new_row, new_col = zero_row, zero_col + -1
-        if 0 <= new_row < 4 and 0 <= new_col < 4:
-            new_board = board.copy()
-            new_board[zero_row, zero_col], new_board[new_row, new_col] = new_board[new_row, new_col], new_board[
-                zero_row, zero_col]
-            return FifteenPuzzleRepresentation(game_board=tuple(new_board.flatten()))
-        return None
+        return self.move("LEFT")
 
     def move_right(self):
         """
         Attempts to move the empty tile (0) to the right and returns a new game representation.
 
-        If the move is not possible (i.e., the empty tile is already on the leftmost column),
+        If the move is not possible (i.e., the empty tile is already on the rightmost column),
         the method returns None.
         :return: A new game representation if the move is possible; None otherwise.
         """
-        board = np.array(self.game_board).reshape(4, 4)
-        zero_row, zero_col = np.where(board == 0)  # Finds the position of the empty tile (0).
-        new_row, new_col = zero_row, zero_col + 1
-        if 0 <= new_row < 4 and 0 <= new_col < 4:
-            new_board = board.copy()
-            new_board[zero_row, zero_col], new_board[new_row, new_col] = new_board[new_row, new_col], new_board[
-                zero_row, zero_col]
-            return FifteenPuzzleRepresentation(game_board=tuple(new_board.flatten()))
-        return None
+        return self.move("RIGHT")
 
     def __eq__(self, other):
         if not isinstance(other, FifteenPuzzleRepresentation):
             return False
-        return np.array_equal(self.game_board, other.game_board)
+        return self.game_board == other.game_board
 
     def __ne__(self, other):
         return not self.__eq__(other)
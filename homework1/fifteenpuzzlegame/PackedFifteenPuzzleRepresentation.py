@@ -0,0 +1,142 @@
+from FifteenPuzzleRepresentation import FifteenPuzzleRepresentation, count_inversions, solvability_parity
+from PuzzleGeometry import PuzzleGeometry, pack, unpack
+
+# The move table of the 4x4 board, for the searches that work directly on 4x4 boards.
+MOVE_TABLE = PuzzleGeometry.of().move_table
+
+
+class PackedFifteenPuzzleRepresentation:
+    """
+    Represents the game board of the Fifteen Puzzle game packed into a single integer.
+
+    Each tile takes 4 bits on a 4x4 board (a single 64-bit integer) and the position of the empty tile is cached,
+    so a move is a precomputed shift/mask swap and hashing and equality are integer operations. The tuple view of
+    the board is still available through game_board, so heuristics and print_board work unchanged. Other sizes
+    use the tile width and move table of their PuzzleGeometry (e.g. 5 bits per tile on the 24-puzzle).
+
+    Attributes:
+        geometry (PuzzleGeometry): The dimensions of the game board and their precomputed move table.
+        packed (int): The current configuration of the game board, geometry.tile_bits bits per tile.
+        blank (int): The index of the empty tile (0).
+        moved_tile (int): The tile moved to reach this configuration, None for an initial board.
+    """
+
+    __slots__ = ("geometry", "packed", "blank", "moved_tile", "_game_board")
+
+    def __init__(self, game_board=None, packed=None, blank=None, moved_tile=None, geometry=None):
+        """
+        Initializes the PackedFifteenPuzzleRepresentation from a game board or from an already packed board.
+        :param game_board: The initial configuration of the game board as a tuple.
+                           Defaults to the same pre-defined configuration as FifteenPuzzleRepresentation.
+        :param packed: The packed configuration of the game board. Takes precedence over game_board.
+        :param blank: The index of the empty tile in the packed board. Required together with packed.
+        :param moved_tile: The tile moved to reach this configuration. Defaults to None.
+        :param geometry: The dimensions of the game board. Defaults to the square board with the cells of game_board.
+        """
+        if geometry is None:
+            geometry = PuzzleGeometry.of() if game_board is None else PuzzleGeometry.of_board(game_board)
+        self.geometry = geometry
+        if packed is None:
+            if game_board is None:
+                game_board = FifteenPuzzleRepresentation(geometry=geometry).game_board
+            packed = pack(game_board, geometry.tile_bits)
+            blank = list(game_board).index(0)
+        self.packed = packed
+        self.blank = blank
+        self.moved_tile = moved_tile
+        self._game_board = None
+
+    @property
+    def game_board(self):
+        """
+        The tuple view of the game board, computed on first access.
+        """
+        if self._game_board is None:
+            self._game_board = unpack(self.packed, self.geometry.cells, self.geometry.tile_bits)
+        return self._game_board
+
+    @property
+    def end_game_board(self):
+        """
+        The final configuration of the game board.
+        """
+        return self.geometry.end_game_board
+
+    def game_is_solvable(self):
+        """
+        Determines if the current game board configuration is solvable.
+        :return: True if the game board is solvable, False otherwise.
+        """
+        cols = self.geometry.cols
+        return solvability_parity(self.game_board, cols) == solvability_parity(self.end_game_board, cols)
+
+    def count_inversions(self):
+        """
+        Counts the number of inversions in the current state of the game board.
+        :return: The number of inversions in the game board.
+        """
+        return count_inversions(self.game_board)
+
+    def is_end_game(self):
+        """
+        Determines if the current game board configuration matches the end-game configuration.
+        :return: True if the game board is in the end-game configuration, False otherwise.
+        """
+        return self.packed == self.geometry.end_game_packed
+
+    def move(self, direction):
+        """
+        Attempts to move the empty tile (0) in the given direction and returns a new game representation.
+        :param direction: One of "UP", "DOWN", "LEFT" and "RIGHT".
+        :return: A new game representation if the move is possible; None otherwise.
+        """
+        swap = self.geometry.move_table[direction][self.blank]
+        if swap is None:
+            return None
+        target, target_shift, blank_shift = swap
+        tile = (self.packed >> target_shift) & self.geometry.tile_mask
+        # The empty tile is stored as 0, so the swap only has to move the tile bits into the blank cell.
+        packed = self.packed - (tile << target_shift) + (tile << blank_shift)
+        return PackedFifteenPuzzleRepresentation(packed=packed, blank=target, moved_tile=tile, geometry=self.geometry)
+
+    def move_up(self):
+        """
+        Attempts to move the empty tile (0) up and returns a new game representation.
+        :return: A new game representation if the move is possible; None otherwise.
+        """
+        return self.move("UP")
+
+    def move_down(self):
+        """
+        Attempts to move the empty tile (0) down and returns a new game representation.
+        :return: A new game representation if the move is possible; None otherwise.
+        """
+        return self.move("DOWN")
+
+    def move_left(self):
+        """
+        Attempts to move the empty tile (0) to the left and returns a new game representation.
+        :return: A new game representation if the move is possible; None otherwise.
+        """
+        return self.move("LEFT")
+
+    def move_right(self):
+        """
+        Attempts to move the empty tile (0) to the right and returns a new game representation.
+        :return: A new game representation if the move is possible; None otherwise.
+        """
+        return self.move("RIGHT")
+
+    def __eq__(self, other):
+        if not isinstance(other, PackedFifteenPuzzleRepresentation):
+            return False
+        return self.packed == other.packed
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.packed)
+
+    def __str__(self):
+        return str(self.game_board)
@@ -0,0 +1,122 @@
+# For each direction of the empty tile, the offset of the cell it swaps with.
+MOVE_OFFSETS = {"UP": (-1, 0), "DOWN": (1, 0), "LEFT": (0, -1), "RIGHT": (0, 1)}
+
+
+def pack(game_board, tile_bits=4):
+    """
+    Packs a game board into a single integer, tile_bits bits per tile (cell i uses the bits from tile_bits * i).
+    :param game_board: The game board as a tuple.
+    :param tile_bits: The number of bits of each tile.
+    :return: The packed game board.
+    """
+    packed = 0
+    for i, tile in enumerate(game_board):
+        packed |= int(tile) << (tile_bits * i)  # NumPy integers would overflow past 64 bits.
+    return packed
+
+
+def unpack(packed, cells=16, tile_bits=4):
+    """
+    Unpacks an integer produced by pack back into a game board.
+    :param packed: The packed game board.
+    :param cells: The number of cells of the game board.
+    :param tile_bits: The number of bits of each tile.
+    :return: The game board as a tuple.
+    """
+    mask = (1 << tile_bits) - 1
+    return tuple((packed >> (tile_bits * i)) & mask for i in range(cells))
+
+
+class PuzzleGeometry:
+    """
+    Represents the dimensions of a sliding puzzle board and the tables that only depend on them.
+
+    The geometry of each size is built once by of() and shared by all the boards of that size, so the moves
+    of any size are precomputed table lookups, as on the original 4x4 board.
+
+    Attributes:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        cells (int): The number of cells of the board.
+        end_game_board (tuple): The final configuration: the tiles in order and the empty tile in the last cell.
+        tile_bits (int): The number of bits of a tile in a packed board.
+        tile_mask (int): The mask of the bits of a tile in a packed board.
+        end_game_packed (int): The packed final configuration.
+        move_table (dict): move_table[direction][blank] is None when the move is not possible, otherwise the tuple
+                           (target cell, bit shift of the target cell, bit shift of the blank cell).
+    """
+
+    # The geometry of each size, built on first use.
+    instances = {}
+
+    def __init__(self, rows, cols):
+        """
+        Initializes the PuzzleGeometry of a board. Use of() to share the geometry of each size.
+        :param rows: The number of rows of the board.
+        :param cols: The number of columns of the board.
+        """
+        if rows < 2 or cols < 2:
+            raise ValueError(f"A sliding puzzle needs at least 2 rows and 2 columns, not {rows}x{cols}")
+        self.rows = rows
+        self.cols = cols
+        self.cells = rows * cols
+        self.end_game_board = tuple(range(1, self.cells)) + (0,)
+        self.tile_bits = (self.cells - 1).bit_length()
+        self.tile_mask = (1 << self.tile_bits) - 1
+        self.end_game_packed = pack(self.end_game_board, self.tile_bits)
+        self.move_table = self.__build_move_table()
+
+    @classmethod
+    def of(cls, rows=4, cols=None):
+        """
+        Returns the shared geometry of a size, building it on first use.
+        :param rows: The number of rows of the board.
+        :param cols: The number of columns of the board. Defaults to rows.
+        :return: The geometry of the size.
+        """
+        if cols is None:
+            cols = rows
+        key = (rows, cols)
+        if key not in cls.instances:
+            cls.instances[key] = cls(rows, cols)
+        return cls.instances[key]
+
+    @classmethod
+    def of_board(cls, game_board):
+        """
+        Returns the geometry of a square board from its number of cells.
+        :param game_board: The game board as a sequence of tiles.
+        :return: The geometry of the board.
+        """
+        side = int(round(len(game_board) ** 0.5))
+        if side * side != len(game_board):
+            raise ValueError(f"A board of {len(game_board)} cells is not square, its geometry must be given")
+        return cls.of(side, side)
+
+    def __build_move_table(self):
+        """
+        Precomputes the swaps of every move from every position of the empty tile.
+        :return: The move table.
+        """
+        table = {}
+        for direction, (row_offset, col_offset) in MOVE_OFFSETS.items():
+            table[direction] = []
+            for blank in range(self.cells):
+                row, col = blank // self.cols + row_offset, blank % self.cols + col_offset
+                if 0 <= row < self.rows and 0 <= col < self.cols:
+                    target = row * self.cols + col
+                    table[direction].append((target, self.tile_bits * target, self.tile_bits * blank))
+                else:
+                    table[direction].append(None)
+        return table
+
+    def position(self, index):
+        """
+        Converts a cell index to its (row, column) position.
+        :param index: The index of the cell.
+        :return: The row and the column of the cell.
+        """
+        return divmod(index, self.cols)
+
+    def __repr__(self):
+        return f"PuzzleGeometry({self.rows}, {self.cols})"
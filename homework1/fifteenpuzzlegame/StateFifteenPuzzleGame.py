@@ -17,6 +17,8 @@ class StateFifteenPuzzleGame:
         f (float): The estimated cost of the cheapest solution through the current state.
     """
 
+    __slots__ = ("game_representation", "state_parent", "move", "h", "g", "f")
+
     def __init__(self, game_representation=None, state_parent=None, move=None):
         """
         Initializes the StateFifteenPuzzleGame with a game representation, parent state, and move.
@@ -45,16 +47,17 @@ class StateFifteenPuzzleGame:
         """
         Returns a console representation of the game board of the current state.
         """
-        for i in range(4):
-            for j in range(4):
-                print(self.game_representation.game_board[i * 4 + j], end="\t")
+        geometry = self.game_representation.geometry
+        for i in range(geometry.rows):
+            for j in range(geometry.cols):
+                print(self.game_representation.game_board[i * geometry.cols + j], end="\t")
             print()
         print()
 
     def __eq__(self, other):
         if not isinstance(other, StateFifteenPuzzleGame):
             return False
-        return self.game_representation.game_board == other.game_representation.game_board
+        return self.game_representation == other.game_representation
 
     def __ne__(self, other):
         return not self.__eq__(other)
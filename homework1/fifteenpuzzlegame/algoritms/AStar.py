@@ -1,3 +1,11 @@
+import time
+
+from FifteenPuzzleGame import MOVE_METHODS
+from StateFifteenPuzzleGame import StateFifteenPuzzleGame
+from algoritms.ClosedSet import ClosedSet
+from algoritms.Horizon import Horizon
+
+
 class AStar:
     """
     Represents the A* Search algorithm
@@ -7,23 +15,31 @@ class AStar:
     the sum of the actual cost to reach the state (g value) and the estimated cost
     from the state to the goal (h value).
 
+    The states in the horizon don't keep their parent: the path to the end-game state is rebuilt from the
+    moves stored in the explored set, so the memory of a node doesn't include a chain of parent states.
+
     Attributes:
         heuristic: The heuristic used to estimate the cost from a given state to the goal state.
         game: The Fifteen Puzzle game.
-        horizon (set): The set of states that are on the boundary of the explored space.
-        explored (set): The set of states that have already been explored.
+        horizon (Horizon): The priority queue of states that are on the boundary of the explored space.
+        explored (ClosedSet): The boards that have already been explored, with their cost and last move only.
+        root (StateFifteenPuzzleGame): The state from which the search started.
+        telemetry (SearchTelemetry): The collector of the search counters, None to disable the instrumentation.
     """
 
-    def __init__(self, game, heuristic):
+    def __init__(self, game, heuristic, telemetry=None):
         """
         Initializes the AStarOp search with a game and heuristic.
         :param game: The Fifteen Puzzle game.
         :param heuristic: The heuristic used to estimate the cost from a state to the goal state.
+        :param telemetry: The collector of the search counters. Defaults to no instrumentation.
         """
         self.heuristic = heuristic
         self.game = game
-        self.horizon = set()  # A set to store the frontier nodes yet to be explored.
-        self.explored = set()  # A set to keep track of already explored nodes.
+        self.horizon = Horizon(lambda state: state.f)  # A priority queue of the frontier nodes yet to be explored.
+        self.explored = ClosedSet()  # A compact set to keep track of already explored nodes.
+        self.root = None
+        self.telemetry = telemetry
 
     def evaluate(self, state):
         """
@@ -43,40 +59,118 @@ class AStar:
 
             state.f = state.g + state.h
 
+    def evaluate_all(self, states):
+        """
+        Computes the g, h and f values of several states.
+
+        If the heuristic provides h_batch, all the states are scored with a single call.
+        :param states: The states for which the costs need to be computed.
+        """
+        if not hasattr(self.heuristic, "h_batch"):
+            for state in states:
+                self.evaluate(state)
+            return
+
+        states = [state for state in states if state.g is None]
+        if not states:
+            return
+        for state, h in zip(states, self.heuristic.h_batch(states)):
+            state.g = 0 if state.state_parent is None else state.state_parent.g + 1  # fixed cost set to 1
+            state.h = h
+            state.f = state.g + state.h
+
     def pick(self):
         """
         Selects the state with the lowest combined cost (f value) from the horizon.
         :return: The state with the lowest combined cost (f value).
         """
-        return min(self.horizon, key=lambda state: state.f)
+        return self.horizon.pick()
 
     def search(self, state):
         """
         Expands the search from the given state by exploring its neighbors.
 
         The method evaluates neighboring states of the given state, calculates their costs,
-        and adds them to the search horizon if they haven't been explored before. It also updates the
-        set of explored states.
+        and adds them to the search horizon if they haven't been explored before. A neighbor already in the horizon
+        replaces the stored one when it is reached with a lower cost. It also updates the set of explored states.
         :param state: The state from which the search should be expanded.
         """
+        try:
+            return self.__expand(state)
+        except BaseException:
+            # A search interrupted by an exception (e.g. a timeout) still closes its trace file.
+            if self.telemetry is not None:
+                self.telemetry.close()
+            raise
+
+    def __expand(self, state):
+        """
+        Private method implementing an expansion of the search.
+        :param state: The state from which the search should be expanded.
+        :return: The state returned by search.
+        """
         if state not in self.horizon:
             self.evaluate(state)
             self.horizon.add(state)
+        if self.root is None:
+            self.root = state
 
         self.explored.add(state)
 
-        neighbors = self.game.neighbors(state)
+        telemetry = self.telemetry
+        if telemetry is not None:
+            start_time = time.perf_counter()
+        successors = self.game.neighbors(state)
+        neighbors = [neighbor for neighbor in successors if neighbor not in self.explored]
+        if telemetry is not None:
+            successor_time = time.perf_counter()
+        self.evaluate_all(neighbors)
+        if telemetry is not None:
+            heuristic_time = time.perf_counter() - successor_time
+            successor_time -= start_time
+            duplicates = len(successors) - len(neighbors)
 
         for neighbor in neighbors:
-            if neighbor not in self.horizon and neighbor not in self.explored:
-                self.evaluate(neighbor)
-                if neighbor.is_end_game():
-                    return neighbor
-                self.horizon.add(neighbor)
+            if neighbor in self.horizon:
+                # Decrease-key: keep the cheapest known path to this board.
+                if neighbor.g < self.horizon.get(neighbor).g:
+                    self.horizon.replace(neighbor)
+                    neighbor.state_parent = None
+                elif telemetry is not None:
+                    duplicates += 1
+                continue
+            if neighbor.is_end_game():
+                neighbor = self.rebuild_path(neighbor)
+                if telemetry is not None:
+                    telemetry.expanded(state, len(successors), duplicates, len(self.horizon), successor_time,
+                                       heuristic_time)
+                    telemetry.finished(neighbor)
+                return neighbor
+            self.horizon.add(neighbor)
+            neighbor.state_parent = None  # The explored set keeps the move to the parent.
 
         self.horizon.remove(state)
 
+        if telemetry is not None:
+            telemetry.expanded(state, len(successors), duplicates, len(self.horizon), successor_time, heuristic_time)
+            if len(self.horizon) == 0:
+                telemetry.finished(None)
+
         if len(self.horizon) > 0:
             return self.pick()
         else:
             return None
+
+    def rebuild_path(self, state):
+        """
+        Replays the moves stored in the explored set from the root, linking the new states through state_parent.
+        :param state: A state whose parent has been explored, e.g. the end-game state.
+        :return: A copy of the given state, linked through state_parent to the root along the path found.
+        """
+        path = self.explored.path(state)
+        state = self.root
+        for move in path:
+            representation = getattr(state.game_representation, MOVE_METHODS[move])()
+            state = StateFifteenPuzzleGame(game_representation=representation, state_parent=state, move=move)
+            self.evaluate(state)
+        return state
@@ -0,0 +1,214 @@
+import time
+
+from algoritms.Horizon import Horizon
+
+
+class AnytimeAStar:
+    """
+    Represents the Anytime Repairing A* (ARA*) Search algorithm
+
+    This class runs a sequence of weighted A* searches, ordered by g + weight * h, with a weight that decreases
+    down to 1. The first search, with the highest weight, behaves almost like BestFirst and finds a solution
+    quickly; each following one improves it while reusing the work already done: the reached states keep their
+    cost, and the states whose cost decreased after they were expanded are only re-expanded once per search
+    (they wait in the inconsistent list until the weight is lowered). With a consistent heuristic the cost of
+    each solution is at most bound times the optimal one, where bound is the minimum between the weight and
+    the cost of the solution divided by the lowest g + h of the states still to be expanded.
+
+    The refinement stops when the time budget runs out or the solution is proven optimal (bound = 1). The first
+    solution is always completed, even past the budget, so the search only returns None on unsolvable boards.
+
+    Attributes:
+        heuristic: The heuristic used to estimate the cost from a given state to the goal state.
+        game: The Fifteen Puzzle game.
+        time_budget (float): The seconds after which the refinement of the solution stops, None for no limit.
+        initial_weight (float): The weight of the heuristic in the first search.
+        weight_step (float): The decrease of the weight between two searches.
+        weight (float): The weight of the heuristic in the current search.
+        bound (float): The current bound on the ratio between the cost of the solution and the optimal cost.
+        horizon (Horizon): The priority queue of the states to expand in the current search.
+        explored (set): The states expanded in the current search.
+        inconsistent (dict): The states whose cost decreased after they were expanded in the current search.
+        reached (dict): A mapping from each reached state to its cheapest copy.
+        solution (StateFifteenPuzzleGame): The cheapest end-game state found so far.
+        expansions (int): The number of expanded states over all searches.
+        solutions (list): For each completed search, a dictionary with its weight, solution cost, bound, time and
+                          expansions.
+        telemetry (SearchTelemetry): The collector of the search counters, None to disable the instrumentation.
+    """
+
+    def __init__(self, game, heuristic, time_budget=1.0, initial_weight=3.0, weight_step=0.5, telemetry=None):
+        """
+        Initializes the AnytimeAStar search with a game and heuristic.
+        :param game: The Fifteen Puzzle game.
+        :param heuristic: The heuristic used to estimate the cost from a state to the goal state.
+        :param time_budget: The seconds after which the refinement of the solution stops. None for no limit.
+        :param initial_weight: The weight of the heuristic in the first search.
+        :param weight_step: The decrease of the weight between two searches.
+        :param telemetry: The collector of the search counters. Defaults to no instrumentation.
+        """
+        if initial_weight < 1:
+            raise ValueError(f"The weight of the heuristic must be at least 1, not {initial_weight}")
+        self.heuristic = heuristic
+        self.game = game
+        self.time_budget = time_budget
+        self.initial_weight = initial_weight
+        self.weight_step = weight_step
+        self.weight = initial_weight
+        self.bound = float("inf")
+        self.horizon = Horizon(self.priority)
+        self.explored = set()
+        self.inconsistent = {}
+        self.reached = {}
+        self.solution = None
+        self.expansions = 0
+        self.solutions = []
+        self.telemetry = telemetry
+
+    def priority(self, state):
+        """
+        Computes the priority of a state in the horizon of the current search.
+        :param state: The state in the horizon.
+        :return: The inflated cost g + weight * h.
+        """
+        return state.g + self.weight * state.h
+
+    def evaluate_all(self, states):
+        """
+        Computes the g, h and f values of several states, with a single call if the heuristic provides h_batch.
+        The f value stays the unweighted g + h, the weight is only applied by priority.
+        :param states: The states for which the costs need to be computed.
+        """
+        values = self.heuristic.h_batch(states) if states and hasattr(self.heuristic, "h_batch") else None
+        for i, state in enumerate(states):
+            state.g = 0 if state.state_parent is None else state.state_parent.g + 1  # fixed cost set to 1
+            state.h = self.heuristic.h(state) if values is None else values[i]
+            state.f = state.g + state.h
+
+    def search(self, state):
+        """
+        Solves the puzzle from the given state with ARA*.
+
+        Like IDAStar, a single call runs the whole search: the returned state is the end-game state, linked through
+        state_parent to the given state along the best solution found within the time budget.
+        :param state: The state from which the search starts.
+        :return: The end-game state if a solution exists; None otherwise.
+        """
+        start_time = time.perf_counter()
+        deadline = start_time + self.time_budget if self.time_budget is not None else float("inf")
+        try:
+            self.evaluate_all([state])
+            self.reached[state] = state
+            self.horizon.add(state)
+            if state.is_end_game():
+                self.solution = state
+
+            while True:
+                if not self.__improve_path(deadline if self.solution is not None else float("inf")):
+                    break  # Out of time: the current search was interrupted.
+                if self.solution is None:
+                    break  # The horizon emptied without reaching the end game.
+                self.__update_bound(self.weight)
+                self.solutions.append({
+                    "weight": self.weight,
+                    "cost": self.solution.g,
+                    "bound": self.bound,
+                    "time": time.perf_counter() - start_time,
+                    "expansions": self.expansions,
+                })
+                if self.telemetry is not None:
+                    self.telemetry.emit("solution", **self.solutions[-1])
+                if self.bound <= 1 or time.perf_counter() >= deadline:
+                    break
+                self.weight = max(1.0, min(self.weight - self.weight_step, self.bound))
+                self.__restart()
+
+            if self.solution is not None:
+                self.__update_bound(self.bound)  # An interrupted search doesn't prove its weight.
+            if self.telemetry is not None:
+                self.telemetry.finished(self.solution)
+        finally:
+            # Also closes the trace file of a search interrupted by an exception (e.g. a timeout).
+            if self.telemetry is not None:
+                self.telemetry.close()
+        return self.solution
+
+    def __improve_path(self, deadline):
+        """
+        Expands the states of the horizon until none can lead to a solution cheaper than the current one.
+        :param deadline: The time at which the search is interrupted.
+        :return: True if the search completed; False if it was interrupted by the deadline.
+        """
+        horizon = self.horizon
+        telemetry = self.telemetry
+        while len(horizon) > 0:
+            current = horizon.pick()
+            if self.solution is not None and self.solution.g <= self.priority(current):
+                return True
+            if time.perf_counter() >= deadline:
+                return False
+            horizon.pop()
+            self.explored.add(current)
+            self.expansions += 1
+
+            if telemetry is not None:
+                start_time = time.perf_counter()
+            successors = self.game.neighbors(current)
+            neighbors = []
+            for neighbor in successors:
+                known = self.reached.get(neighbor)
+                if known is None or current.g + 1 < known.g:
+                    neighbors.append(neighbor)
+            if telemetry is not None:
+                successor_time = time.perf_counter()
+            self.evaluate_all(neighbors)
+            if telemetry is not None:
+                heuristic_time = time.perf_counter() - successor_time
+                successor_time -= start_time
+
+            for neighbor in neighbors:
+                self.reached[neighbor] = neighbor
+                if neighbor.is_end_game():
+                    if self.solution is None or neighbor.g < self.solution.g:
+                        self.solution = neighbor
+                if neighbor in self.explored:
+                    self.inconsistent[neighbor] = neighbor
+                elif neighbor in horizon:
+                    horizon.replace(neighbor)
+                else:
+                    horizon.add(neighbor)
+
+            if telemetry is not None:
+                telemetry.expanded(current, len(successors), len(successors) - len(neighbors), len(horizon),
+                                   successor_time, heuristic_time)
+        return True
+
+    def __restart(self):
+        """
+        Starts a new search with the current weight: the inconsistent states join the horizon, which is reordered
+        with the new priorities, and the explored set is emptied.
+        """
+        horizon = Horizon(self.priority)
+        for state in self.horizon:
+            horizon.add(state)
+        for state in self.inconsistent.values():
+            if state not in horizon:
+                horizon.add(state)
+        self.horizon = horizon
+        self.inconsistent = {}
+        self.explored = set()
+
+    def __update_bound(self, limit):
+        """
+        Computes the suboptimality bound of the current solution from the states that are still to be expanded.
+        :param limit: The bound already proven, i.e. the weight of the last completed search.
+        """
+        if self.solution is None:
+            self.bound = float("inf")
+            return
+        lowest = min((state.f for state in self.horizon), default=float("inf"))
+        lowest = min(lowest, min((state.f for state in self.inconsistent.values()), default=float("inf")))
+        if lowest >= self.solution.g:
+            self.bound = 1.0
+        else:
+            self.bound = min(limit, self.solution.g / lowest) if lowest > 0 else limit
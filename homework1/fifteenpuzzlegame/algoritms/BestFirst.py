@@ -1,3 +1,6 @@
+import time
+
+from algoritms.Horizon import Horizon
 from homework1.fifteenpuzzlegame import StateFifteenPuzzleGame
 
 
@@ -11,29 +14,41 @@ class BestFirst:
     Attributes:
         heuristic: The heuristic used to estimate the cost from a given state to the goal state.
         game: The Fifteen Puzzle game.
-        horizon (set): The set of states that are on the boundary of the explored space.
+        horizon (Horizon): The priority queue of states that are on the boundary of the explored space.
         explored (set): The set of states that have already been explored.
+        telemetry (SearchTelemetry): The collector of the search counters, None to disable the instrumentation.
     """
 
-    def __init__(self, game, heuristic):
+    def __init__(self, game, heuristic, telemetry=None):
         """
         Initializes the BestFirst search with a game and heuristic.
         :param game: The Fifteen Puzzle game.
         :param heuristic: The heuristic used to estimate the cost from a state to the goal state.
+        :param telemetry: The collector of the search counters. Defaults to no instrumentation.
         """
         self.heuristic = heuristic
         self.game = game
-        self.horizon = set()
+        self.horizon = Horizon(lambda state: state.f)
         self.explored = set()
+        self.telemetry = telemetry
 
     def f_value(self, states):
         """
         Computes the heuristic value for a given set of states.
+
+        If the heuristic provides h_batch, all the states are scored with a single call.
         :param states: A set of states for which the heuristic values need to be computed.
         """
-        for state in states:
-            if state.f is None:
-                state.f = self.heuristic.h(state)
+        states = [state for state in states if state.f is None]
+        if not states:
+            return
+        if hasattr(self.heuristic, "h_batch"):
+            values = self.heuristic.h_batch(states)
+        else:
+            values = [self.heuristic.h(state) for state in states]
+        for state, value in zip(states, values):
+            state.f = value
+            state.h = value
 
     def evaluate(self, state: StateFifteenPuzzleGame):
         """
@@ -50,7 +65,7 @@ class BestFirst:
         Selects the state with the lowest heuristic value from the horizon.
         :return: The state with the lowest heuristic value.
         """
-        return min(self.horizon, key=lambda state: state.f)
+        return self.horizon.pick()
 
     def search(self, state):
         """
@@ -58,23 +73,56 @@ class BestFirst:
         :param state: The state from which the search should be expanded.
         :return: The state with the lowest heuristic value. None otherwise.
         """
+        try:
+            return self.__expand(state)
+        except BaseException:
+            # A search interrupted by an exception (e.g. a timeout) still closes its trace file.
+            if self.telemetry is not None:
+                self.telemetry.close()
+            raise
+
+    def __expand(self, state):
+        """
+        Private method implementing an expansion of the search.
+        :param state: The state from which the search should be expanded.
+        :return: The state returned by search.
+        """
         if state not in self.horizon:
             self.evaluate(state)
             self.horizon.add(state)
 
         self.explored.add(state)
 
-        neighbors = self.game.neighbors(state)
+        telemetry = self.telemetry
+        if telemetry is not None:
+            start_time = time.perf_counter()
+        successors = self.game.neighbors(state)
+        neighbors = [neighbor for neighbor in successors
+                     if neighbor not in self.horizon and neighbor not in self.explored]
+        if telemetry is not None:
+            successor_time = time.perf_counter()
+        self.f_value(neighbors)
+        if telemetry is not None:
+            heuristic_time = time.perf_counter() - successor_time
+            successor_time -= start_time
 
         for neighbor in neighbors:
-            if neighbor not in self.horizon and neighbor not in self.explored:
-                self.evaluate(neighbor)
-                if neighbor.is_end_game():
-                    return neighbor
-                self.horizon.add(neighbor)
+            if neighbor.is_end_game():
+                if telemetry is not None:
+                    telemetry.expanded(state, len(successors), len(successors) - len(neighbors), len(self.horizon),
+                                       successor_time, heuristic_time)
+                    telemetry.finished(neighbor)
+                return neighbor
+            self.horizon.add(neighbor)
 
         self.horizon.remove(state)
 
+        if telemetry is not None:
+            telemetry.expanded(state, len(successors), len(successors) - len(neighbors), len(self.horizon),
+                               successor_time, heuristic_time)
+            if len(self.horizon) == 0:
+                telemetry.finished(None)
+
         if len(self.horizon) > 0:
             return self.pick()
         else:
@@ -0,0 +1,157 @@
+from FifteenPuzzleGame import INVERSE_MOVES, MOVE_METHODS
+from StateFifteenPuzzleGame import StateFifteenPuzzleGame
+from algoritms.Horizon import Horizon
+from heuristics.LinearConflictPuzzleGame import LinearConflictPuzzleGame
+from heuristics.ManhattanDistancePuzzleGame import ManhattanDistancePuzzleGame
+from heuristics.PatternDatabasePuzzleGame import PatternDatabasePuzzleGame
+
+# Indexes of the two searches in the horizon, explored and reached pairs.
+FORWARD = 0
+BACKWARD = 1
+
+
+class BidirectionalAStar:
+    """
+    Represents the front-to-end Bidirectional A* Search algorithm
+
+    This class runs two A* searches at the same time: a forward one from the start board towards the end-game
+    board and a backward one from the end-game board towards the start board. At each step the search with the
+    smaller horizon expands its best state. Every generated state is looked up among the states reached by the
+    other search, and the cheapest meeting found so far bounds the solution cost. The search stops when the
+    lowest f value of either horizon is not lower than that bound, which keeps the solution optimal as long as
+    both heuristics are consistent (e.g. Manhattan distance, linear conflict, walking distance).
+
+    Attributes:
+        heuristic: The heuristic used to estimate the cost from a given state to the end-game state.
+        backward_heuristic: The heuristic used to estimate the cost from a given state to the start state. If None,
+                            it is built for each search with the start game board as goal (see __backward_heuristic).
+        game: The Fifteen Puzzle game.
+        horizon (tuple): The forward and backward priority queues of states on the boundary of the explored space.
+        explored (tuple): The forward and backward sets of states that have already been explored.
+        reached (tuple): The forward and backward dictionaries from each reached state to its cheapest copy.
+        meeting_cost (float): The cost of the cheapest path found through a state reached by both searches.
+    """
+
+    def __init__(self, game, heuristic, backward_heuristic=None):
+        """
+        Initializes the BidirectionalAStar search with a game and heuristics.
+        :param game: The Fifteen Puzzle game.
+        :param heuristic: The heuristic used to estimate the cost from a state to the end-game state.
+        :param backward_heuristic: The heuristic used to estimate the cost from a state to the start state.
+        """
+        self.heuristic = heuristic
+        self.backward_heuristic = backward_heuristic
+        self.game = game
+        self.horizon = (Horizon(lambda state: state.f), Horizon(lambda state: state.f))
+        self.explored = (set(), set())
+        self.reached = ({}, {})
+        self.meeting_cost = float("inf")
+
+    def search(self, state):
+        """
+        Solves the puzzle from the given state with a bidirectional A* search.
+
+        Like IDAStar, a single call runs the whole search: the returned state is the end-game state, linked through
+        state_parent to the given state along the solution path.
+        :param state: The state from which the search starts.
+        :return: The end-game state if a solution exists; None otherwise.
+        """
+        representation = state.game_representation
+        goal = StateFifteenPuzzleGame(game_representation=type(representation)(
+            game_board=representation.end_game_board, geometry=representation.geometry))
+        backward_heuristic = self.backward_heuristic
+        if backward_heuristic is None:
+            backward_heuristic = self.__backward_heuristic(representation)
+        heuristics = (self.heuristic, backward_heuristic)
+
+        for direction, root in ((FORWARD, state), (BACKWARD, goal)):
+            root.g = 0
+            root.h = heuristics[direction].h(root)
+            root.f = root.h
+            self.horizon[direction].add(root)
+            self.reached[direction][root] = root
+        if state == goal:
+            return state
+
+        meeting = None
+        while len(self.horizon[FORWARD]) > 0 and len(self.horizon[BACKWARD]) > 0:
+            if max(self.horizon[FORWARD].pick().f, self.horizon[BACKWARD].pick().f) >= self.meeting_cost:
+                break
+
+            direction = FORWARD if len(self.horizon[FORWARD]) <= len(self.horizon[BACKWARD]) else BACKWARD
+            other = BACKWARD - direction
+            current = self.horizon[direction].pop()
+            self.explored[direction].add(current)
+
+            neighbors = [neighbor for neighbor in self.game.neighbors(current)
+                         if neighbor not in self.explored[direction]]
+            self.__evaluate_all(neighbors, heuristics[direction])
+            for neighbor in neighbors:
+                known = self.reached[direction].get(neighbor)
+                if known is not None and known.g <= neighbor.g:
+                    continue
+                self.reached[direction][neighbor] = neighbor
+                if neighbor in self.horizon[direction]:
+                    self.horizon[direction].replace(neighbor)
+                else:
+                    self.horizon[direction].add(neighbor)
+
+                match = self.reached[other].get(neighbor)
+                if match is not None and neighbor.g + match.g < self.meeting_cost:
+                    self.meeting_cost = neighbor.g + match.g
+                    meeting = (neighbor, match) if direction == FORWARD else (match, neighbor)
+
+        if meeting is None:
+            return None
+        return self.__join(*meeting)
+
+    def __backward_heuristic(self, representation):
+        """
+        Builds the heuristic of the backward search, whose goal is the start board.
+
+        The pattern database tables are specific to their goal and written to disk, so each start board would build
+        and store a new set of tables: the backward search uses the Manhattan distance instead, which is consistent
+        and needs no tables. The other heuristics are built for the start board with the geometry of the board.
+        :param representation: The representation of the start state.
+        :return: The heuristic estimating the cost from a state to the start state.
+        """
+        start_board = tuple(int(tile) for tile in representation.game_board)
+        if isinstance(self.heuristic, PatternDatabasePuzzleGame):
+            return ManhattanDistancePuzzleGame(start_board, cols=representation.geometry.cols)
+        if isinstance(self.heuristic, (ManhattanDistancePuzzleGame, LinearConflictPuzzleGame)):
+            return type(self.heuristic)(start_board, cols=representation.geometry.cols)
+        return type(self.heuristic)(start_board)
+
+    @staticmethod
+    def __evaluate_all(states, heuristic):
+        """
+        Computes the g, h and f values of several states, with a single call if the heuristic provides h_batch.
+        :param states: The states for which the costs need to be computed.
+        :param heuristic: The heuristic of the search that generated the states.
+        """
+        if hasattr(heuristic, "h_batch"):
+            values = heuristic.h_batch(states) if states else []
+        else:
+            values = None
+        for i, state in enumerate(states):
+            state.g = state.state_parent.g + 1  # fixed cost set to 1
+            state.h = heuristic.h(state) if values is None else values[i]
+            state.f = state.g + state.h
+
+    def __join(self, forward_state, backward_state):
+        """
+        Extends the forward path with the backward one, undoing each move of the backward search.
+        :param forward_state: The meeting state as reached by the forward search.
+        :param backward_state: The meeting state as reached by the backward search.
+        :return: The end-game state, linked through state_parent to the start state.
+        """
+        state = forward_state
+        while backward_state.state_parent is not None:
+            move = INVERSE_MOVES[backward_state.move]
+            representation = getattr(state.game_representation, MOVE_METHODS[move])()
+            state = StateFifteenPuzzleGame(game_representation=representation, state_parent=state, move=move)
+            state.g = state.state_parent.g + 1
+            state.h = self.heuristic.h(state)
+            state.f = state.g + state.h
+            backward_state = backward_state.state_parent
+        return state
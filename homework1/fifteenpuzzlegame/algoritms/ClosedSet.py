@@ -0,0 +1,99 @@
+from FifteenPuzzleGame import INVERSE_MOVES
+
+# The 2-bit code of each move of the empty tile, and the move of each code.
+MOVE_CODES = {"UP": 0, "DOWN": 1, "LEFT": 2, "RIGHT": 3}
+MOVES = ("UP", "DOWN", "LEFT", "RIGHT")
+
+
+def board_key(state):
+    """
+    Returns the packed integer of the game board of a state, for both packed and tuple representations.
+
+    The tuple representation packs its board once and its children derive their packed board from it, so the
+    repeated lookups of a state don't pack its board again.
+    :param state: The state of the Fifteen Puzzle game.
+    :return: The game board packed into an integer.
+    """
+    return state.game_representation.packed
+
+
+class ClosedSet:
+    """
+    Represents the set of explored states of a search in a compact form.
+
+    Instead of the state objects, each entry maps the packed game board to a single integer holding the cost g
+    and the 2-bit code of the move that reached the board. The parent of an entry is found by undoing its move,
+    so the path to any explored board is rebuilt from the entries alone and the states don't need to keep their
+    parent chains. The start board is the only entry with g = 0.
+
+    Attributes:
+        entries (dict): A mapping from each packed game board to (g << 2) | move code.
+    """
+
+    __slots__ = ("entries",)
+
+    def __init__(self):
+        """
+        Initializes an empty ClosedSet.
+        """
+        self.entries = {}
+
+    def add(self, state):
+        """
+        Adds an explored state, keeping only its cost and the move that reached it.
+        :param state: The explored state, with g already computed.
+        """
+        move_code = MOVE_CODES[state.move] if state.move is not None else 0
+        self.entries[board_key(state)] = (state.g << 2) | move_code
+
+    def g(self, state):
+        """
+        Returns the cost g with which a board was explored.
+        :param state: A state with the board to look for.
+        :return: The cost g of the board if it was explored; None otherwise.
+        """
+        entry = self.entries.get(board_key(state))
+        return entry >> 2 if entry is not None else None
+
+    def path(self, state):
+        """
+        Rebuilds the moves from the start board to the board of an explored state.
+        :param state: An explored state, or a state whose parent was explored.
+        :return: The list of moves from the start board to the board of the state.
+        """
+        moves = []
+        geometry = state.game_representation.geometry
+        packed = board_key(state)
+        blank = state.game_representation.blank
+        if packed not in self.entries:
+            # The state itself was not explored: start from its parent, which is.
+            moves.append(state.move)
+            packed, blank = self.__undo(geometry, packed, blank, state.move)
+        entry = self.entries[packed]
+        while entry >> 2 > 0:
+            move = MOVES[entry & 3]
+            moves.append(move)
+            packed, blank = self.__undo(geometry, packed, blank, move)
+            entry = self.entries[packed]
+        moves.reverse()
+        return moves
+
+    @staticmethod
+    def __undo(geometry, packed, blank, move):
+        """
+        Undoes a move on a packed game board.
+        :param geometry: The dimensions of the game board.
+        :param packed: The packed game board.
+        :param blank: The index of the empty tile.
+        :param move: The move that reached the board.
+        :return: The packed game board before the move and the index of its empty tile.
+        """
+        target, target_shift, blank_shift = geometry.move_table[INVERSE_MOVES[move]][blank]
+        tile = (packed >> target_shift) & geometry.tile_mask
+        return packed - (tile << target_shift) + (tile << blank_shift), target
+
+    def __contains__(self, state):
+        return board_key(state) in self.entries
+
+    def __len__(self):
+        return len(self.entries)
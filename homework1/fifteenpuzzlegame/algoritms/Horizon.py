@@ -0,0 +1,92 @@
+import heapq
+import itertools
+
+
+class Horizon:
+    """
+    Represents the frontier of a best-first search as a binary heap with lazy deletion.
+
+    The heap gives the state with the lowest priority in O(log n) instead of scanning the whole frontier,
+    while a hash index keeps membership tests in O(1) and allows a state to be replaced when a cheaper path
+    to the same board is found (decrease-key). Replaced or removed entries are only marked as stale and are
+    discarded when they reach the top of the heap.
+
+    Attributes:
+        priority: A function that returns the priority of a state (lower values are picked first).
+        heap (list): The binary heap of entries [priority, insertion order, state].
+        index (dict): A mapping from each state in the frontier to its live heap entry.
+    """
+
+    def __init__(self, priority):
+        """
+        Initializes an empty Horizon.
+        :param priority: A function that returns the priority of a state (lower values are picked first).
+        """
+        self.priority = priority
+        self.heap = []
+        self.index = {}
+        self.counter = itertools.count()  # Insertion order, used to break ties between equal priorities.
+
+    def add(self, state):
+        """
+        Adds a state to the frontier.
+        :param state: The state to add.
+        """
+        entry = [self.priority(state), next(self.counter), state]
+        self.index[state] = entry
+        heapq.heappush(self.heap, entry)
+
+    def get(self, state):
+        """
+        Returns the state stored in the frontier that is equal to the given one.
+        :param state: The state to look for.
+        :return: The stored state if present; None otherwise.
+        """
+        entry = self.index.get(state)
+        return entry[2] if entry is not None else None
+
+    def replace(self, state):
+        """
+        Replaces the stored state equal to the given one, typically because a cheaper path was found (decrease-key).
+        :param state: The new state that takes the place of the stored one.
+        """
+        self.remove(state)
+        self.add(state)
+
+    def remove(self, state):
+        """
+        Removes a state from the frontier. The heap entry is only marked as stale.
+        :param state: The state to remove.
+        """
+        entry = self.index.pop(state)
+        entry[2] = None
+
+    def pick(self):
+        """
+        Returns the state with the lowest priority without removing it from the frontier.
+        :return: The state with the lowest priority; None if the frontier is empty.
+        """
+        heap = self.heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)  # Discard stale entries left by remove and replace.
+        return heap[0][2] if heap else None
+
+    def pop(self):
+        """
+        Removes and returns the state with the lowest priority.
+        :return: The state with the lowest priority; None if the frontier is empty.
+        """
+        state = self.pick()
+        if state is not None:
+            heapq.heappop(self.heap)
+            del self.index[state]
+        return state
+
+    def __contains__(self, state):
+        return state in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        return iter(self.index)
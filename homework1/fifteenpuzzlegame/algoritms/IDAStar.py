@@ -0,0 +1,133 @@
+import time
+
+from FifteenPuzzleGame import MOVE_METHODS
+from StateFifteenPuzzleGame import StateFifteenPuzzleGame
+
+# Returned by the depth-first search when the end-game configuration has been reached.
+FOUND = -1
+
+
+class IDAStar:
+    """
+    Represents the Iterative Deepening A* (IDA*) Search algorithm
+
+    This class performs a sequence of depth-first searches bounded by a threshold on the combined cost
+    f = g + h. Each iteration raises the threshold to the lowest f value that exceeded it. Moves are applied
+    in place on a single mutable board and the move that undoes the previous one is never tried, so the
+    memory used is proportional to the depth of the solution instead of the number of generated states.
+
+    Attributes:
+        heuristic: The heuristic used to estimate the cost from a given board to the goal board.
+                   It must provide h_board(game_board); if it also provides delta(tile, from_index, to_index),
+                   the value of each child is updated from its parent instead of being recomputed.
+        game: The Fifteen Puzzle game.
+        nodes_count (int): The number of nodes visited over all iterations.
+        iterations (list): For each iteration, a dictionary with its threshold, visited nodes, time and nodes/sec.
+        move_table (dict): The precomputed moves of the size of the board being solved.
+    """
+
+    def __init__(self, game, heuristic):
+        """
+        Initializes the IDAStar search with a game and heuristic.
+        :param game: The Fifteen Puzzle game.
+        :param heuristic: The heuristic used to estimate the cost from a board to the goal board.
+        """
+        self.heuristic = heuristic
+        self.game = game
+        self.incremental = hasattr(heuristic, "delta")
+        self.nodes_count = 0
+        self.iterations = []
+        self.move_table = None
+
+    def search(self, state):
+        """
+        Solves the puzzle from the given state with IDA*.
+
+        Unlike AStar and BestFirst, a single call runs the whole search: the returned state is the end-game
+        state, linked through state_parent to the given state along the solution path.
+        :param state: The state from which the search starts.
+        :return: The end-game state if a solution exists; None otherwise.
+        """
+        board = list(state.game_representation.game_board)
+        goal = list(state.game_representation.end_game_board)
+        self.move_table = state.game_representation.geometry.move_table
+        path = []
+        h = self.heuristic.h_board(board)
+        threshold = h
+
+        while True:
+            start_time = time.perf_counter()
+            start_nodes = self.nodes_count
+            result = self.__depth_first(board, board.index(0), None, 0, h, threshold, goal, path)
+            elapsed = time.perf_counter() - start_time
+            nodes = self.nodes_count - start_nodes
+            self.iterations.append({
+                "threshold": threshold,
+                "nodes": nodes,
+                "time": elapsed,
+                "nodes_per_sec": nodes / elapsed if elapsed > 0 else float("inf"),
+            })
+            if result == FOUND:
+                return self.__build_states(state, path)
+            if result == float("inf"):
+                return None
+            threshold = result
+
+    def __depth_first(self, board, blank, previous_blank, g, h, threshold, goal, path):
+        """
+        Depth-first search bounded by the threshold, applying and undoing moves on the board in place.
+        :param board: The mutable game board.
+        :param blank: The index of the empty tile.
+        :param previous_blank: The index of the empty tile before the last move, used to skip the inverse move.
+        :param g: The cost to reach the current board.
+        :param h: The heuristic value of the current board.
+        :param threshold: The current bound on f.
+        :param goal: The end-game board.
+        :param path: The moves from the start board to the current board.
+        :return: FOUND if the goal was reached; otherwise the lowest f value that exceeded the threshold.
+        """
+        self.nodes_count += 1
+        f = g + h
+        if f > threshold:
+            return f
+        if board == goal:
+            return FOUND
+
+        minimum = float("inf")
+        for move, swaps in self.move_table.items():
+            swap = swaps[blank]
+            if swap is None or swap[0] == previous_blank:
+                continue
+            target = swap[0]
+            tile = board[target]
+            board[blank], board[target] = tile, 0
+            if self.incremental:
+                child_h = h + self.heuristic.delta(tile, target, blank)
+            else:
+                child_h = self.heuristic.h_board(board)
+            path.append(move)
+            result = self.__depth_first(board, target, blank, g + 1, child_h, threshold, goal, path)
+            if result == FOUND:
+                return FOUND
+            path.pop()
+            board[target], board[blank] = board[blank], 0
+            minimum = min(minimum, result)
+        return minimum
+
+    def __build_states(self, state, path):
+        """
+        Replays the solution moves from the start state, linking the new states through state_parent.
+        :param state: The start state.
+        :param path: The moves of the solution.
+        :return: The end-game state.
+        """
+        state.g = 0
+        state.h = self.heuristic.h(state)
+        state.f = state.h
+        for move in path:
+            representation = getattr(state.game_representation, MOVE_METHODS[move])()
+            state = StateFifteenPuzzleGame(game_representation=representation, state_parent=state, move=move)
+            state.g = state.state_parent.g + 1
+            state.h = self.heuristic.h(state)
+            state.f = state.g + state.h
+        return state
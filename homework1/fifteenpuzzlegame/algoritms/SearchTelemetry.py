@@ -0,0 +1,158 @@
+import json
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Not available on Windows: the peak RSS is not reported.
+    resource = None
+
+
+def peak_rss():
+    """
+    Returns the peak resident set size of the process.
+    :return: The peak RSS in bytes, None if it is not available on this platform.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class SearchTelemetry:
+    """
+    Collects the counters of a best-first search (AStar, BestFirst) and reports them as snapshots.
+
+    The search calls expanded once per expansion with its own measurements, and finished when it returns the
+    end-game state or gives up. Every sample_every expansions, whenever the f value of the expanded states rises
+    above the previous bound and at the end, a snapshot dictionary is passed to each observer and appended to the
+    JSONL trace file. A search without telemetry only pays for a None check per expansion.
+
+    The trace file is opened by the first snapshot, flushed after each one and closed by finished() or close(). The
+    searches close it when they raise, and a search stopped from outside (e.g. by a budget of expansions) is closed by
+    its caller, or by using the telemetry as a context manager:
+
+        with SearchTelemetry(trace_path="trace.jsonl") as telemetry:
+            ...
+
+    Attributes:
+        observers (list): The callables that receive each snapshot.
+        trace_path (str): The path of the JSONL trace file, None for no trace.
+        trace: The open trace file, None before the first snapshot and once closed.
+        closed (bool): Whether the trace file was closed, after which no trace is written.
+        sample_every (int): The number of expansions between two periodic snapshots.
+        expansions (int): The number of expanded states.
+        generated (int): The number of successors generated.
+        duplicates (int): The number of successors pruned because already explored or already in the horizon.
+        frontier (int): The size of the horizon after the last expansion.
+        f_bound (float): The highest f value of an expanded state.
+        successor_time (float): The seconds spent generating and filtering the successors.
+        heuristic_time (float): The seconds spent evaluating the successors.
+    """
+
+    def __init__(self, observers=(), trace_path=None, sample_every=1000):
+        """
+        Initializes the SearchTelemetry.
+        :param observers: The callables that receive each snapshot dictionary.
+        :param trace_path: The path of the JSONL trace file. Defaults to no trace.
+        :param sample_every: The number of expansions between two periodic snapshots.
+        """
+        self.observers = list(observers)
+        self.trace_path = trace_path
+        self.sample_every = sample_every
+        self.trace = None
+        self.closed = False
+        self.expansions = 0
+        self.generated = 0
+        self.duplicates = 0
+        self.frontier = 0
+        self.f_bound = None
+        self.successor_time = 0.0
+        self.heuristic_time = 0.0
+        self.start_time = time.perf_counter()
+
+    def expanded(self, state, generated, duplicates, frontier, successor_time, heuristic_time):
+        """
+        Records an expansion.
+        :param state: The expanded state.
+        :param generated: The number of successors generated by the expansion.
+        :param duplicates: The number of those successors that were pruned as duplicates.
+        :param frontier: The size of the horizon after the expansion.
+        :param successor_time: The seconds spent generating and filtering the successors.
+        :param heuristic_time: The seconds spent evaluating the successors.
+        """
+        self.expansions += 1
+        self.generated += generated
+        self.duplicates += duplicates
+        self.frontier = frontier
+        self.successor_time += successor_time
+        self.heuristic_time += heuristic_time
+        if self.f_bound is None or state.f > self.f_bound:
+            self.f_bound = state.f
+            self.emit("f_bound")
+        elif self.expansions % self.sample_every == 0:
+            self.emit("sample")
+
+    def finished(self, state):
+        """
+        Records the end of the search and closes the trace file.
+        :param state: The end-game state, None if the search failed.
+        """
+        solution_length = None
+        if state is not None:
+            solution_length = 0
+            while state.state_parent is not None:
+                state = state.state_parent
+                solution_length += 1
+        self.emit("end", solution_length=solution_length)
+        self.close()
+
+    def close(self):
+        """
+        Closes the trace file. The snapshots that follow are only sent to the observers.
+        """
+        self.closed = True
+        if self.trace is not None:
+            self.trace.close()
+            self.trace = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def snapshot(self):
+        """
+        Returns the current counters.
+        :return: A dictionary with the counters and the rates derived from them.
+        """
+        elapsed = time.perf_counter() - self.start_time
+        return {
+            "time": elapsed,
+            "expansions": self.expansions,
+            "expansions_per_sec": self.expansions / elapsed if elapsed > 0 else 0.0,
+            "generated": self.generated,
+            "duplicates": self.duplicates,
+            "frontier": self.frontier,
+            "f_bound": self.f_bound,
+            "successor_time": self.successor_time,
+            "heuristic_time": self.heuristic_time,
+            "peak_rss": peak_rss(),
+        }
+
+    def emit(self, event, **fields):
+        """
+        Sends a snapshot to the observers and to the trace file.
+        :param event: The reason of the snapshot: "f_bound", "sample" or "end".
+        :param fields: Additional fields of the snapshot.
+        """
+        snapshot = {"event": event, **self.snapshot(), **fields}
+        for observer in self.observers:
+            observer(snapshot)
+        if self.trace is None and self.trace_path is not None and not self.closed:
+            self.trace = open(self.trace_path, "w")
+        if self.trace is not None:
+            self.trace.write(json.dumps(snapshot) + "\n")
+            self.trace.flush()
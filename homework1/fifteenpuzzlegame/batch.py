@@ -0,0 +1,357 @@
+import argparse
+import csv
+import json
+import os
+import signal
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from Agent import Agent
+from FifteenPuzzleGame import FifteenPuzzleGame
+from FifteenPuzzleRepresentation import FifteenPuzzleRepresentation
+from PackedFifteenPuzzleRepresentation import PackedFifteenPuzzleRepresentation
+from PuzzleGeometry import PuzzleGeometry
+from StateFifteenPuzzleGame import StateFifteenPuzzleGame
+from algoritms.AStar import AStar
+from algoritms.AnytimeAStar import AnytimeAStar
+from algoritms.BestFirst import BestFirst
+from algoritms.BidirectionalAStar import BidirectionalAStar
+from algoritms.IDAStar import IDAStar
+from heuristics.LinearConflictPuzzleGame import LinearConflictPuzzleGame
+from heuristics.ManhattanDistancePuzzleGame import ManhattanDistancePuzzleGame
+from heuristics.MisplacedTilesPuzzleGame import MisplacedTittlesPuzzleGame
+from heuristics.PatternDatabasePuzzleGame import PatternDatabasePuzzleGame
+from heuristics.WalkingDistancePuzzleGame import WalkingDistancePuzzleGame
+
+ALGORITHMS = {
+    "AStar": AStar,
+    "BestFirst": BestFirst,
+    "IDAStar": IDAStar,
+    "BidirectionalAStar": BidirectionalAStar,
+    "AnytimeAStar": AnytimeAStar,
+}
+
+HEURISTICS = {
+    "ManhattanDistance": ManhattanDistancePuzzleGame,
+    "MisplacedTittles": MisplacedTittlesPuzzleGame,
+    "LinearConflict": LinearConflictPuzzleGame,
+    "WalkingDistance": WalkingDistancePuzzleGame,
+    "PatternDatabase": PatternDatabasePuzzleGame,
+}
+
+FIELDS = ["id", "status", "solution_length", "expansions", "wall_time", "peak_memory", "error"]
+
+# The heuristic name of each worker process, set by init_worker, and its heuristic for each board size,
+# built on first use and shared by all the instances of that size.
+worker_heuristic_name = None
+worker_heuristics = {}
+
+
+class InstanceTimeout(Exception):
+    """
+    Raised inside a worker when an instance exceeds its time budget.
+    """
+
+
+def read_boards(path):
+    """
+    Lazily reads the boards of a file, one per line.
+
+    A line is either the tiles separated by spaces or commas, a JSON list of the tiles, or a JSON object with
+    a "board" list and an optional "id". Empty lines and lines starting with # are skipped. The boards are square
+    and their size is given by their number of tiles (9 for the 8-puzzle, 16, 25 for the 24-puzzle...).
+    :param path: The path of the file, or - for the standard input.
+    :return: A generator of (id, board, error) triples; the id defaults to the line number. A line that is not a
+             valid board has the board None and the exception as error, so that it is reported like a failed instance.
+    """
+    file = sys.stdin if path == "-" else open(path)
+    try:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            instance_id = line_number
+            try:
+                if line.startswith("{"):
+                    record = json.loads(line)
+                    instance_id = record.get("id", line_number)
+                    board = record["board"]
+                elif line.startswith("["):
+                    board = json.loads(line)
+                else:
+                    board = line.replace(",", " ").split()
+                board = tuple(int(tile) for tile in board)
+                if sorted(board) != list(range(len(board))):
+                    raise ValueError(f"Line {line_number} is not a sliding puzzle board: {line}")
+                PuzzleGeometry.of_board(board)  # Rejects the boards that are not square.
+            except (ValueError, KeyError, TypeError) as error:
+                yield instance_id, None, error
+                continue
+            yield instance_id, board, None
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+
+def init_worker(heuristic_name):
+    """
+    Sets the heuristic of a worker process.
+    :param heuristic_name: The name of the heuristic in HEURISTICS.
+    """
+    global worker_heuristic_name
+    worker_heuristic_name = heuristic_name
+
+
+def get_heuristic(geometry):
+    """
+    Returns the heuristic of the worker for a board size, building it once so its tables are not rebuilt for
+    every instance.
+    :param geometry: The geometry of the board.
+    :return: The heuristic for boards of that size.
+    """
+    if geometry not in worker_heuristics:
+        worker_heuristics[geometry] = HEURISTICS[worker_heuristic_name](geometry.end_game_board)
+    return worker_heuristics[geometry]
+
+
+def raise_timeout(signum, frame):
+    raise InstanceTimeout()
+
+
+def solve(instance_id, board, algorithm_name, timeout):
+    """
+    Solves a single instance in a worker process.
+
+    The time budget is enforced with SIGALRM where available, which also interrupts the single-call searches
+    (IDAStar, BidirectionalAStar, AnytimeAStar); elsewhere it is only checked between the steps of the agent.
+    :param instance_id: The id of the instance.
+    :param board: The game board of the instance.
+    :param algorithm_name: The name of the search algorithm in ALGORITHMS.
+    :param timeout: The time budget in seconds, None for no limit.
+    :return: The result row of the instance.
+    """
+    geometry = PuzzleGeometry.of_board(board)
+    if algorithm_name == "AnytimeAStar" and timeout is not None:
+        # Stop refining early enough to return the solution before the alarm fires.
+        search_algorithm = AnytimeAStar(FifteenPuzzleGame(), get_heuristic(geometry), time_budget=timeout / 2)
+    else:
+        search_algorithm = ALGORITHMS[algorithm_name](FifteenPuzzleGame(), get_heuristic(geometry))
+    state = StateFifteenPuzzleGame(
+        game_representation=PackedFifteenPuzzleRepresentation(game_board=board, geometry=geometry))
+    agent = Agent(search_algorithm, state)
+    steps = 0
+    status = "solved"
+    use_alarm = timeout is not None and hasattr(signal, "SIGALRM")
+    # The peak of the worker is reset to its current memory, so that it only covers this instance.
+    start_memory = resident_memory("VmRSS") if reset_peak_resident_memory() else None
+    if use_alarm:
+        signal.signal(signal.SIGALRM, raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    start_time = time.perf_counter()
+    try:
+        while state is not None and not state.is_end_game():
+            if timeout is not None and time.perf_counter() - start_time > timeout:
+                raise InstanceTimeout()
+            state = agent.do_action(state)
+            steps += 1
+    except InstanceTimeout:
+        status = "timeout"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        wall_time = time.perf_counter() - start_time
+
+    if status == "solved" and state is None:
+        status = "failed"
+    return {
+        "id": instance_id,
+        "status": status,
+        "solution_length": solution_length(state) if status == "solved" else None,
+        "expansions": count_expansions(search_algorithm, steps),
+        "wall_time": round(wall_time, 6),
+        # The memory added by the search at its peak, in bytes.
+        "peak_memory": resident_memory("VmHWM") - start_memory if start_memory is not None else None,
+        "error": None,
+    }
+
+
+def reset_peak_resident_memory():
+    """
+    Resets the peak resident memory of the current process (VmHWM) to its current resident memory. Only Linux can
+    reset it: elsewhere the peak covers the whole life of the worker, and is not reported.
+    :return: True if the peak was reset, False otherwise.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def resident_memory(field):
+    """
+    Reads a resident memory field of the current process from /proc/self/status.
+    :param field: VmRSS for the current resident memory, VmHWM for its peak since the last reset.
+    :return: The memory in bytes.
+    """
+    with open("/proc/self/status") as file:
+        for line in file:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024  # In kilobytes.
+    raise ValueError(f"No {field} in /proc/self/status")
+
+
+def solution_length(state):
+    """
+    Counts the moves from the start state to the given state by following state_parent.
+    :param state: The end-game state.
+    :return: The number of moves of the solution.
+    """
+    moves = 0
+    while state.state_parent is not None:
+        state = state.state_parent
+        moves += 1
+    return moves
+
+
+def count_expansions(search_algorithm, steps):
+    """
+    Reads the number of expanded states from a search algorithm.
+    :param search_algorithm: The search algorithm after the search.
+    :param steps: The number of calls of the agent, i.e. the expansions of AStar and BestFirst.
+    :return: The number of expanded states.
+    """
+    if isinstance(search_algorithm, IDAStar):
+        return search_algorithm.nodes_count
+    if isinstance(search_algorithm, AnytimeAStar):
+        return search_algorithm.expansions
+    if isinstance(search_algorithm, BidirectionalAStar):
+        return len(search_algorithm.explored[0]) + len(search_algorithm.explored[1])
+    return steps
+
+
+class ResultWriter:
+    """
+    Writes result rows to a CSV or JSONL file as soon as they are available.
+
+    Attributes:
+        file: The output file.
+        jsonl (bool): True for JSONL output, False for CSV output.
+        writer (csv.DictWriter): The CSV writer, None for JSONL output.
+    """
+
+    def __init__(self, path):
+        """
+        Opens the output file; the format is JSONL if the path ends with .jsonl, CSV otherwise.
+        :param path: The path of the output file, or - for the standard output.
+        """
+        self.file = sys.stdout if path == "-" else open(path, "w", newline="")
+        self.jsonl = path.endswith(".jsonl")
+        self.writer = None
+        if not self.jsonl:
+            self.writer = csv.DictWriter(self.file, fieldnames=FIELDS)
+            self.writer.writeheader()
+
+    def write(self, row):
+        if self.jsonl:
+            self.file.write(json.dumps(row) + "\n")
+        else:
+            self.writer.writerow(row)
+        self.file.flush()
+
+    def close(self):
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+def run_batch(input_path, output_path, algorithm_name, heuristic_name, timeout=None, workers=None):
+    """
+    Solves all the boards of a file over a process pool, streaming the results as the instances complete.
+
+    Unsolvable boards are filtered in the main process and reported without being submitted. The boards are read
+    lazily and at most a few instances per worker are in flight, so neither the input nor the results are held
+    in memory.
+    :param input_path: The path of the boards file.
+    :param output_path: The path of the results file (.csv or .jsonl).
+    :param algorithm_name: The name of the search algorithm in ALGORITHMS.
+    :param heuristic_name: The name of the heuristic in HEURISTICS.
+    :param timeout: The time budget of each instance in seconds, None for no limit.
+    :param workers: The number of worker processes. Defaults to the number of CPUs.
+    :return: The number of results of each status.
+    """
+    workers = workers or os.cpu_count()
+    writer = ResultWriter(output_path)
+    counts = {}
+    pending = set()
+    instance_ids = {}
+
+    def write_failed(instance_id, error):
+        row = dict.fromkeys(FIELDS)
+        row.update(id=instance_id, status="failed", error=repr(error))
+        counts["failed"] = counts.get("failed", 0) + 1
+        writer.write(row)
+
+    def collect(futures):
+        for future in futures:
+            instance_id = instance_ids.pop(future)
+            try:
+                row = future.result()
+            except Exception as error:
+                # A single instance (e.g. a MemoryError or a crashed worker) doesn't stop the batch.
+                write_failed(instance_id, error)
+                continue
+            counts[row["status"]] = counts.get(row["status"], 0) + 1
+            writer.write(row)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(heuristic_name,)) as executor:
+            for instance_id, board, error in read_boards(input_path):
+                if error is not None:
+                    write_failed(instance_id, error)
+                    continue
+                if not FifteenPuzzleRepresentation(game_board=board).game_is_solvable():
+                    row = dict.fromkeys(FIELDS)
+                    row.update(id=instance_id, status="unsolvable")
+                    counts["unsolvable"] = counts.get("unsolvable", 0) + 1
+                    writer.write(row)
+                    continue
+                if len(pending) >= 4 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                try:
+                    future = executor.submit(solve, instance_id, board, algorithm_name, timeout)
+                except BrokenProcessPool as error:
+                    write_failed(instance_id, error)
+                    continue
+                instance_ids[future] = instance_id
+                pending.add(future)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+    finally:
+        writer.close()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solves many sliding puzzle boards in parallel.")
+    parser.add_argument("input", help="file with one board per line (tiles, JSON list or JSON object), - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="results file, .jsonl for JSONL and CSV otherwise")
+    parser.add_argument("-a", "--algorithm", choices=ALGORITHMS, default="AStar")
+    parser.add_argument("-H", "--heuristic", choices=HEURISTICS, default="ManhattanDistance")
+    parser.add_argument("-t", "--timeout", type=float, default=None, help="time budget of each instance in seconds")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of worker processes")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    counts = run_batch(args.input, args.output, args.algorithm, args.heuristic, args.timeout, args.workers)
+    summary = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items()))
+    print(f"Done in {time.time() - start_time:.1f}s ({summary})", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,411 @@
+import random
+import time
+import tracemalloc
+
+import numpy as np
+
+from Agent import Agent
+from FifteenPuzzleGame import FifteenPuzzleGame
+from FifteenPuzzleRepresentation import FifteenPuzzleRepresentation, solvable_boards
+from PackedFifteenPuzzleRepresentation import PackedFifteenPuzzleRepresentation
+from PuzzleGeometry import PuzzleGeometry, unpack
+from StateFifteenPuzzleGame import StateFifteenPuzzleGame
+from algoritms.AStar import AStar
+from algoritms.AnytimeAStar import AnytimeAStar
+from algoritms.BestFirst import BestFirst
+from algoritms.BidirectionalAStar import BidirectionalAStar
+from algoritms.ClosedSet import ClosedSet
+from algoritms.IDAStar import IDAStar
+from algoritms.SearchTelemetry import SearchTelemetry
+from heuristics.LinearConflictPuzzleGame import LinearConflictPuzzleGame
+from heuristics.ManhattanDistancePuzzleGame import ManhattanDistancePuzzleGame
+from heuristics.MisplacedTilesPuzzleGame import MisplacedTittlesPuzzleGame
+from heuristics.PatternDatabasePuzzleGame import PatternDatabasePuzzleGame
+from heuristics.WalkingDistancePuzzleGame import WalkingDistancePuzzleGame
+
+
+class SetHorizon:
+    """
+    The original set-based frontier, where every pick scans the whole horizon. Kept only as a benchmark baseline.
+    """
+
+    def __init__(self):
+        self.states = {}
+
+    def add(self, state):
+        self.states[state] = state
+
+    def get(self, state):
+        return self.states.get(state)
+
+    def replace(self, state):
+        self.states[state] = state
+
+    def remove(self, state):
+        del self.states[state]
+
+    def pick(self):
+        return min(self.states, key=lambda state: state.f)
+
+    def __contains__(self, state):
+        return state in self.states
+
+    def __len__(self):
+        return len(self.states)
+
+    def __iter__(self):
+        return iter(self.states)
+
+
+def scramble(moves, seed, geometry=None):
+    """
+    Generates a solvable board by applying random moves to the end-game configuration.
+    :param moves: The number of random moves to apply.
+    :param seed: The seed of the random generator.
+    :param geometry: The dimensions of the board. Defaults to 4x4.
+    :return: The scrambled game board.
+    """
+    rng = random.Random(seed)
+    geometry = geometry or PuzzleGeometry.of()
+    representation = FifteenPuzzleRepresentation(game_board=geometry.end_game_board, geometry=geometry)
+    for _ in range(moves):
+        candidates = [representation.move_up(), representation.move_down(), representation.move_left(),
+                      representation.move_right()]
+        representation = rng.choice([candidate for candidate in candidates if candidate is not None])
+    return representation.game_board
+
+
+def run_search(search_algorithm, state, max_expansions):
+    """
+    Runs the agent loop without printing until the end game or the expansion budget is reached.
+    :return: The number of expansions and the elapsed time in seconds.
+    """
+    agent = Agent(search_algorithm, state)
+    expansions = 0
+    start_time = time.perf_counter()
+    while state is not None and not state.is_end_game() and expansions < max_expansions:
+        state = agent.do_action(state)
+        expansions += 1
+    return expansions, time.perf_counter() - start_time
+
+
+def bench_horizon(scramble_moves=60, max_expansions=5000, seed=7):
+    print(f"Horizon benchmark (scramble={scramble_moves} moves, at most {max_expansions} expansions)")
+    board = scramble(scramble_moves, seed)
+    goal = FifteenPuzzleRepresentation().end_game_board
+    for name, algorithm in [("AStar", AStar), ("BestFirst", BestFirst)]:
+        for heuristic_name, heuristic in [("ManhattanDistance", ManhattanDistancePuzzleGame(goal)),
+                                          ("MisplacedTittles", MisplacedTittlesPuzzleGame(goal))]:
+            results = {}
+            for horizon_name in ["set", "heap"]:
+                search_algorithm = algorithm(FifteenPuzzleGame(), heuristic)
+                if horizon_name == "set":
+                    search_algorithm.horizon = SetHorizon()
+                state = StateFifteenPuzzleGame(game_representation=FifteenPuzzleRepresentation(game_board=board))
+                expansions, elapsed = run_search(search_algorithm, state, max_expansions)
+                results[horizon_name] = expansions / elapsed
+                print(f"{name:<10} {heuristic_name:<18} {horizon_name:<5} expansions={expansions:<7} "
+                      f"time={elapsed:.2f}s expansions/sec={expansions / elapsed:.0f}")
+            print(f"{name:<10} {heuristic_name:<18} speedup={results['heap'] / results['set']:.2f}x\n")
+
+
+def bench_representation(scramble_moves=60, max_expansions=5000, seed=7):
+    print(f"Representation benchmark (scramble={scramble_moves} moves, at most {max_expansions} expansions)")
+    board = scramble(scramble_moves, seed)
+    goal = FifteenPuzzleRepresentation().end_game_board
+    game = FifteenPuzzleGame()
+    results = {}
+    for name, representation in [("tuple", FifteenPuzzleRepresentation), ("packed", PackedFifteenPuzzleRepresentation)]:
+        state = StateFifteenPuzzleGame(game_representation=representation(game_board=board))
+        start_time = time.perf_counter()
+        for _ in range(2000):
+            game.neighbors(state)
+        neighbors_time = time.perf_counter() - start_time
+        search_algorithm = AStar(game, ManhattanDistancePuzzleGame(goal))
+        expansions, elapsed = run_search(search_algorithm, state, max_expansions)
+        results[name] = expansions / elapsed
+        print(f"{name:<7} neighbors/sec={2000 / neighbors_time:.0f} AStar expansions/sec={expansions / elapsed:.0f}")
+    print(f"packed speedup={results['packed'] / results['tuple']:.2f}x\n")
+
+
+def bench_heuristics(instances=5, scramble_moves=80, max_expansions=200000):
+    print(f"Heuristic benchmark ({instances} instances, scramble={scramble_moves} moves)")
+    goal = FifteenPuzzleRepresentation().end_game_board
+    heuristics = [("ManhattanDistance", ManhattanDistancePuzzleGame(goal)),
+                  ("LinearConflict", LinearConflictPuzzleGame(goal)),
+                  ("WalkingDistance", WalkingDistancePuzzleGame(goal)),
+                  ("PatternDatabase", PatternDatabasePuzzleGame(goal))]
+    for heuristic_name, heuristic in heuristics:
+        total_expansions = 0
+        total_time = 0
+        for seed in range(instances):
+            board = scramble(scramble_moves, seed)
+            state = StateFifteenPuzzleGame(game_representation=PackedFifteenPuzzleRepresentation(game_board=board))
+            expansions, elapsed = run_search(AStar(FifteenPuzzleGame(), heuristic), state, max_expansions)
+            total_expansions += expansions
+            total_time += elapsed
+        print(f"{heuristic_name:<18} expansions/solve={total_expansions / instances:.0f} "
+              f"time/solve={total_time / instances:.3f}s time/expansion={total_time / total_expansions * 1e6:.1f}us")
+    print()
+
+
+def bench_bidirectional(instances=3, scramble_moves=200, min_depth=40, max_expansions=2000000):
+    print(f"Bidirectional benchmark ({instances} instances of at least {min_depth} moves)")
+    goal = FifteenPuzzleRepresentation().end_game_board
+    heuristic = LinearConflictPuzzleGame(goal)
+    seed = 0
+    found = 0
+    while found < instances:
+        board = scramble(scramble_moves, seed)
+        seed += 1
+        # Cheap filter on the heuristic value; the actual solution depth is reported below.
+        if heuristic.h_board(board) < min_depth:
+            continue
+        found += 1
+        results = {}
+        for name in ["AStar", "BidirectionalAStar"]:
+            state = StateFifteenPuzzleGame(game_representation=PackedFifteenPuzzleRepresentation(game_board=board))
+            tracemalloc.start()
+            if name == "AStar":
+                search_algorithm = AStar(FifteenPuzzleGame(), heuristic)
+                expansions, elapsed = run_search(search_algorithm, state, max_expansions)
+                stored = len(search_algorithm.horizon) + len(search_algorithm.explored)
+            else:
+                search_algorithm = BidirectionalAStar(FifteenPuzzleGame(), heuristic)
+                start_time = time.perf_counter()
+                depth = search_algorithm.search(state).g
+                elapsed = time.perf_counter() - start_time
+                stored = len(search_algorithm.reached[0]) + len(search_algorithm.reached[1])
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results[name] = (stored, peak, elapsed)
+            print(f"seed={seed - 1:<4} {name:<19} stored states={stored:<8} "
+                  f"peak memory={peak / 2 ** 20:.1f}MiB time={elapsed:.2f}s")
+        (astar_stored, astar_peak, astar_time), (stored, peak, elapsed) = results.values()
+        print(f"seed={seed - 1:<4} depth={depth} bidirectional/AStar: states={stored / astar_stored:.2f} "
+              f"memory={peak / astar_peak:.2f} time={elapsed / astar_time:.2f}\n")
+
+
+def bench_solvability(boards_count=100000, seed=7):
+    print(f"Solvability benchmark ({boards_count} random boards)")
+    boards = np.array([np.random.default_rng(seed + i).permutation(16) for i in range(boards_count)])
+    start_time = time.perf_counter()
+    solvable = [FifteenPuzzleRepresentation(game_board=tuple(board.tolist())).game_is_solvable() for board in boards]
+    scalar_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    vectorized = solvable_boards(boards)
+    vectorized_time = time.perf_counter() - start_time
+    assert vectorized.tolist() == solvable
+    print(f"game_is_solvable boards/sec={boards_count / scalar_time:.0f} "
+          f"solvable_boards boards/sec={boards_count / vectorized_time:.0f} solvable={vectorized.mean():.3f}\n")
+
+
+def measure_bytes(build, count):
+    """
+    Measures the memory allocated per item by a function that builds a container of count items.
+    :return: The number of bytes per item.
+    """
+    tracemalloc.start()
+    container = build(count)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del container
+    return size / count
+
+
+def bench_memory(nodes=50000, scramble_moves=200, seed=7):
+    print(f"Memory benchmark ({nodes} nodes)")
+    board = scramble(scramble_moves, seed)
+    game = FifteenPuzzleGame()
+
+    def walk(representation, count):
+        # A chain of states that random-walks the board, as the explored set of the original AStar kept them.
+        rng = random.Random(seed)
+        states = set()
+        state = StateFifteenPuzzleGame(game_representation=representation(game_board=board))
+        while len(states) < count:
+            state.g = state.h = state.f = 0
+            states.add(state)
+            state = rng.choice(list(game.neighbors(state)))
+        return states
+
+    def closed_set(count):
+        explored = ClosedSet()
+        for state in walk(PackedFifteenPuzzleRepresentation, count):
+            explored.add(state)
+        return explored
+
+    tuple_bytes = measure_bytes(lambda count: walk(FifteenPuzzleRepresentation, count), nodes)
+    packed_bytes = measure_bytes(lambda count: walk(PackedFifteenPuzzleRepresentation, count), nodes)
+    # The states of the walk are freed once copied in the closed set, so only the entries remain allocated.
+    closed_bytes = measure_bytes(closed_set, nodes)
+    print(f"state chain, tuple representation  bytes/node={tuple_bytes:.0f}")
+    print(f"state chain, packed representation bytes/node={packed_bytes:.0f}")
+    print(f"ClosedSet entry                    bytes/node={closed_bytes:.0f}")
+
+    goal = FifteenPuzzleRepresentation().end_game_board
+    state = StateFifteenPuzzleGame(game_representation=PackedFifteenPuzzleRepresentation(game_board=board))
+    search_algorithm = AStar(game, LinearConflictPuzzleGame(goal))
+    tracemalloc.start()
+    expansions, elapsed = run_search(search_algorithm, state, nodes)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    stored = len(search_algorithm.horizon) + len(search_algorithm.explored)
+    print(f"AStar horizon={len(search_algorithm.horizon)} explored={len(search_algorithm.explored)} "
+          f"peak memory={peak / 2 ** 20:.1f}MiB bytes/node={peak / stored:.0f}\n")
+
+
+def bench_sizes(samples=200, instances_24=3, scramble_moves_24=80, seed=7):
+    print("Board size benchmark")
+    geometry = PuzzleGeometry.of(3, 3)
+    goal = geometry.end_game_board
+    heuristic = LinearConflictPuzzleGame(goal)
+    # Exhaustive breadth-first search of the 8-puzzle from the end game, keyed by the packed boards.
+    start_time = time.perf_counter()
+    root = PackedFifteenPuzzleRepresentation(game_board=goal, geometry=geometry)
+    distances = {root.packed: 0}
+    frontier = [root]
+    while frontier:
+        next_frontier = []
+        for representation in frontier:
+            for child in (representation.move_up(), representation.move_down(), representation.move_left(),
+                          representation.move_right()):
+                if child is not None and child.packed not in distances:
+                    distances[child.packed] = distances[representation.packed] + 1
+                    next_frontier.append(child)
+        frontier = next_frontier
+    print(f"8-puzzle  boards={len(distances)} diameter={max(distances.values())} "
+          f"breadth-first time={time.perf_counter() - start_time:.2f}s")
+
+    # Random 8-puzzle boards, solved by each search and checked against the breadth-first distances.
+    sample = random.Random(seed).sample(sorted(distances), samples)
+    for name in ["AStar", "IDAStar"]:
+        start_time = time.perf_counter()
+        for packed in sample:
+            board = unpack(packed, geometry.cells, geometry.tile_bits)
+            state = StateFifteenPuzzleGame(
+                game_representation=PackedFifteenPuzzleRepresentation(game_board=board, geometry=geometry))
+            if name == "AStar":
+                agent = Agent(AStar(FifteenPuzzleGame(), heuristic), state)
+                while not state.is_end_game():
+                    state = agent.do_action(state)
+            else:
+                state = IDAStar(FifteenPuzzleGame(), heuristic).search(state)
+            assert state.g == distances[packed], f"{name} found {state.g} moves instead of {distances[packed]}"
+        elapsed = time.perf_counter() - start_time
+        print(f"8-puzzle  {name:<8} optimal on {samples} random boards, time/solve={elapsed / samples * 1000:.1f}ms")
+
+    # On the 24-puzzle IDAStar updates the Manhattan distance incrementally, the fastest per node.
+    geometry = PuzzleGeometry.of(5, 5)
+    heuristic = ManhattanDistancePuzzleGame(geometry.end_game_board)
+    for instance in range(instances_24):
+        board = scramble(scramble_moves_24, seed + instance, geometry)
+        state = StateFifteenPuzzleGame(
+            game_representation=PackedFifteenPuzzleRepresentation(game_board=board, geometry=geometry))
+        search_algorithm = IDAStar(FifteenPuzzleGame(), heuristic)
+        start_time = time.perf_counter()
+        state = search_algorithm.search(state)
+        elapsed = time.perf_counter() - start_time
+        print(f"24-puzzle IDAStar  seed={seed + instance} moves={state.g} nodes={search_algorithm.nodes_count} "
+              f"time={elapsed:.2f}s nodes/sec={search_algorithm.nodes_count / elapsed:.0f}")
+    print()
+
+
+def bench_telemetry(scramble_moves=80, max_expansions=20000, seed=3, repeats=3):
+    print(f"Telemetry benchmark (scramble={scramble_moves} moves, at most {max_expansions} expansions)")
+    board = scramble(scramble_moves, seed)
+    goal = FifteenPuzzleRepresentation().end_game_board
+    heuristic = ManhattanDistancePuzzleGame(goal)
+    for name, algorithm in [("AStar", AStar), ("BestFirst", BestFirst)]:
+        results = {}
+        for mode in ["disabled", "enabled"]:
+            best = float("inf")
+            for _ in range(repeats):
+                telemetry = SearchTelemetry() if mode == "enabled" else None
+                search_algorithm = algorithm(FifteenPuzzleGame(), heuristic, telemetry=telemetry)
+                state = StateFifteenPuzzleGame(game_representation=PackedFifteenPuzzleRepresentation(game_board=board))
+                expansions, elapsed = run_search(search_algorithm, state, max_expansions)
+                best = min(best, elapsed / expansions)
+            results[mode] = best
+            print(f"{name:<10} telemetry {mode:<9} time/expansion={best * 1e6:.1f}us")
+        print(f"{name:<10} overhead={(results['enabled'] / results['disabled'] - 1) * 100:.1f}%")
+    print()
+
+
+def bench_anytime(instances=3, scramble_moves=300, budgets=(0.1, 0.5, 2.0), seed=11):
+    print(f"Anytime benchmark (scramble={scramble_moves} moves, time budgets={budgets}s)")
+    heuristic = LinearConflictPuzzleGame(FifteenPuzzleRepresentation().end_game_board)
+    for instance in range(instances):
+        board = scramble(scramble_moves, seed + instance)
+        for budget in budgets:
+            search_algorithm = AnytimeAStar(FifteenPuzzleGame(), heuristic, time_budget=budget)
+            state = StateFifteenPuzzleGame(game_representation=PackedFifteenPuzzleRepresentation(game_board=board))
+            start_time = time.perf_counter()
+            state = search_algorithm.search(state)
+            elapsed = time.perf_counter() - start_time
+            first = search_algorithm.solutions[0]
+            print(f"seed={seed + instance} budget={budget:<4} first: cost={first['cost']} "
+                  f"time={first['time'] * 1000:.0f}ms | final: cost={state.g} bound={search_algorithm.bound:.3f} "
+                  f"weight={search_algorithm.weight:.2f} expansions={search_algorithm.expansions} time={elapsed:.2f}s")
+        search_algorithm = BestFirst(FifteenPuzzleGame(), heuristic)
+        state = StateFifteenPuzzleGame(game_representation=PackedFifteenPuzzleRepresentation(game_board=board))
+        agent = Agent(search_algorithm, state)
+        start_time = time.perf_counter()
+        while not state.is_end_game():
+            state = agent.do_action(state)
+        moves = 0
+        while state.state_parent is not None:
+            state = state.state_parent
+            moves += 1
+        print(f"seed={seed + instance} BestFirst cost={moves} time={(time.perf_counter() - start_time) * 1000:.0f}ms")
+    print()
+
+
+def bench_batch_scoring(scramble_moves=80, max_expansions=2000, seed=3, repeats=5):
+    print(f"Batch scoring benchmark (children of {max_expansions} AStar expansions, scramble={scramble_moves} moves)")
+    board = scramble(scramble_moves, seed)
+    goal = FifteenPuzzleRepresentation().end_game_board
+    game = FifteenPuzzleGame()
+    # The batches the searches actually score: the children of each expanded state.
+    batches = []
+    search_algorithm = AStar(game, ManhattanDistancePuzzleGame(goal))
+    state = StateFifteenPuzzleGame(game_representation=PackedFifteenPuzzleRepresentation(game_board=board))
+    agent = Agent(search_algorithm, state)
+    while not state.is_end_game() and len(batches) < max_expansions:
+        batches.append(list(game.neighbors(state)))
+        state = agent.do_action(state)
+    sizes = [len(batch) for batch in batches]
+    print(f"batch size: mean={sum(sizes) / len(sizes):.2f} min={min(sizes)} max={max(sizes)}")
+    for heuristic_name, heuristic in [("LinearConflict", LinearConflictPuzzleGame(goal)),
+                                      ("WalkingDistance", WalkingDistancePuzzleGame(goal))]:
+        assert [heuristic.h_batch(batch) for batch in batches] == \
+               [[heuristic.h(child) for child in batch] for batch in batches]
+        results = {}
+        for mode in ["per-state", "batch"]:
+            best = float("inf")
+            for _ in range(repeats):
+                start_time = time.perf_counter()
+                if mode == "batch":
+                    for batch in batches:
+                        heuristic.h_batch(batch)
+                else:
+                    for batch in batches:
+                        [heuristic.h(child) for child in batch]
+                best = min(best, time.perf_counter() - start_time)
+            results[mode] = best
+            print(f"{heuristic_name:<16} {mode:<9} time/child={best / sum(sizes) * 1e6:.1f}us")
+        print(f"{heuristic_name:<16} batch speedup={results['per-state'] / results['batch']:.2f}x")
+    print()
+
+
+if __name__ == '__main__':
+    bench_horizon()
+    bench_representation()
+    bench_heuristics()
+    bench_batch_scoring()
+    bench_bidirectional()
+    bench_solvability()
+    bench_memory()
+    bench_sizes()
+    bench_telemetry()
+    bench_anytime()
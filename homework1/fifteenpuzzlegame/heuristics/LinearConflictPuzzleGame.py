@@ -0,0 +1,138 @@
+import itertools
+
+import numpy as np
+
+from PuzzleGeometry import PuzzleGeometry
+from homework1.fifteenpuzzlegame import StateFifteenPuzzleGame
+
+
+def longest_increasing_subsequence(values):
+    """
+    Computes the length of the longest strictly increasing subsequence of a short sequence.
+    :param values: The sequence of values.
+    :return: The length of the longest increasing subsequence.
+    """
+    lengths = []
+    for i, value in enumerate(values):
+        lengths.append(1 + max((lengths[j] for j in range(i) if values[j] < value), default=0))
+    return max(lengths, default=0)
+
+
+def line_weights(length):
+    """
+    Computes the weights that turn the cells of a line, each in 0..length, into an index of the line table.
+    :param length: The number of cells of the line.
+    :return: The array of the weights of the cells.
+    """
+    return (length + 1) ** np.arange(length, dtype=np.int64)
+
+
+def build_line_table(length=4):
+    """
+    Precomputes the linear conflict cost of every possible line.
+
+    A line is described by its cells in order: the goal position along the line of the tile in that cell,
+    or length if the tile doesn't belong to the line. The tiles that must leave the line to resolve all the
+    conflicts are those outside the longest increasing subsequence, and each of them costs 2 extra moves.
+    :param length: The number of cells of the line.
+    :return: An array of (length + 1)^length costs indexed by the line code.
+    """
+    weights = line_weights(length)
+    table = np.zeros((length + 1) ** length, dtype=np.int64)
+    for cells in itertools.product(range(length + 1), repeat=length):
+        in_line = [cell for cell in cells if cell != length]
+        code = int(np.dot(cells, weights))
+        table[code] = 2 * (len(in_line) - longest_increasing_subsequence(in_line))
+    return table
+
+
+class LinearConflictPuzzleGame:
+    """
+    Represents the linear conflict heuristic for the Fifteen Puzzle game.
+
+    Two tiles are in linear conflict when they are in the same row (or column), both have their goal position
+    in that row (or column) and they are in the reverse order: one of them must leave the line and come back,
+    which adds 2 moves to the Manhattan distance. The number of tiles that must leave a line is read from a
+    precomputed table, so the heuristic stays admissible.
+
+    Attributes:
+        goal_position (tuple): The goal configuration of the game board.
+        cols (int): The number of columns of the game board.
+        distances (np.ndarray): distances[tile, index] is the Manhattan distance of the tile at index from its goal.
+        row_codes (np.ndarray): row_codes[tile, index] is the cell value of the tile for the line table of its row.
+        col_codes (np.ndarray): col_codes[tile, index] is the cell value of the tile for the line table of its column.
+        row_table (np.ndarray): The linear conflict cost of every row code.
+        col_table (np.ndarray): The linear conflict cost of every column code.
+    """
+
+    def __init__(self, goal_position, cols=None):
+        """
+        Initializes the LinearConflictPuzzleGame heuristic with a goal position.
+        :param goal_position: The goal configuration of the game board.
+        :param cols: The number of columns of the game board. Defaults to a square board.
+        """
+        self.goal_position = goal_position
+        self.cols = cols if cols is not None else PuzzleGeometry.of_board(goal_position).cols
+        cells = len(goal_position)
+        rows = cells // self.cols
+        # A row has cols cells, so a tile outside the row has the code cols; the same for the columns.
+        self.distances = np.zeros((cells, cells), dtype=np.int64)
+        self.row_codes = np.full((cells, cells), self.cols, dtype=np.int64)
+        self.col_codes = np.full((cells, cells), rows, dtype=np.int64)
+        for tile in range(1, cells):
+            goal_row, goal_col = divmod(goal_position.index(tile), self.cols)
+            for i in range(cells):
+                row, col = divmod(i, self.cols)
+                self.distances[tile, i] = abs(row - goal_row) + abs(col - goal_col)
+                if row == goal_row:
+                    self.row_codes[tile, i] = goal_col
+                if col == goal_col:
+                    self.col_codes[tile, i] = goal_row
+        self.row_table, self.row_weights = build_line_table(self.cols), line_weights(self.cols)
+        self.col_table, self.col_weights = build_line_table(rows), line_weights(rows)
+        self.cells = np.arange(cells)
+        # Cell indexes of each row and each column, as (rows, cols) and (cols, rows) arrays.
+        self.row_cells = self.cells.reshape(rows, self.cols)
+        self.col_cells = self.row_cells.T
+
+    def h(self, state: StateFifteenPuzzleGame):
+        """
+        Computes the heuristic value for a given state: the Manhattan distance plus the linear conflicts.
+        :param state: The current state of the Fifteen Puzzle game.
+        :return: The heuristic value for the given state.
+        """
+        return self.h_board(state.game_representation.game_board)
+
+    def h_board(self, game_board):
+        """
+        Computes the linear conflict heuristic directly on a game board, without building a state.
+        :param game_board: The game board as a sequence of tiles.
+        :return: The heuristic value for the given game board.
+        """
+        return int(self.h_boards(np.array([game_board]))[0])
+
+    def h_batch(self, states):
+        """
+        Computes the heuristic values of several states with a single vectorized evaluation.
+        :param states: The states to evaluate, e.g. the children produced by FifteenPuzzleGame.neighbors.
+        :return: The list of heuristic values, in the same order as the states.
+        """
+        boards = np.array([state.game_representation.game_board for state in states])
+        return self.h_boards(boards).tolist()
+
+    def h_boards(self, boards):
+        """
+        Computes the heuristic values of an (N, cells) array of game boards.
+        :param boards: The game boards, one per row.
+        :return: An array with the N heuristic values.
+        """
+        boards = np.asarray(boards, dtype=np.int64)
+        manhattan = self.distances[boards, self.cells].sum(axis=1)
+        row_codes = self.row_codes[boards, self.cells]
+        col_codes = self.col_codes[boards, self.cells]
+        conflicts = np.zeros(len(boards), dtype=np.int64)
+        for line in self.row_cells:
+            conflicts += self.row_table[row_codes[:, line] @ self.row_weights]
+        for line in self.col_cells:
+            conflicts += self.col_table[col_codes[:, line] @ self.col_weights]
+        return manhattan + conflicts
@@ -1,3 +1,4 @@
+from PuzzleGeometry import PuzzleGeometry
 from homework1.fifteenpuzzlegame import StateFifteenPuzzleGame
 
 
@@ -9,42 +10,81 @@ class ManhattanDistancePuzzleGame:
     The Manhattan distance for a tile is the sum of the absolute values of the horizontal and vertical distances
     between the tile's current position and its goal position.
 
+    A slide changes the distance of the moved tile only, so when the parent state has already been evaluated
+    the heuristic value is computed as the parent's value plus the change of that single tile, read from a
+    precomputed lookup table.
+
     Attributes:
         goal_position (tuple): The goal configuration of the game board.
+        cols (int): The number of columns of the game board.
+        validate (bool): If True, every incremental value is checked against a full recomputation.
+        distances (list): distances[tile][index] is the Manhattan distance of the tile at index from its goal.
     """
 
-    def __init__(self, goal_position):
+    def __init__(self, goal_position, validate=False, cols=None):
         """
         Initializes the ManhattanDistancePuzzleGameOp heuristic with a goal position.
         :param goal_position: The goal configuration of the game board.
+        :param validate: If True, checks every incremental value against a full recomputation. Meant for tests.
+        :param cols: The number of columns of the game board. Defaults to a square board.
         """
         self.goal_position = goal_position
+        self.cols = cols if cols is not None else PuzzleGeometry.of_board(goal_position).cols
+        self.validate = validate
+        cells = len(goal_position)
+        self.distances = [[0] * cells for _ in range(cells)]
+        for tile in range(1, cells):
+            # Find the goal position of the tile and convert its index to (x, y) position.
+            goal_row, goal_col = self._index_to_position(goal_position.index(tile))
+            for i in range(cells):
+                row, col = self._index_to_position(i)
+                self.distances[tile][i] = abs(row - goal_row) + abs(col - goal_col)
 
     def h(self, state: StateFifteenPuzzleGame):
         """
         Computes the heuristic value for a given state based on the Manhattan distance of tiles.
 
-        The heuristic value is the sum of the Manhattan distances of each tile from its goal position.
+        The heuristic value is the sum of the Manhattan distances of each tile from its goal position. If the
+        parent state has a heuristic value, only the distance change of the moved tile is computed.
         :param state: The current state of the Fifteen Puzzle game.
         :return: The heuristic value for the given state.
         """
-        distance = 0  # Initialize the total distance to 0.
+        parent = state.state_parent
+        moved_tile = state.game_representation.moved_tile
+        if parent is None or parent.h is None or moved_tile is None:
+            return self.h_board(state.game_representation.game_board)
 
-        for i in range(16):
-            # Iterate through each tile on a 4x4 board (16 tiles in total).
-            if state.game_representation.game_board[i] == 0:  # Ignore the empty tile.
-                continue
+        # The moved tile slid from the current position of the empty tile to its position in the parent.
+        distance = parent.h + self.delta(moved_tile, state.game_representation.blank,
+                                         parent.game_representation.blank)
+        if self.validate:
+            full_distance = self.h_board(state.game_representation.game_board)
+            if distance != full_distance:
+                raise ValueError(f"Incremental Manhattan distance {distance} differs from the full "
+                                 f"recomputation {full_distance} for {state.game_representation}")
+        return distance
 
-            # Convert the current tile's index to its (x, y) position on the board.
-            current_position = self._index_to_position(i)
-            # Find the goal position of the current tile and convert its index to (x, y) position.
-            goal_position = self._index_to_position(self.goal_position.index(state.game_representation.game_board[i]))
+    def h_board(self, game_board):
+        """
+        Computes the Manhattan distance heuristic directly on a game board, without building a state.
 
-            # Calculate the Manhattan distance between the current position and the goal position.
-            # The Manhattan distance is the sum of the absolute differences of their coordinates.
-            distance += abs(current_position[0] - goal_position[0]) + abs(current_position[1] - goal_position[1])
+        Searches that apply moves in place on a mutable board (e.g. IDA*) use this entry point.
+        :param game_board: The game board as a sequence of tiles.
+        :return: The heuristic value for the given game board.
+        """
+        distances = self.distances
+        # The row of the empty tile (0) is all zeros, so it doesn't need to be skipped.
+        return sum(distances[tile][i] for i, tile in enumerate(game_board))
 
-        return distance  # Return the total Manhattan distance.
+    def delta(self, tile, from_index, to_index):
+        """
+        Computes the change of the heuristic value when a tile slides from one position to another.
+        :param tile: The tile that moves.
+        :param from_index: The index the tile leaves.
+        :param to_index: The index the tile reaches.
+        :return: The difference between the new and the old Manhattan distance of the tile.
+        """
+        return self.distances[tile][to_index] - self.distances[tile][from_index]
 
     def _index_to_position(self, index):
-        return index // 4, index % 4  # Returns the row and column as a tuple.
+        return index // self.cols, index % self.cols  # Returns the row and column as a tuple.
@@ -25,7 +25,15 @@ class MisplacedTittlesPuzzleGame:
         :param state: The current state of the Fifteen Puzzle game.
         :return: The heuristic value for the given state.
         """
+        return self.h_board(state.game_representation.game_board)
+
+    def h_board(self, game_board):
+        """
+        Computes the number of misplaced tiles directly on a game board, without building a state.
+        :param game_board: The game board as a sequence of tiles.
+        :return: The heuristic value for the given game board.
+        """
         return sum(
-            1 for s, g in zip(state.game_representation.game_board, self.goal_position)
+            1 for s, g in zip(game_board, self.goal_position)
             if s != g and s != 0
         )
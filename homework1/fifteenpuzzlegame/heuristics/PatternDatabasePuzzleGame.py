@@ -0,0 +1,159 @@
+import mmap
+import os
+import zlib
+
+import numpy as np
+
+from homework1.fifteenpuzzlegame import StateFifteenPuzzleGame
+
+# Disjoint partitions of the tiles. Each table takes 16^k bytes on disk for a pattern of k tiles and its
+# construction explores 16^(k+1) entries, so patterns are limited to 6 tiles.
+PATTERNS_5_5_5 = ((1, 2, 3, 5, 6), (4, 7, 8, 11, 12), (9, 10, 13, 14, 15))
+PATTERNS_6_6_3 = ((1, 5, 6, 9, 10, 13), (7, 8, 11, 12, 14, 15), (2, 3, 4))
+
+# The cells reached by the empty tile from each cell when moving up, down, left and right (-1 if not possible).
+MOVE_TARGETS = np.array([
+    [i - 4 if i >= 4 else -1 for i in range(16)],
+    [i + 4 if i < 12 else -1 for i in range(16)],
+    [i - 1 if i % 4 > 0 else -1 for i in range(16)],
+    [i + 1 if i % 4 < 3 else -1 for i in range(16)],
+], dtype=np.int64)
+
+UNVISITED = 255
+
+
+def build_pattern_table(goal_position, pattern):
+    """
+    Builds the table of a pattern with a retrograde breadth-first search from the goal configuration.
+
+    The search runs on abstract states made of the positions of the pattern tiles and of the empty tile.
+    A move that slides a pattern tile costs 1, a move that slides any other tile costs 0, so the distances are
+    additive across disjoint patterns. Each level is expanded with NumPy over all of its states at once.
+    The entry of a configuration is the minimum distance over all positions of the empty tile.
+
+    :param goal_position: The goal configuration of the game board.
+    :param pattern: The tiles of the pattern.
+    :return: A uint8 array of 16^k entries, indexed by the sum of position(pattern[i]) << 4i.
+    """
+    k = len(pattern)
+    blank_shift = 4 * k
+    pattern_mask = (1 << blank_shift) - 1
+    goal_index = sum(goal_position.index(tile) << (4 * i) for i, tile in enumerate(pattern))
+    goal_index |= goal_position.index(0) << blank_shift
+
+    distances = np.full(16 ** (k + 1), UNVISITED, dtype=np.uint8)
+    distances[goal_index] = 0
+
+    def expand(indices):
+        # Returns the successors reached by moving a tile outside the pattern (cost 0) and inside it (cost 1).
+        free, pattern_moves = [], []
+        blanks = indices >> blank_shift
+        for targets in MOVE_TARGETS:
+            target = targets[blanks]
+            valid = target >= 0
+            index, blank, target = indices[valid], blanks[valid], target[valid]
+            successor = (index & pattern_mask) | (target << blank_shift)
+            moved = np.zeros(index.shape, dtype=bool)
+            for i in range(k):
+                # The pattern tile on the target cell slides into the cell of the empty tile.
+                hit = ((index >> (4 * i)) & 15) == target
+                successor += np.where(hit, (blank - target) << (4 * i), 0)
+                moved |= hit
+            free.append(successor[~moved])
+            pattern_moves.append(successor[moved])
+        return np.concatenate(free), np.concatenate(pattern_moves)
+
+    level = 0
+    frontier = np.array([goal_index], dtype=np.int64)
+    while frontier.size:
+        # Close the level under the moves of free tiles, then step to the next level with the pattern moves.
+        current, next_candidates = frontier, []
+        while current.size:
+            free, pattern_moves = expand(current)
+            next_candidates.append(pattern_moves)
+            free = np.unique(free[distances[free] == UNVISITED])
+            distances[free] = level
+            current = free
+        candidates = np.concatenate(next_candidates)
+        frontier = np.unique(candidates[distances[candidates] == UNVISITED])
+        distances[frontier] = level + 1
+        level += 1
+
+    # The empty tile position is in the highest bits, so each row of the reshaped array is one of its positions.
+    return distances.reshape(16, 16 ** k).min(axis=0)
+
+
+class PatternDatabasePuzzleGame:
+    """
+    Represents a disjoint additive pattern database heuristic for the Fifteen Puzzle game.
+
+    The tiles are split into disjoint patterns. For each pattern a table stores the minimum number of moves of
+    the pattern tiles needed to bring them to their goal positions, ignoring the other tiles, and the heuristic
+    value is the sum of the table entries. The tables are built once by a retrograde breadth-first search,
+    stored as raw byte arrays and memory-mapped at load, so several solver processes share a single copy.
+
+    Attributes:
+        goal_position (tuple): The goal configuration of the game board.
+        patterns (tuple): The disjoint patterns of tiles.
+        cache_dir (str): The directory that holds the table files.
+        tables (list): The memory-mapped table of each pattern.
+    """
+
+    def __init__(self, goal_position, patterns=PATTERNS_5_5_5, cache_dir=None):
+        """
+        Initializes the PatternDatabasePuzzleGame heuristic, building the missing tables.
+        :param goal_position: The goal configuration of the game board.
+        :param patterns: The disjoint patterns of tiles. Defaults to a 5-5-5 partition.
+        :param cache_dir: The directory that holds the table files. Defaults to the pdb folder next to this module.
+        """
+        if len(goal_position) != 16:
+            raise ValueError(f"The pattern tables are only available for the 4x4 board, "
+                             f"not for a board of {len(goal_position)} cells")
+        self.goal_position = goal_position
+        self.patterns = patterns
+        self.cache_dir = cache_dir
+        if self.cache_dir is None:
+            self.cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdb")
+        self.tables = [self.__load_table(pattern) for pattern in patterns]
+        # For each pattern, the (tile, shift) pairs that compose its table index.
+        self.shifts = [[(tile, 4 * i) for i, tile in enumerate(pattern)] for pattern in patterns]
+
+    def __load_table(self, pattern):
+        """
+        Memory-maps the table of a pattern, building and writing it first if the file doesn't exist.
+        :param pattern: The tiles of the pattern.
+        :return: The read-only memory map of the table.
+        """
+        goal_id = zlib.crc32(bytes(self.goal_position))
+        path = os.path.join(self.cache_dir, f"pdb_{'-'.join(map(str, pattern))}_{goal_id:08x}.bin")
+        if not os.path.exists(path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            table = build_pattern_table(self.goal_position, pattern)
+            # Write to a temporary file first, so other processes never map a partially written table.
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            table.tofile(temporary_path)
+            os.replace(temporary_path, path)
+        with open(path, "rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def h(self, state: StateFifteenPuzzleGame):
+        """
+        Computes the heuristic value for a given state as the sum of the pattern database entries.
+        :param state: The current state of the Fifteen Puzzle game.
+        :return: The heuristic value for the given state.
+        """
+        return self.h_board(state.game_representation.game_board)
+
+    def h_board(self, game_board):
+        """
+        Computes the pattern database heuristic directly on a game board, without building a state.
+        :param game_board: The game board as a sequence of 16 tiles.
+        :return: The heuristic value for the given game board.
+        """
+        positions = [0] * 16
+        for i, tile in enumerate(game_board):
+            positions[tile] = i
+        distance = 0
+        for table, shifts in zip(self.tables, self.shifts):
+            distance += table[sum(positions[tile] << shift for tile, shift in shifts)]
+        return distance
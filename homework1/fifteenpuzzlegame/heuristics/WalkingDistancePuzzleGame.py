@@ -0,0 +1,146 @@
+from collections import deque
+
+import numpy as np
+
+from homework1.fifteenpuzzlegame import StateFifteenPuzzleGame
+
+# Weight of the line of the empty tile in a configuration code; the 16 counts use the weights 5^0..5^15.
+BLANK_WEIGHT = 5 ** 16
+
+
+def encode(counts, blank_line):
+    """
+    Encodes a walking distance configuration as an integer.
+    :param counts: counts[i][j] is the number of tiles in line i whose goal line is j.
+    :param blank_line: The line of the empty tile.
+    :return: The code of the configuration.
+    """
+    code = 0
+    for i in range(4):
+        for j in range(4):
+            code += counts[i][j] * 5 ** (4 * i + j)
+    return code + blank_line * BLANK_WEIGHT
+
+
+def build_walking_distance_table(goal_counts, goal_blank_line):
+    """
+    Computes the walking distance of every configuration with a breadth-first search from the goal one.
+
+    A configuration only records, for each line, how many tiles of each goal line it contains and where
+    the empty tile is. A vertical move swaps the empty tile with any tile of an adjacent line.
+    :param goal_counts: The counts of the goal configuration.
+    :param goal_blank_line: The line of the empty tile in the goal configuration.
+    :return: The sorted array of configuration codes and the array of their distances.
+    """
+    start = (tuple(tuple(line) for line in goal_counts), goal_blank_line)
+    distances = {encode(*start): 0}
+    queue = deque([start])
+    while queue:
+        counts, blank_line = queue.popleft()
+        distance = distances[encode(counts, blank_line)]
+        for next_line in (blank_line - 1, blank_line + 1):
+            if not 0 <= next_line < 4:
+                continue
+            for goal_line in range(4):
+                if counts[next_line][goal_line] == 0:
+                    continue
+                # A tile of goal_line slides from next_line into the line of the empty tile.
+                new_counts = [list(line) for line in counts]
+                new_counts[next_line][goal_line] -= 1
+                new_counts[blank_line][goal_line] += 1
+                new_counts = tuple(tuple(line) for line in new_counts)
+                code = encode(new_counts, next_line)
+                if code not in distances:
+                    distances[code] = distance + 1
+                    queue.append((new_counts, next_line))
+    codes = np.array(sorted(distances), dtype=np.int64)
+    return codes, np.array([distances[code] for code in codes.tolist()], dtype=np.int64)
+
+
+class WalkingDistancePuzzleGame:
+    """
+    Represents the walking distance heuristic for the Fifteen Puzzle game.
+
+    The vertical walking distance is the number of vertical moves needed to bring every tile to its goal row
+    when only the row of each tile matters, which is a much smaller puzzle whose distances are precomputed once
+    by a breadth-first search. The horizontal walking distance is the same on the columns. Vertical and
+    horizontal moves are disjoint, so their sum is admissible and dominates the Manhattan distance.
+
+    Attributes:
+        goal_position (tuple): The goal configuration of the game board.
+        tables (list): For the rows and the columns, the pair (sorted configuration codes, distances).
+        weights (list): For the rows and the columns, weights[tile, index] is the contribution of the tile at
+                        index to the configuration code.
+    """
+
+    # The tables only depend on the goal configuration, so they are shared between instances.
+    cache = {}
+
+    def __init__(self, goal_position):
+        """
+        Initializes the WalkingDistancePuzzleGame heuristic with a goal position.
+        :param goal_position: The goal configuration of the game board.
+        """
+        if len(goal_position) != 16:
+            raise ValueError(f"The walking distance tables are only available for the 4x4 board, "
+                             f"not for a board of {len(goal_position)} cells")
+        self.goal_position = goal_position
+        self.tables = []
+        self.weights = []
+        for line_of in (lambda i: i // 4, lambda i: i % 4):  # Rows for the vertical distance, then columns.
+            goal_counts = [[0] * 4 for _ in range(4)]
+            for i, tile in enumerate(goal_position):
+                if tile != 0:
+                    goal_counts[line_of(i)][line_of(i)] += 1
+            key = (tuple(map(tuple, goal_counts)), line_of(goal_position.index(0)))
+            if key not in self.cache:
+                self.cache[key] = build_walking_distance_table(goal_counts, line_of(goal_position.index(0)))
+            self.tables.append(self.cache[key])
+
+            weights = np.zeros((16, 16), dtype=np.int64)
+            for i in range(16):
+                weights[0, i] = line_of(i) * BLANK_WEIGHT
+            for tile in range(1, 16):
+                goal_line = line_of(goal_position.index(tile))
+                for i in range(16):
+                    weights[tile, i] = 5 ** (4 * line_of(i) + goal_line)
+            self.weights.append(weights)
+        self.cells = np.arange(16)
+
+    def h(self, state: StateFifteenPuzzleGame):
+        """
+        Computes the heuristic value for a given state: the vertical plus the horizontal walking distance.
+        :param state: The current state of the Fifteen Puzzle game.
+        :return: The heuristic value for the given state.
+        """
+        return self.h_board(state.game_representation.game_board)
+
+    def h_board(self, game_board):
+        """
+        Computes the walking distance heuristic directly on a game board, without building a state.
+        :param game_board: The game board as a sequence of 16 tiles.
+        :return: The heuristic value for the given game board.
+        """
+        return int(self.h_boards(np.array([game_board]))[0])
+
+    def h_batch(self, states):
+        """
+        Computes the heuristic values of several states with a single vectorized evaluation.
+        :param states: The states to evaluate, e.g. the children produced by FifteenPuzzleGame.neighbors.
+        :return: The list of heuristic values, in the same order as the states.
+        """
+        boards = np.array([state.game_representation.game_board for state in states])
+        return self.h_boards(boards).tolist()
+
+    def h_boards(self, boards):
+        """
+        Computes the heuristic values of an (N, 16) array of game boards.
+        :param boards: The game boards, one per row.
+        :return: An array with the N heuristic values.
+        """
+        boards = np.asarray(boards, dtype=np.int64)
+        distance = np.zeros(len(boards), dtype=np.int64)
+        for (codes, distances), weights in zip(self.tables, self.weights):
+            board_codes = weights[boards, self.cells].sum(axis=1)
+            distance += distances[np.searchsorted(codes, board_codes)]
+        return distance
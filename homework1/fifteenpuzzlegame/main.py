@@ -4,7 +4,10 @@ from Agent import Agent
 from FifteenPuzzleGame import FifteenPuzzleGame
 from StateFifteenPuzzleGame import StateFifteenPuzzleGame
 from algoritms.AStar import AStar
+from algoritms.AnytimeAStar import AnytimeAStar
 from algoritms.BestFirst import BestFirst
+from algoritms.BidirectionalAStar import BidirectionalAStar
+from algoritms.IDAStar import IDAStar
 from heuristics.ManhattanDistancePuzzleGame import ManhattanDistancePuzzleGame
 from heuristics.MisplacedTilesPuzzleGame import MisplacedTittlesPuzzleGame
 
@@ -26,6 +29,11 @@ def main_fifteen_puzzle_game():
     run_agent("AStar", "ManhattanDistance", AStar(FifteenPuzzleGame(), heuristics), StateFifteenPuzzleGame())
     run_agent("BestFirst", "MisplacedTittles", BestFirst(FifteenPuzzleGame(), heuristics1), StateFifteenPuzzleGame())
     run_agent("AStar", "MisplacedTittles", AStar(FifteenPuzzleGame(), heuristics1), StateFifteenPuzzleGame())
+    run_agent("IDAStar", "ManhattanDistance", IDAStar(FifteenPuzzleGame(), heuristics), StateFifteenPuzzleGame())
+    run_agent("BidirectionalAStar", "ManhattanDistance", BidirectionalAStar(FifteenPuzzleGame(), heuristics),
+              StateFifteenPuzzleGame())
+    run_agent("AnytimeAStar", "ManhattanDistance", AnytimeAStar(FifteenPuzzleGame(), heuristics, time_budget=1.0),
+              StateFifteenPuzzleGame())
 
 
 def run_agent(search_algorithm_name, heuristics_name, search_algorithm, state):
@@ -59,13 +67,28 @@ def run_agent(search_algorithm_name, heuristics_name, search_algorithm, state):
         if s.move is not None:
             print(f"The empty square was moved towards: {s.move}")
         print(f"h(n) = {s.h}")
-        if search_algorithm_name == "AStar":
+        if search_algorithm_name in ("AStar", "IDAStar", "BidirectionalAStar", "AnytimeAStar"):
             print(f"g(n) = {s.g}")
             print(f"f(n) = {s.f}")
         print()
     print(f"Number of steps {n}")
-    print(f"HORIZON: {len(search_algorithm.horizon)}")
-    print(f"VISITED: {len(search_algorithm.explored)} \n")
+    if isinstance(search_algorithm, IDAStar):
+        for i, iteration in enumerate(search_algorithm.iterations):
+            print(f"Iteration {i + 1}: threshold={iteration['threshold']} nodes={iteration['nodes']} "
+                  f"nodes/sec={iteration['nodes_per_sec']:.0f}")
+        print(f"VISITED: {search_algorithm.nodes_count} \n")
+    elif isinstance(search_algorithm, BidirectionalAStar):
+        print(f"HORIZON: forward {len(search_algorithm.horizon[0])}, backward {len(search_algorithm.horizon[1])}")
+        print(f"VISITED: forward {len(search_algorithm.explored[0])}, backward {len(search_algorithm.explored[1])} \n")
+    elif isinstance(search_algorithm, AnytimeAStar):
+        for solution in search_algorithm.solutions:
+            print(f"Weight {solution['weight']:.2f}: cost={solution['cost']} bound={solution['bound']:.3f} "
+                  f"expansions={solution['expansions']} time={solution['time'] * 1000:.0f}ms")
+        print(f"BOUND: {search_algorithm.bound:.3f}")
+        print(f"VISITED: {search_algorithm.expansions} \n")
+    else:
+        print(f"HORIZON: {len(search_algorithm.horizon)}")
+        print(f"VISITED: {len(search_algorithm.explored)} \n")
     print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~\n")
 
 
@@ -0,0 +1,82 @@
+import os
+import sys
+import unittest
+
+# The modules of the game import each other by their name in the fifteenpuzzlegame folder, and the heuristics by
+# their path from the root of the repository.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from FifteenPuzzleGame import FifteenPuzzleGame  # noqa: E402
+from FifteenPuzzleRepresentation import FifteenPuzzleRepresentation  # noqa: E402
+from StateFifteenPuzzleGame import StateFifteenPuzzleGame  # noqa: E402
+from algoritms.AnytimeAStar import AnytimeAStar  # noqa: E402
+from algoritms.IDAStar import IDAStar  # noqa: E402
+from heuristics.ManhattanDistancePuzzleGame import ManhattanDistancePuzzleGame  # noqa: E402
+
+# Boards 20 to 34 moves away from the end-game board, where the first search (weight 3) finds a longer solution.
+BOARDS = [
+    (6, 1, 0, 8, 5, 9, 4, 3, 13, 7, 2, 15, 11, 10, 12, 14),
+    (1, 7, 3, 4, 5, 10, 6, 8, 2, 9, 11, 12, 13, 0, 14, 15),
+    (5, 8, 4, 12, 1, 0, 2, 7, 10, 9, 3, 15, 6, 13, 14, 11),
+    (0, 6, 3, 2, 1, 10, 4, 7, 5, 14, 11, 8, 9, 13, 15, 12),
+]
+
+
+def start_state(board):
+    """
+    Builds the start state of a board.
+    :param board: The start game board.
+    :return: The state of the board, without parent.
+    """
+    return StateFifteenPuzzleGame(game_representation=FifteenPuzzleRepresentation(game_board=board))
+
+
+def path_length(state):
+    """
+    Counts the moves of a solution by following state_parent.
+    :param state: The end-game state returned by the search.
+    :return: The number of moves of the solution.
+    """
+    moves = 0
+    while state.state_parent is not None:
+        state = state.state_parent
+        moves += 1
+    return moves
+
+
+class TestAnytimeAStar(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.heuristic = ManhattanDistancePuzzleGame(FifteenPuzzleRepresentation().end_game_board)
+        cls.optimal = {board: IDAStar(FifteenPuzzleGame(), cls.heuristic).search(start_state(board)).g
+                       for board in BOARDS}
+
+    def test_solutions_within_bound(self):
+        for board in BOARDS:
+            search_algorithm = AnytimeAStar(FifteenPuzzleGame(), self.heuristic, time_budget=None)
+            state = search_algorithm.search(start_state(board))
+            optimal = self.optimal[board]
+            self.assertGreater(search_algorithm.solutions[0]["cost"], optimal)
+            for solution in search_algorithm.solutions:
+                self.assertGreaterEqual(solution["bound"], 1.0)
+                self.assertLessEqual(solution["cost"], solution["bound"] * optimal)
+            # Without a time budget, the refinement goes on until the solution is proven optimal.
+            self.assertEqual(search_algorithm.bound, 1.0)
+            self.assertEqual(state.g, optimal)
+            self.assertEqual(path_length(state), optimal)
+
+    def test_interrupted_search_within_bound(self):
+        # With no time for the refinement, the search returns its first solution with the bound of its weight.
+        for board in BOARDS:
+            search_algorithm = AnytimeAStar(FifteenPuzzleGame(), self.heuristic, time_budget=0)
+            state = search_algorithm.search(start_state(board))
+            self.assertEqual(len(search_algorithm.solutions), 1)
+            self.assertLessEqual(search_algorithm.bound, search_algorithm.initial_weight)
+            self.assertLessEqual(state.g, search_algorithm.bound * self.optimal[board])
+            self.assertEqual(path_length(state), state.g)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import sys
+import unittest
+
+# The modules of the game import each other by their name in the fifteenpuzzlegame folder, and the heuristics by
+# their path from the root of the repository.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from FifteenPuzzleGame import FifteenPuzzleGame  # noqa: E402
+from FifteenPuzzleRepresentation import FifteenPuzzleRepresentation  # noqa: E402
+from StateFifteenPuzzleGame import StateFifteenPuzzleGame  # noqa: E402
+from algoritms.BestFirst import BestFirst  # noqa: E402
+from algoritms.BidirectionalAStar import BidirectionalAStar  # noqa: E402
+from algoritms.IDAStar import IDAStar  # noqa: E402
+from heuristics.ManhattanDistancePuzzleGame import ManhattanDistancePuzzleGame  # noqa: E402
+from heuristics.PatternDatabasePuzzleGame import PatternDatabasePuzzleGame  # noqa: E402
+
+# Boards a few moves away from the end-game board.
+BOARDS = [
+    (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 0, 15),
+    (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 0, 11, 13, 14, 15, 12),
+    (1, 2, 3, 4, 5, 0, 6, 8, 9, 10, 7, 11, 13, 14, 15, 12),
+    (5, 1, 2, 3, 9, 6, 7, 4, 13, 10, 11, 8, 0, 14, 15, 12),
+]
+
+# Boards 10 to 22 moves away from the end-game board, where the first solution reached by BestFirst is not optimal.
+DEEP_BOARDS = [
+    (1, 2, 3, 4, 5, 6, 8, 15, 9, 10, 7, 11, 13, 14, 12, 0),
+    (6, 1, 0, 4, 5, 2, 3, 8, 13, 9, 7, 15, 11, 10, 12, 14),
+    (1, 7, 3, 4, 5, 10, 6, 8, 2, 9, 11, 12, 13, 14, 15, 0),
+]
+
+
+def solve(search_algorithm, board):
+    """
+    Runs a search until the end-game board and counts the moves of the solution.
+    :param search_algorithm: The search algorithm.
+    :param board: The start game board.
+    :return: The number of moves of the solution.
+    """
+    state = StateFifteenPuzzleGame(game_representation=FifteenPuzzleRepresentation(game_board=board))
+    while not state.is_end_game():
+        state = search_algorithm.search(state)
+    moves = 0
+    while state.state_parent is not None:
+        state = state.state_parent
+        moves += 1
+    return moves
+
+
+def optimal_length(board):
+    """
+    Computes the length of the optimal solution of a board with IDAStar and the Manhattan distance.
+    :param board: The start game board.
+    :return: The number of moves of the optimal solution.
+    """
+    goal = FifteenPuzzleRepresentation().end_game_board
+    state = StateFifteenPuzzleGame(game_representation=FifteenPuzzleRepresentation(game_board=board))
+    return IDAStar(FifteenPuzzleGame(), ManhattanDistancePuzzleGame(goal)).search(state).g
+
+
+class TestBidirectionalAStar(unittest.TestCase):
+
+    def test_pattern_database_writes_no_tables(self):
+        # The tables of the end-game board are built, if missing, before listing the cache.
+        heuristic = PatternDatabasePuzzleGame(FifteenPuzzleRepresentation().end_game_board)
+        tables = set(os.listdir(heuristic.cache_dir))
+        for board in BOARDS:
+            solve(BidirectionalAStar(FifteenPuzzleGame(), heuristic), board)
+        self.assertEqual(tables, set(os.listdir(heuristic.cache_dir)))
+
+    def test_deep_boards_have_longer_first_solutions(self):
+        # A search returning the first solution it reaches would fail test_solutions_are_optimal on these boards.
+        goal = FifteenPuzzleRepresentation().end_game_board
+        for board in DEEP_BOARDS:
+            self.assertGreater(solve(BestFirst(FifteenPuzzleGame(), ManhattanDistancePuzzleGame(goal)), board),
+                               optimal_length(board))
+
+    def test_solutions_are_optimal(self):
+        goal = FifteenPuzzleRepresentation().end_game_board
+        for heuristic in (ManhattanDistancePuzzleGame(goal), PatternDatabasePuzzleGame(goal)):
+            for board in BOARDS + DEEP_BOARDS:
+                self.assertEqual(optimal_length(board),
+                                 solve(BidirectionalAStar(FifteenPuzzleGame(), heuristic), board))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import random
+import sys
+import unittest
+
+# The modules of the game import each other by their name in the fifteenpuzzlegame folder, and the heuristics by
+# their path from the root of the repository.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from FifteenPuzzleGame import FifteenPuzzleGame  # noqa: E402
+from FifteenPuzzleRepresentation import FifteenPuzzleRepresentation  # noqa: E402
+from PuzzleGeometry import PuzzleGeometry  # noqa: E402
+from StateFifteenPuzzleGame import StateFifteenPuzzleGame  # noqa: E402
+from algoritms.IDAStar import IDAStar  # noqa: E402
+from heuristics.LinearConflictPuzzleGame import LinearConflictPuzzleGame  # noqa: E402
+from heuristics.ManhattanDistancePuzzleGame import ManhattanDistancePuzzleGame  # noqa: E402
+
+
+def breadth_first_distances(geometry, max_depth=None):
+    """
+    Computes the number of moves of the optimal solution of the boards around the end-game board, with a
+    breadth-first search from it.
+    :param geometry: The geometry of the boards.
+    :param max_depth: The distance at which the search stops, None to reach every solvable board.
+    :return: A dictionary from each reached game board to its distance from the end-game board.
+    """
+    root = FifteenPuzzleRepresentation(game_board=geometry.end_game_board, geometry=geometry)
+    distances = {root.game_board: 0}
+    frontier = [root]
+    depth = 0
+    while frontier and (max_depth is None or depth < max_depth):
+        depth += 1
+        next_frontier = []
+        for representation in frontier:
+            for child in (representation.move_up(), representation.move_down(), representation.move_left(),
+                          representation.move_right()):
+                if child is not None and child.game_board not in distances:
+                    distances[child.game_board] = depth
+                    next_frontier.append(child)
+        frontier = next_frontier
+    return distances
+
+
+def solution_path(state):
+    """
+    Lists the game boards of a solution, from the start board to the end-game board.
+    :param state: The end-game state returned by the search.
+    :return: The list of the game boards along state_parent.
+    """
+    boards = []
+    while state is not None:
+        boards.append(state.game_representation.game_board)
+        state = state.state_parent
+    return boards[::-1]
+
+
+class TestIDAStar(unittest.TestCase):
+
+    def assert_optimal(self, geometry, distances, boards):
+        goal = geometry.end_game_board
+        for heuristic in (ManhattanDistancePuzzleGame(goal), LinearConflictPuzzleGame(goal)):
+            for board in boards:
+                state = StateFifteenPuzzleGame(
+                    game_representation=FifteenPuzzleRepresentation(game_board=board, geometry=geometry))
+                end_state = IDAStar(FifteenPuzzleGame(), heuristic).search(state)
+                path = solution_path(end_state)
+                self.assertEqual(end_state.g, distances[board])
+                self.assertEqual(len(path) - 1, distances[board])
+                self.assertEqual((path[0], path[-1]), (board, goal))
+                # Each board of the path is one move away from the previous one.
+                for parent, child in zip(path, path[1:]):
+                    representation = FifteenPuzzleRepresentation(game_board=parent, geometry=geometry)
+                    self.assertIn(child, [neighbor.game_board for neighbor in (
+                        representation.move_up(), representation.move_down(), representation.move_left(),
+                        representation.move_right()) if neighbor is not None])
+
+    def test_eight_puzzle_solutions_are_optimal(self):
+        # Every solvable 8-puzzle board is reached by the breadth-first search: the deepest ones are 31 moves away.
+        geometry = PuzzleGeometry.of(3, 3)
+        distances = breadth_first_distances(geometry)
+        deep = sorted(board for board, distance in distances.items() if distance >= 24)
+        self.assert_optimal(geometry, distances, random.Random(3).sample(deep, 10))
+
+    def test_fifteen_puzzle_solutions_are_optimal(self):
+        geometry = PuzzleGeometry.of(4, 4)
+        distances = breadth_first_distances(geometry, max_depth=14)
+        deep = sorted(board for board, distance in distances.items() if distance >= 12)
+        self.assert_optimal(geometry, distances, random.Random(5).sample(deep, 10))
+
+    def test_end_game_board(self):
+        goal = FifteenPuzzleRepresentation().end_game_board
+        state = StateFifteenPuzzleGame(game_representation=FifteenPuzzleRepresentation(game_board=goal))
+        self.assertEqual(IDAStar(FifteenPuzzleGame(), ManhattanDistancePuzzleGame(goal)).search(state).g, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
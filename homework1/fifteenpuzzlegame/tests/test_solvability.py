@@ -0,0 +1,117 @@
+import os
+import random
+import sys
+import unittest
+
+import numpy as np
+
+# The modules of the game import each other by their name in the fifteenpuzzlegame folder.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from FifteenPuzzleRepresentation import FifteenPuzzleRepresentation, count_inversions, solvable_boards  # noqa: E402
+from PuzzleGeometry import PuzzleGeometry  # noqa: E402
+
+# The geometries of the random boards: the 8, 15 and 24-puzzles and a rectangular board with an even number of columns.
+GEOMETRIES = [PuzzleGeometry.of(3, 3), PuzzleGeometry.of(4, 4), PuzzleGeometry.of(5, 5), PuzzleGeometry.of(3, 4)]
+
+
+def brute_force_inversions(game_board):
+    """
+    Counts the inversions of a game board by comparing every pair of tiles, ignoring the empty tile.
+    :param game_board: The game board as a sequence of tiles.
+    :return: The number of pairs of tiles in the wrong order.
+    """
+    tiles = [tile for tile in game_board if tile]
+    return sum(1 for i in range(len(tiles)) for j in range(i + 1, len(tiles)) if tiles[i] > tiles[j])
+
+
+def brute_force_solvable(game_board, geometry):
+    """
+    Determines whether a board is solvable from its brute-force inversion count: with an odd number of columns its
+    inversions have the parity of those of the end-game board, with an even number its inversions plus the row of
+    the empty tile do.
+    :param game_board: The game board.
+    :param geometry: The geometry of the board.
+    :return: True if the board is solvable.
+    """
+    def parity(board):
+        inversions = brute_force_inversions(board)
+        if geometry.cols % 2 == 0:
+            inversions += board.index(0) // geometry.cols
+        return inversions % 2
+
+    return parity(tuple(game_board)) == parity(geometry.end_game_board)
+
+
+def scramble(geometry, moves, rng):
+    """
+    Generates a solvable board by applying random moves to the end-game board.
+    :param geometry: The geometry of the board.
+    :param moves: The number of random moves.
+    :param rng: The random generator.
+    :return: The scrambled game board.
+    """
+    representation = FifteenPuzzleRepresentation(game_board=geometry.end_game_board, geometry=geometry)
+    for _ in range(moves):
+        representation = rng.choice([child for child in (representation.move_up(), representation.move_down(),
+                                                         representation.move_left(), representation.move_right())
+                                     if child is not None])
+    return representation.game_board
+
+
+def swap_tiles(game_board):
+    """
+    Swaps the first two tiles of a board that are not empty, which makes a solvable board unsolvable.
+    :param game_board: The game board.
+    :return: The game board with the two tiles swapped.
+    """
+    board = list(game_board)
+    first, second = [index for index, tile in enumerate(board) if tile][:2]
+    board[first], board[second] = board[second], board[first]
+    return tuple(board)
+
+
+class TestSolvability(unittest.TestCase):
+
+    def test_count_inversions_matches_brute_force(self):
+        rng = np.random.default_rng(7)
+        for geometry in GEOMETRIES:
+            for _ in range(200):
+                board = tuple(rng.permutation(geometry.cells).tolist())
+                expected = brute_force_inversions(board)
+                self.assertEqual(count_inversions(board), expected)
+                self.assertEqual(FifteenPuzzleRepresentation(game_board=board, geometry=geometry).count_inversions(),
+                                 expected)
+
+    def test_solvable_boards_matches_reachable_boards(self):
+        # Every board reachable from the end-game board is solvable, and swapping two tiles makes it unsolvable.
+        rng = random.Random(11)
+        for geometry in GEOMETRIES:
+            solvable = [scramble(geometry, rng.randrange(200), rng) for _ in range(100)]
+            boards = solvable + [swap_tiles(board) for board in solvable]
+            expected = [True] * len(solvable) + [False] * len(solvable)
+            self.assertEqual(solvable_boards(np.array(boards), geometry).tolist(), expected)
+            self.assertEqual([FifteenPuzzleRepresentation(game_board=board, geometry=geometry).game_is_solvable()
+                              for board in boards], expected)
+
+    def test_solvable_boards_matches_brute_force(self):
+        rng = np.random.default_rng(13)
+        for geometry in GEOMETRIES:
+            boards = np.array([rng.permutation(geometry.cells) for _ in range(500)])
+            expected = [brute_force_solvable(board.tolist(), geometry) for board in boards]
+            self.assertEqual(solvable_boards(boards, geometry).tolist(), expected)
+            self.assertEqual([FifteenPuzzleRepresentation(game_board=tuple(board.tolist()), geometry=geometry)
+                              .game_is_solvable() for board in boards], expected)
+            # Half of the permutations are solvable.
+            self.assertTrue(0.4 < np.mean(expected) < 0.6)
+
+    def test_solvable_boards_of_empty_batch(self):
+        for geometry in (None, PuzzleGeometry.of(3, 3)):
+            solvable = solvable_boards(np.zeros((0, 9), dtype=np.int64), geometry)
+            self.assertEqual(solvable.dtype, bool)
+            self.assertEqual(solvable.shape, (0,))
+        self.assertEqual(solvable_boards([]).shape, (0,))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,9 @@
+import time
+
+from chessgame.StateChessGame import StateChessGame
+from chessgame.ZobristHash import push_move
+
+
 class Agent:
     """
     Represents an agent that can act based on a given search algorithm and its current view of the world.
@@ -6,25 +12,61 @@ class Agent:
         search_algorithm: A search algorithm that the agent uses to make decisions.
         view: The agent's current view of the world.
         old_view: The agent's previous view of the world.
+        probe (Probe): The opening book and tablebases looked up before searching, None to always search.
+        search_count (int): Count of the moves chosen by the search algorithm.
+        search_time (float): The seconds spent by the search algorithm.
     """
 
-    def __init__(self, search_algorithm, initial_state):
+    def __init__(self, search_algorithm, initial_state, probe=None):
         """
         Initializes the Agent with a search algorithm and an initial state.
 
         :param search_algorithm: The search algorithm to be used by the agent.
         :param initial_state: The initial state of the world as perceived by the agent.
+        :param probe: The opening book and tablebases looked up before searching. Defaults to None.
         """
         self.search_algorithm = search_algorithm
         self.view = initial_state
         self.old_view = None
+        self.probe = probe
+        self.search_count = 0
+        self.search_time = 0.0
 
     def do_action(self, current_state_world):
         """
         Updates the agent's view based on the current state of the world and the search algorithm.
+        The move is taken from the probe when it knows the position, and searched otherwise.
         :param current_state_world: The current state of the world.
         :return: The updated view of the agent.
         """
-        self.view = self.search_algorithm.search(current_state_world)
+        probe_start = time.perf_counter()
+        move = self.probe.probe(current_state_world.game_board) if self.probe is not None else None
+        if move is not None:
+            game_board = current_state_world.game_board.copy()
+            key = push_move(game_board, current_state_world.key, move)
+            self.view = StateChessGame(game_board=game_board, state_parent=current_state_world, move=move, key=key)
+            # A search with a clock (IterativeDeepening) is charged the time of the probe, and gets its increment.
+            clock = getattr(self.search_algorithm, "clock", None)
+            if clock is not None:
+                clock.spend(time.perf_counter() - probe_start)
+        else:
+            # The search time leaves out the failed probe, which the probe counts in its own probe_time.
+            search_start = time.perf_counter()
+            self.view = self.search_algorithm.search(current_state_world)
+            self.search_time += time.perf_counter() - search_start
+            self.search_count += 1
         self.old_view = current_state_world
         return self.view
+
+    def time_saved(self):
+        """
+        Estimates the time saved by the probe: the moves it served, at the average time of the searched moves, less
+        the time spent probing.
+
+        :return: The seconds saved, 0 without a probe.
+        """
+        if self.probe is None:
+            return 0.0
+        probed = self.probe.book_moves + self.probe.tablebase_moves
+        average = self.search_time / self.search_count if self.search_count else 0.0
+        return probed * average - self.probe.probe_time
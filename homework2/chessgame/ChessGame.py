@@ -1,6 +1,7 @@
 import chess
 
 from chessgame.StateChessGame import StateChessGame
+from chessgame.ZobristHash import push_move
 
 
 class ChessGame:
@@ -33,15 +34,23 @@ class ChessGame:
 
         # Iterate through all legal moves from the current state.
         for legal_move in state.game_board.legal_moves:
-            # Copy the current game board and make the legal move.
-            new_game_board = state.game_board.copy()
-            new_game_board.push(legal_move)
-
-            # Create a new StateChessGame object for the resulting game state.
-            neighbor = StateChessGame(game_board=new_game_board, state_parent=state, move=legal_move)
-            neighbors.append(neighbor)
+            neighbors.append(self.child(state, legal_move))
         return neighbors
 
+    def child(self, state: StateChessGame, move):
+        """
+        Generates the state reached by playing a legal move, without changing the given state.
+
+        :param state: The current state of the chess game.
+        :param move: A legal move of the current state.
+        :return: The StateChessGame object of the resulting game state.
+        """
+        # Copy the current game board and make the legal move, updating the Zobrist key incrementally.
+        new_game_board = state.game_board.copy()
+        key = push_move(new_game_board, state.key, move)
+
+        # Create a new StateChessGame object for the resulting game state.
+        return StateChessGame(game_board=new_game_board, state_parent=state, move=move, key=key)
 
     def get_name_winner_player(self, game_board):
         """
@@ -1,5 +1,7 @@
 import chess
 
+from chessgame.ZobristHash import zobrist_hash
+
 
 class StateChessGame:
     """
@@ -13,15 +15,18 @@ class StateChessGame:
         h0 (float): Heuristic value used for h0 cutoff.
         hl (float): Heuristic value used for hl cutoff.
         hr (float): Heuristic value for the cut of the nonlinear regressor.
+        key (int): The 64-bit Zobrist key of the board, which also covers the side to move, the castling rights and
+            en passant.
     """
 
-    def __init__(self, game_board=None, state_parent=None, move=None):
+    def __init__(self, game_board=None, state_parent=None, move=None, key=None):
         """
         Initializes a new game state.
 
         :param game_board: The current chess board configuration. If None, initializes a new chess board.
         :param state_parent: The parent state from which this state is derived.
         :param move: The move that led to this state.
+        :param key: The Zobrist key of the board, if already computed incrementally. Computed from scratch otherwise.
         """
         self.game_board = game_board  # The current chess board (chess.Board object).
         self.parent_state = state_parent  # The parent state from which this state is derived.
@@ -34,18 +39,19 @@ class StateChessGame:
         # If no game board is provided, initialize a new chess board.
         if self.game_board is None:
             self.game_board = chess.Board()
+        self.key = key if key is not None else zobrist_hash(self.game_board)
 
     def __eq__(self, other):
         """
-        Checks if this state is equal to another state. States are considered equal if they have the same game
-        board configuration.
+        Checks if this state is equal to another state. States are considered equal if they have the same Zobrist
+        key, i.e. the same pieces, side to move, castling rights and en passant file.
 
         :param other: The other StateChessGame object to compare with.
         :return: True if the states are equal, False otherwise.
         """
         if not isinstance(other, StateChessGame):
             return False
-        return self.game_board == other.game_board
+        return self.key == other.key
 
     def __ne__(self, other):
         """
@@ -58,9 +64,9 @@ class StateChessGame:
 
     def __hash__(self):
         """
-        Generates a hash for the state. This is based on the string representation of the game board, allowing the state
-        to be used in hash tables or sets.
+        Generates a hash for the state. This is the Zobrist key of the board, allowing the state to be used in hash
+        tables or sets without rendering the board.
 
         :return: The hash of the state.
         """
-        return hash(str(self.game_board))
+        return self.key
@@ -0,0 +1,391 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import chess
+
+from chessgame.Agent import Agent
+from chessgame.ChessGame import ChessGame
+from chessgame.StateChessGame import StateChessGame
+from chessgame.algoritms.GameClock import GameClock
+from chessgame.algoritms.IterativeDeepening import IterativeDeepening
+from chessgame.algoritms.MinMaxAlphaBetaPruning import MinMaxAlphaBetaPruning
+from chessgame.algoritms.MinMaxAlphaBetaPruningH0Cut import MinMaxAlphaBetaPruningH0Cut
+from chessgame.algoritms.MinMaxAlphaBetaPruningHlCut import MinMaxAlphaBetaPruningHlCut
+from chessgame.algoritms.MoveOrdering import MoveOrdering
+from chessgame.algoritms.Probe import Probe
+from chessgame.algoritms.TranspositionTable import TranspositionTable, DEPTH_PREFERRED
+from chessgame.heuristics.HardBoardEvaluationChessGame import HardBoardEvaluationChessGame
+from chessgame.heuristics.SoftBoardEvaluationChessGame import SoftBoardEvaluationChessGame
+
+# The names of the searches in the matchup spec, with the title used in the results.
+ALGORITHMS = {
+    "min_max_alpha_beta_pruning": "MinMax Alpha Beta Pruning",
+    "h0_cut": "MinMax Alpha Beta Pruning H0 Cut",
+    "hl_cut": "MinMax Alpha Beta Pruning Hl Cut",
+    "hr_cut": "MinMax Alpha Beta Pruning Hr Cut",
+}
+
+# The names of the heuristics in the matchup spec.
+HEURISTICS = {
+    "hard": HardBoardEvaluationChessGame,
+    "soft": SoftBoardEvaluationChessGame,
+}
+
+# The counters of a search written to the results, with their column name. A search without a counter (e.g. the hl
+# counters of MinMaxAlphaBetaPruning) leaves the column empty.
+COUNTERS = [
+    ("eval_count", "States Evaluated"),
+    ("prune_count", "Pruning carried out"),
+    ("eval_h0_cut_count", "States evaluated H0"),
+    ("prune_h0_cut_count", "Pruning H0 carried out"),
+    ("eval_hl_cut_count", "States evaluated Hl"),
+    ("prune_hl_cut_count", "Pruning Hl carried out"),
+    ("eval_hr_cut_count", "States evaluated Hr"),
+    ("prune_hr_cut_count", "Pruning Hr carried out"),
+]
+
+# The columns of the moves of an IterativeDeepening search, with the key of its history (or "clock" for the time left
+# on the clock after the move). Each is a space-separated list with one entry per move of the agent, "-" for a move
+# served by the probe.
+MOVE_COLUMNS = [
+    ("depth", "Completed Depth per Move"),
+    ("nodes", "States Evaluated per Move"),
+    ("time", "Time per Move"),
+    ("nodes_per_second", "States per Second per Move"),
+    ("clock", "Clock per Move"),
+]
+
+# The columns of the spec and of the statistics of each agent (Agent 1 plays white, Agent 2 black).
+AGENT_COLUMNS = ["Algorithm", "Heuristic", "Max Depth", "K", "L", "Clock"]
+AGENT_STATS_COLUMNS = (["Number of Moves", "AVG Time"] + [column for _, column in COUNTERS] +
+                       ["States per Second", "AVG Completed Depth"] + [column for _, column in MOVE_COLUMNS] +
+                       ["TT Hits", "TT Misses", "TT Evictions", "Book Moves", "Tablebase Moves", "Time Saved"])
+
+# The header of the results file: one row per game.
+RESULTS_HEADER = (["Game", "Pairing", "Opening"] +
+                  [f"{column} Agent {agent}" for agent in (1, 2) for column in AGENT_COLUMNS] +
+                  ["OUTCOME", "Winner", "Total Time"] +
+                  [f"{column} Agent {agent}" for column in AGENT_STATS_COLUMNS for agent in (1, 2)] +
+                  ["Moves"])
+
+
+def describe(spec):
+    """
+    Builds the title of an agent from its spec, in the form used by the names of the games.
+
+    :param spec: The spec of the agent.
+    :return: A string such as 'hl_cut max_depth=4 k=5 l=2' or 'min_max_alpha_beta_pruning clock=60+1'.
+    """
+    title = spec["algorithm"]
+    if "clock" in spec:
+        title += f" clock={spec['clock'][0]}+{spec['clock'][1]}"
+    else:
+        title += f" max_depth={spec['max_depth']}"
+    for parameter in ("k", "l"):
+        if parameter in spec:
+            title += f" {parameter}={spec[parameter]}"
+    if spec.get("heuristic", "hard") != "hard":
+        title += f" heuristic={spec['heuristic']}"
+    return title
+
+
+def search_algorithm(game, spec, transposition_table):
+    """
+    Builds the search of an agent from its spec.
+
+    :param game: The chess game.
+    :param spec: The spec of the agent: the algorithm, max_depth, k, l, heuristic, cut_heuristic, move_ordering and,
+                 for an IterativeDeepening search, the clock [base time, increment] in seconds.
+    :param transposition_table: The transposition table of the search.
+    :return: The search, wrapped by IterativeDeepening if the spec has a clock.
+    """
+    algorithm = spec["algorithm"]
+    heuristic = HEURISTICS[spec.get("heuristic", "hard")]()
+    parameters = {
+        "game": game,
+        "heuristic": heuristic,
+        "max_depth": spec.get("max_depth", 1),
+        "transposition_table": transposition_table,
+        "move_ordering": MoveOrdering() if spec.get("move_ordering", "clock" in spec) else None,
+    }
+    if algorithm in ("h0_cut", "hl_cut"):
+        parameters["h0_cut"] = HEURISTICS[spec.get("cut_heuristic", "soft")]()
+    if algorithm in ("h0_cut", "hl_cut", "hr_cut"):
+        parameters["k"] = spec.get("k", 5)
+    if algorithm == "hl_cut":
+        parameters["l"] = spec.get("l", 3)
+
+    if algorithm == "min_max_alpha_beta_pruning":
+        search = MinMaxAlphaBetaPruning(**parameters)
+    elif algorithm == "h0_cut":
+        search = MinMaxAlphaBetaPruningH0Cut(**parameters)
+    elif algorithm == "hl_cut":
+        search = MinMaxAlphaBetaPruningHlCut(**parameters)
+    elif algorithm == "hr_cut":
+        # Imported here: the hr cut loads the regressor, which the other searches don't need.
+        from chessgame.algoritms.MinMaxAlphaBetaPruningHrCut import MinMaxAlphaBetaPruningHrCut
+        search = MinMaxAlphaBetaPruningHrCut(**parameters)
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    if "clock" in spec:
+        return IterativeDeepening(search, clock=GameClock(base_time=spec["clock"][0], increment=spec["clock"][1]))
+    return search
+
+
+def format_move_stat(key, value):
+    """
+    Formats a statistic of a move for the columns of MOVE_COLUMNS.
+
+    :param key: The key of the statistic in MOVE_COLUMNS.
+    :param value: The value of the statistic.
+    :return: The value as a string: the time in milliseconds, the clock in seconds.
+    """
+    if value is None:
+        return "-"
+    if key == "time":
+        return f"{value * 1000:.2f}ms"
+    if key == "clock":
+        return f"{value:.2f}s"
+    if key == "nodes_per_second":
+        return f"{value:.2f}"
+    return str(value)
+
+
+def play_game(game_id, pairing, opening, transposition_table_size=2 ** 20,
+              transposition_table_policy=DEPTH_PREFERRED, probe=None):
+    """
+    Plays a game of a pairing from an opening. It runs in a worker of the process pool.
+
+    :param game_id: The identifier of the game in the results.
+    :param pairing: The pairing: its name and the specs of the white and the black agent.
+    :param opening: The moves of the opening, in UCI notation, played before the agents take over.
+    :param transposition_table_size: The capacity of the transposition table of each agent.
+    :param transposition_table_policy: The replacement policy of the transposition table of each agent.
+    :param probe: The paths {"book", "tablebase"} of the opening book and the tablebases looked up by the agents
+                  before searching, None to always search. An agent whose spec has "probe": false always searches.
+    :return: The row of the game in the results, as a dictionary keyed by the columns of RESULTS_HEADER.
+    """
+    game = ChessGame()
+    for move in opening:
+        game.game_board.push_uci(move)
+    state = StateChessGame(game_board=game.game_board)
+    specs = (pairing["white"], pairing["black"])
+    agents = [Agent(search_algorithm(game, spec, TranspositionTable(size=transposition_table_size,
+                                                                   policy=transposition_table_policy)), state,
+                    probe=Probe(probe.get("book"), probe.get("tablebase"))
+                    if probe is not None and spec.get("probe", True) else None)
+              for spec in specs]
+    move_count = [0, 0]
+    time_spent = [0.0, 0.0]
+    move_stats = ([], [])
+    moves = []
+    outcome_val = None
+    game_win = None
+
+    start_time = time.time()
+    while not state.game_board.is_game_over():
+        side = 0 if state.game_board.turn == chess.WHITE else 1
+        search_count = agents[side].search_count
+        start_time_move = time.time()
+        state = agents[side].do_action(state)
+        time_spent[side] += (time.time() - start_time_move) * 1000
+        move_count[side] += 1
+        moves.append(state.move.uci())
+        clock = getattr(agents[side].search_algorithm, "clock", None)
+        history = getattr(agents[side].search_algorithm, "history", None)
+        if history is not None:
+            # The last entry of the history is the move just played, unless the probe served it.
+            searched = agents[side].search_count > search_count
+            move_stats[side].append(dict(history[-1], clock=clock.remaining if clock is not None else None)
+                                    if searched else None)
+        if clock is not None and clock.flagged():
+            outcome_val, game_win = "TIME_FORFEIT", "Black" if side == 0 else "White"
+            break
+    time_total = (time.time() - start_time) * 1000
+    if outcome_val is None:
+        outcome_val = state.game_board.outcome().termination.name
+        game_win = game.get_name_winner_player(state.game_board)
+
+    row = {"Game": game_id, "Pairing": pairing["name"], "Opening": " ".join(opening), "OUTCOME": outcome_val,
+           "Winner": game_win, "Total Time": f"{time_total:.2f}ms", "Moves": " ".join(moves)}
+    for index, (spec, agent) in enumerate(zip(specs, agents)):
+        suffix = f" Agent {index + 1}"
+        wrapper = agent.search_algorithm
+        search = getattr(wrapper, "search_algorithm", wrapper)
+        row["Algorithm" + suffix] = ALGORITHMS[spec["algorithm"]]
+        row["Heuristic" + suffix] = HEURISTICS[spec.get("heuristic", "hard")].__name__
+        row["Max Depth" + suffix] = "" if "clock" in spec else spec.get("max_depth", 1)
+        row["K" + suffix] = spec.get("k", "")
+        row["L" + suffix] = spec.get("l", "")
+        row["Clock" + suffix] = f"{spec['clock'][0]}+{spec['clock'][1]}" if "clock" in spec else ""
+        row["Number of Moves" + suffix] = move_count[index]
+        row["AVG Time" + suffix] = f"{time_spent[index] / move_count[index]:.2f}ms" if move_count[index] else ""
+        for counter, column in COUNTERS:
+            row[column + suffix] = getattr(search, counter, "")
+        row["States per Second" + suffix] = f"{search.eval_count / agent.search_time:.2f}" if agent.search_time else ""
+        history = getattr(wrapper, "history", None)
+        row["AVG Completed Depth" + suffix] = \
+            f"{sum(move['depth'] for move in history) / len(history):.2f}" if history else ""
+        for key, column in MOVE_COLUMNS:
+            row[column + suffix] = " ".join(format_move_stat(key, move[key]) if move is not None else "-"
+                                            for move in move_stats[index])
+        hits, misses, evictions = search.transposition_table.stats()
+        row["TT Hits" + suffix] = hits
+        row["TT Misses" + suffix] = misses
+        row["TT Evictions" + suffix] = evictions
+        if agent.probe is not None:
+            row["Book Moves" + suffix] = agent.probe.book_moves
+            row["Tablebase Moves" + suffix] = agent.probe.tablebase_moves
+            row["Time Saved" + suffix] = f"{agent.time_saved() * 1000:.2f}ms"
+            agent.probe.close()
+    return row
+
+
+class Tournament:
+    """
+    Runs the games of a declarative tournament on a process pool and appends their results to a single CSV file.
+
+    The tournament is described by a JSON config:
+    - pairings: a list of {"name", "white", "black"}, where white and black are the specs of the agents (see
+      search_algorithm). The name is optional and defaults to the titles of the agents.
+    - games: the number of games of each pairing (default 1). The game i of a pairing starts from the opening
+      i modulo the number of openings, so that the games of deterministic searches are not all the same.
+    - openings: the openings, each a list of moves in UCI notation (default: the starting position only).
+    - transposition_table: {"size", "policy"} of the transposition table of each agent.
+    - probe: {"book", "tablebase"}, the Polyglot opening book and the Syzygy directory looked up by the agents before
+      searching (see Probe). A missing file or directory is skipped.
+
+    Every game is a task of the pool: a worker that finishes a game takes the next one waiting, so the long games
+    don't hold up the short ones, and the games are submitted from the deepest searches down so that the longest
+    start first. The results file is only written by the main process, one row per finished game, and is never
+    rewritten: a tournament stopped midway is resumed by running it again, which skips the games already in the file.
+
+    Attributes:
+        pairings (list): The pairings, each with its name and the specs of the white and the black agent.
+        games (int): The number of games of each pairing.
+        openings (list): The openings, each a list of moves in UCI notation.
+        transposition_table_size (int): The capacity of the transposition table of each agent.
+        transposition_table_policy (str): The replacement policy of the transposition table of each agent.
+        probe (dict): The paths of the opening book and of the tablebases, None to always search.
+        results_path (str): The path of the CSV file of the results.
+    """
+
+    def __init__(self, config, results_path):
+        """
+        Initializes the Tournament with its config and the file of its results.
+
+        :param config: The config of the tournament, as a dictionary.
+        :param results_path: The path of the CSV file of the results, created if missing and appended to otherwise.
+        """
+        self.games = config.get("games", 1)
+        self.openings = config.get("openings") or [[]]
+        transposition_table = config.get("transposition_table", {})
+        self.transposition_table_size = transposition_table.get("size", 2 ** 20)
+        self.transposition_table_policy = transposition_table.get("policy", DEPTH_PREFERRED)
+        self.probe = config.get("probe")
+        self.results_path = results_path
+        self.pairings = []
+        for pairing in config["pairings"]:
+            name = pairing.get("name") or f"{describe(pairing['white'])} vs {describe(pairing['black'])}"
+            if any(name == other["name"] for other in self.pairings):
+                raise ValueError(f"Duplicate pairing: {name}")
+            self.pairings.append({"name": name, "white": pairing["white"], "black": pairing["black"]})
+        for opening in self.openings:
+            board = chess.Board()
+            for move in opening:
+                board.push_uci(move)  # Raises ValueError for an illegal opening, before any game is played.
+
+    @classmethod
+    def from_file(cls, config_path, results_path):
+        """
+        Creates a Tournament from a JSON config file.
+
+        :param config_path: The path of the JSON config.
+        :param results_path: The path of the CSV file of the results.
+        :return: The Tournament.
+        """
+        with open(config_path, encoding="utf-8") as file:
+            return cls(json.load(file), results_path)
+
+    def schedule(self):
+        """
+        Lists the games of the tournament, the most expensive first.
+
+        :return: A list of (game id, pairing, opening) tuples.
+        """
+        games = [(f"{pairing['name']} #{game + 1}", pairing, self.openings[game % len(self.openings)])
+                 for pairing in self.pairings for game in range(self.games)]
+
+        def cost(game):
+            # Seconds of clock and search depths don't compare, so the two kinds are sorted separately: first the
+            # games with a clock, by the base time of their clocks (up to minutes per game), then the games searched
+            # to a fixed depth, by the depths of their searches.
+            specs = (game[1]["white"], game[1]["black"])
+            return (sum(spec["clock"][0] for spec in specs if "clock" in spec),
+                    sum(spec.get("max_depth", 1) for spec in specs if "clock" not in spec))
+
+        return sorted(games, key=cost, reverse=True)
+
+    def completed(self):
+        """
+        Reads the ids of the games already in the results file. A row cut short by a crash is dropped from the file,
+        so that the game is played again and the next row starts on a new line. A results file whose header is not
+        RESULTS_HEADER raises ValueError instead of being resumed.
+
+        :return: The set of the ids of the completed games.
+        """
+        if not os.path.exists(self.results_path):
+            return set()
+        with open(self.results_path, "rb+") as file:
+            content = file.read()
+            if content and not content.endswith(b"\n"):
+                file.truncate(content.rfind(b"\n") + 1)
+        with open(self.results_path, newline="", encoding="utf-8") as file:
+            reader = csv.DictReader(file)
+            # The rows of the new games are appended with RESULTS_HEADER: a file with other columns (e.g. written before
+            # columns were added) would mix two layouts.
+            if reader.fieldnames is not None and reader.fieldnames != RESULTS_HEADER:
+                raise ValueError(f"The columns of {self.results_path} differ from the results of this tournament: "
+                                 "move it away, or pick another results file, to start over")
+            return {row["Game"] for row in reader if row.get("Moves") is not None}
+
+    def run(self, max_workers=None):
+        """
+        Plays the games of the tournament missing from the results file and appends their results.
+
+        :param max_workers: The number of processes of the pool. Defaults to the number of CPUs.
+        :return: The number of games played.
+        """
+        completed = self.completed()
+        games = [game for game in self.schedule() if game[0] not in completed]
+        print(f"Tournament: {len(games)} games to play, {len(completed)} already in {self.results_path}")
+        if not games:
+            return 0
+
+        new_file = not os.path.exists(self.results_path) or os.path.getsize(self.results_path) == 0
+        with open(self.results_path, "a", newline="", encoding="utf-8") as file, \
+                ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            writer = csv.DictWriter(file, fieldnames=RESULTS_HEADER)
+            if new_file:
+                writer.writeheader()
+            futures = {executor.submit(play_game, game_id, pairing, opening, self.transposition_table_size,
+                                       self.transposition_table_policy, self.probe): game_id
+                       for game_id, pairing, opening in games}
+            played = 0
+            for future in as_completed(futures):
+                try:
+                    row = future.result()
+                except Exception as error:
+                    # The game isn't written, so the next run of the tournament plays it again.
+                    print(f"{futures[future]}: failed ({error!r})")
+                    continue
+                writer.writerow(row)
+                file.flush()
+                os.fsync(file.fileno())
+                played += 1
+                print(f"[{played}/{len(games)}] {row['Game']}: {row['OUTCOME']}, winner {row['Winner']}")
+        return played
@@ -0,0 +1,95 @@
+import chess
+import chess.polyglot
+
+# The Polyglot random numbers: 768 for the pieces, 4 for the castling rights, 8 for the en passant files, 1 for the turn.
+RANDOM_ARRAY = chess.polyglot.POLYGLOT_RANDOM_ARRAY
+HASHER = chess.polyglot.ZobristHasher(RANDOM_ARRAY)
+TURN_KEY = RANDOM_ARRAY[780]
+# The rook square of each castling right, in the order of the Polyglot castling numbers.
+CASTLING_SQUARES = (chess.BB_H1, chess.BB_A1, chess.BB_H8, chess.BB_A8)
+# The castling part of the key for each value of board.castling_rights, filled on first use.
+castling_keys = {}
+
+
+def zobrist_hash(board):
+    """
+    Computes the 64-bit Polyglot Zobrist key of a board from scratch.
+
+    :param board: The chess board.
+    :return: The Zobrist key, which covers the pieces, the side to move, the castling rights and en passant.
+    """
+    return HASHER(board)
+
+
+def piece_key(piece_type, color, square):
+    """
+    Returns the random number of a piece on a square.
+
+    :param piece_type: The type of the piece.
+    :param color: The color of the piece.
+    :param square: The square of the piece.
+    :return: The random number XORed into the key while the piece is on the square.
+    """
+    return RANDOM_ARRAY[64 * ((piece_type - 1) * 2 + int(color)) + square]
+
+
+def castling_key(board):
+    """
+    Returns the castling part of the Zobrist key of a board.
+
+    Reading the castling rights mask directly is much cheaper than the has_castling_rights checks of the Polyglot
+    hasher, which clean the rights on every call; the rights of a board reached by legal moves are always clean.
+
+    :param board: The chess board.
+    :return: The XOR of the random numbers of the castling rights of the board.
+    """
+    rights = board.castling_rights
+    key = castling_keys.get(rights)
+    if key is None:
+        key = 0
+        for i, square in enumerate(CASTLING_SQUARES):
+            if rights & square:
+                key ^= RANDOM_ARRAY[768 + i]
+        castling_keys[rights] = key
+    return key
+
+
+def push_move(board, key, move):
+    """
+    Plays a move on the board and updates its Zobrist key incrementally.
+
+    Only the pieces that the move displaces are XORed in and out of the key; the castling rights and the
+    en passant file, which depend on the whole position, are rehashed before and after the move.
+
+    :param board: The chess board, modified in place.
+    :param key: The Zobrist key of the board before the move.
+    :param move: The legal move to play.
+    :return: The Zobrist key of the board after the move.
+    """
+    key ^= castling_key(board) ^ HASHER.hash_ep_square(board) ^ TURN_KEY
+    color = board.turn
+    from_square = move.from_square
+    to_square = move.to_square
+    piece_type = board.piece_type_at(from_square)
+
+    if piece_type == chess.KING and board.is_castling(move):
+        rank = chess.square_rank(from_square)
+        if board.is_kingside_castling(move):
+            king_to, rook_from, rook_to = chess.square(6, rank), chess.square(7, rank), chess.square(5, rank)
+        else:
+            king_to, rook_from, rook_to = chess.square(2, rank), chess.square(0, rank), chess.square(3, rank)
+        key ^= piece_key(chess.KING, color, from_square) ^ piece_key(chess.KING, color, king_to)
+        key ^= piece_key(chess.ROOK, color, rook_from) ^ piece_key(chess.ROOK, color, rook_to)
+    else:
+        if board.is_en_passant(move):
+            captured_square = to_square - 8 if color == chess.WHITE else to_square + 8
+            key ^= piece_key(chess.PAWN, not color, captured_square)
+        else:
+            captured_type = board.piece_type_at(to_square)
+            if captured_type is not None:
+                key ^= piece_key(captured_type, not color, to_square)
+        key ^= piece_key(piece_type, color, from_square)
+        key ^= piece_key(move.promotion or piece_type, color, to_square)
+
+    board.push(move)
+    return key ^ castling_key(board) ^ HASHER.hash_ep_square(board)
@@ -0,0 +1,48 @@
+class GameClock:
+    """
+    Represents the clock of a player in a game with a time control of a base time plus an increment per move.
+
+    The time budget of a move is an even share of the remaining time over the moves expected before the end of the
+    game, plus the increment, and never more than half of the remaining time.
+
+    Attributes:
+        remaining (float): The seconds left on the clock.
+        increment (float): The seconds added to the clock after each move.
+        moves_to_go (int): The number of moves the remaining time is expected to cover.
+    """
+
+    def __init__(self, base_time=300.0, increment=0.0, moves_to_go=30):
+        """
+        Initializes the GameClock with a time control.
+
+        :param base_time: The seconds on the clock at the start of the game. Defaults to 300.
+        :param increment: The seconds added to the clock after each move. Defaults to 0.
+        :param moves_to_go: The number of moves the remaining time is expected to cover. Defaults to 30.
+        """
+        self.remaining = base_time
+        self.increment = increment
+        self.moves_to_go = moves_to_go
+
+    def budget(self):
+        """
+        Computes the time budget of the next move.
+
+        :return: The seconds that the next move can take.
+        """
+        return max(0.0, min(self.remaining / self.moves_to_go + self.increment, self.remaining / 2))
+
+    def spend(self, elapsed):
+        """
+        Charges the time taken by a move to the clock and adds the increment.
+
+        :param elapsed: The seconds taken by the move.
+        """
+        self.remaining += self.increment - elapsed
+
+    def flagged(self):
+        """
+        Checks whether the time on the clock ran out.
+
+        :return: True if the remaining time is negative, False otherwise.
+        """
+        return self.remaining < 0
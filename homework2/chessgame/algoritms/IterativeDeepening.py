@@ -0,0 +1,142 @@
+import time
+
+
+class SearchTimeout(Exception):
+    """
+    Raised by a search when its deadline passes, to abandon the iteration in progress.
+    """
+
+
+class IterativeDeepening:
+    """
+    Drives a depth-limited Minimax search with Alpha-Beta pruning within a time budget per move.
+
+    The wrapped search (MinMaxAlphaBetaPruning or one of its h0, hl and hr cut variants) is run at depth 1, 2, 3, ...
+    on the moves of the root until the time budget of the move runs out. After each completed iteration the moves of
+    the root are sorted from the best to the worst, so that the next iteration searches the best move first and gets
+    tighter alpha-beta windows sooner; the positions stored in the transposition table are shared between the
+    iterations. When the deadline passes the search in progress raises SearchTimeout: the iteration is dropped and
+    the best move of the last completed iteration is played.
+
+    With an aspiration window, each iteration after the first searches the root with a window of aspiration_window
+    around the value of the previous iteration, which cuts off more than the full window. If the value falls out of
+    the window the iteration is searched again with the full window.
+
+    The budget is either a fixed number of seconds per move or the share of a GameClock.
+
+    Attributes:
+        search_algorithm: The depth-limited search, whose max_depth is set at each iteration.
+        time_budget (float): The seconds per move, used when there is no clock.
+        clock (GameClock): The clock of the player, None to use time_budget.
+        max_depth (int): The depth at which the deepening stops even if there is time left.
+        aspiration_window (float): The half-width of the window around the value of the previous iteration, None to
+                                   always search with the full window.
+        aspiration_failures (int): Count of the iterations searched again because the value left the window.
+        depth (int): The depth of the last completed iteration of the last move.
+        history (list): For each move, a dictionary with the move, its value, the completed depth, the number of
+                        evaluated states, the time and the states evaluated per second.
+    """
+
+    def __init__(self, search_algorithm, time_budget=1.0, clock=None, max_depth=32, aspiration_window=None):
+        """
+        Initializes the IterativeDeepening search with a depth-limited search and a time control.
+
+        :param search_algorithm: The depth-limited search to deepen.
+        :param time_budget: The seconds per move, used when there is no clock. Defaults to 1. None for no limit.
+        :param clock: The clock of the player, which sets the budget of each move instead. Defaults to None.
+        :param max_depth: The depth at which the deepening stops even if there is time left. Defaults to 32.
+        :param aspiration_window: The half-width of the aspiration window, in the units of the heuristic. Defaults to
+                                  None, i.e. full windows.
+        """
+        self.search_algorithm = search_algorithm
+        self.time_budget = time_budget
+        self.clock = clock
+        self.max_depth = max_depth
+        self.aspiration_window = aspiration_window
+        self.aspiration_failures = 0
+        self.depth = 0
+        self.history = []
+
+    def budget(self):
+        """
+        Computes the time budget of the next move.
+
+        :return: The seconds that the next move can take, infinite if there is no time limit.
+        """
+        if self.clock is not None:
+            return self.clock.budget()
+        return self.time_budget if self.time_budget is not None else float("inf")
+
+    def __evaluate(self, key, moves, turn, value):
+        """
+        Runs an iteration on the moves of the root, within the aspiration window around the value of the previous one.
+
+        :param key: The Zobrist key of the root.
+        :param moves: The moves of the root.
+        :param turn: Flag indicating if it's the maximizing player's turn.
+        :param value: The value of the previous iteration, None for the first one.
+        :return: The values of the moves, as returned by the evaluate method of the search.
+        """
+        if self.aspiration_window is not None and value is not None:
+            alpha, beta = value - self.aspiration_window, value + self.aspiration_window
+            values = self.search_algorithm.evaluate(key, moves, turn, alpha, beta)
+            best = max(values) if turn else min(values)
+            if alpha < best < beta:
+                return values
+            self.aspiration_failures += 1  # The value left the window: search again with the full window.
+        return self.search_algorithm.evaluate(key, moves, turn)
+
+    def search(self, state):
+        """
+        Deepens the search from the given state until the time budget runs out.
+
+        :param state: The current state of the chess game.
+        :return: The best next state found by the deepest completed iteration.
+        """
+        start_time = time.perf_counter()
+        budget = self.budget()
+        search_algorithm = self.search_algorithm
+        eval_start = search_algorithm.eval_count
+        turn = state.game_board.turn
+
+        moves = search_algorithm.root_moves(state)
+        move, value = moves[0], None
+        self.depth = 0
+        # With a single move there is nothing to choose: it is played without searching.
+        while len(moves) > 1 and self.depth < self.max_depth:
+            search_algorithm.max_depth = self.depth + 1
+            search_algorithm.deadline = start_time + budget
+            try:
+                values = self.__evaluate(state.key, moves, turn, value)
+            except SearchTimeout:
+                break  # The iteration is incomplete: keep the move of the previous one.
+            finally:
+                search_algorithm.deadline = None
+            self.depth += 1
+            move, value = search_algorithm.pick(moves, values, turn)
+            # Search the best moves first in the next iteration (the sort is stable, ties keep their order). The moves
+            # after a mate have no value: they stay last.
+            ranking = sorted(zip(values, range(len(values))), key=lambda ranked: ranked[0], reverse=turn)
+            moves = [moves[index] for _, index in ranking] + moves[len(values):]
+            # A forced mate was found: a deeper search cannot change the outcome.
+            if value in (float("inf"), float("-inf")):
+                break
+            # The next iteration costs several times this one: don't start it without half of the budget left.
+            if time.perf_counter() - start_time > budget / 2:
+                break
+
+        elapsed = time.perf_counter() - start_time
+        if self.clock is not None:
+            self.clock.spend(elapsed)
+        nodes = search_algorithm.eval_count - eval_start
+        self.history.append({
+            "move": move.uci(),
+            "value": value,
+            "depth": self.depth,
+            "nodes": nodes,
+            "time": elapsed,
+            "nodes_per_second": nodes / elapsed if elapsed > 0 else 0.0,
+        })
+        best = search_algorithm.game.child(state, move)
+        best.h = value
+        return best
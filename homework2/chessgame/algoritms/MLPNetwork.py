@@ -0,0 +1,56 @@
+import numpy as np
+
+# The activation functions of MLPRegressor, applied in place to the outputs of a layer.
+ACTIVATIONS = {
+    "identity": lambda x: x,
+    "tanh": lambda x: np.tanh(x, out=x),
+    "relu": lambda x: np.maximum(x, 0, out=x),
+}
+
+
+class MLPNetwork:
+    """
+    Computes the forward pass of a trained MLPRegressor with NumPy, for a whole batch of observations at once.
+
+    The weights are copied from the regressor once, so a prediction is a matrix product per layer on a (N, features)
+    array, without the validation of the inputs, the pandas DataFrame and the other per-call work of
+    MLPRegressor.predict.
+
+    Attributes:
+        coefs (list): The weight matrix of each layer.
+        intercepts (list): The bias vector of each layer.
+        hidden_activation (function): The activation of the hidden layers.
+        out_activation (function): The activation of the output layer.
+    """
+
+    def __init__(self, mlp_regressor):
+        """
+        Initializes the MLPNetwork with the weights of a trained regressor.
+
+        :param mlp_regressor: The trained MLPRegressor.
+        """
+        if mlp_regressor.activation not in ACTIVATIONS or mlp_regressor.out_activation_ not in ACTIVATIONS:
+            raise ValueError(f"Unsupported activation: {mlp_regressor.activation}, {mlp_regressor.out_activation_}")
+        self.coefs = [np.ascontiguousarray(coef, dtype=np.float64) for coef in mlp_regressor.coefs_]
+        self.intercepts = [np.ascontiguousarray(intercept, dtype=np.float64)
+                           for intercept in mlp_regressor.intercepts_]
+        self.hidden_activation = ACTIVATIONS[mlp_regressor.activation]
+        self.out_activation = ACTIVATIONS[mlp_regressor.out_activation_]
+
+    def predict(self, observations):
+        """
+        Predicts the values of a batch of observations.
+
+        :param observations: The (N, features) array of the observations, one row per position.
+        :return: The (N,) array of the predicted values.
+        """
+        values = np.asarray(observations, dtype=np.float64)
+        last = len(self.coefs) - 1
+        for layer, (coef, intercept) in enumerate(zip(self.coefs, self.intercepts)):
+            values = values @ coef
+            values += intercept
+            if layer < last:
+                self.hidden_activation(values)
+            else:
+                self.out_activation(values)
+        return values[:, 0]
@@ -1,106 +1,247 @@
-from chessgame import StateChessGame
+import math
+import time
+
+from chessgame.StateChessGame import StateChessGame
+from chessgame.ZobristHash import push_move
+from chessgame.algoritms.IterativeDeepening import SearchTimeout
+from chessgame.algoritms.TranspositionTable import TranspositionTable, bound_type, EXACT
 
 
 class MinMaxAlphaBetaPruning:
     """
     Implements the Minimax algorithm with Alpha-Beta pruning for a chess game.
 
+    The search walks the game tree on a single copy of the board, playing each move with push and taking it back with
+    pop, and generates the legal moves lazily so that no move is generated after a cutoff. Only the chosen child of
+    the root is built as a StateChessGame.
+
+    With principal variation search, only the first move of each node is searched with the full window: the other
+    moves are searched with a null window, which only tells whether they are better than the best move so far, and
+    are searched again with the full window when they are. With a good move ordering the first move is usually the
+    best one, and the null-window searches cut off much more than full-window ones.
+
     Attributes:
         game (StateChessGame): The current state of the chess game.
         heuristic (function): Heuristic function used to evaluate game states.
         max_depth (int): Maximum depth for the Minimax search.
         prune_count (int): Count of the number of pruned branches.
         eval_count (int): Count of the number of evaluations performed.
+        transposition_table (TranspositionTable): Table of the positions already searched, keyed by Zobrist key.
+        move_ordering (MoveOrdering): Sorts the moves of each node, None to search them in generation order.
+        quiescence (Quiescence): Extends the captures at the leaves, None to evaluate the leaves directly.
+        principal_variation (bool): Whether the moves after the first one of each node are searched with a null window.
+        research_count (int): Count of the null-window searches that had to be repeated with the full window.
+        cursor (StateChessGame): The state wrapping the board walked by the current search, passed to the heuristic.
+        deadline (float): The time.perf_counter() value at which the search raises SearchTimeout, None for no limit.
     """
 
-    def __init__(self, game, heuristic, max_depth=1):
+    def __init__(self, game, heuristic, max_depth=1, transposition_table=None, move_ordering=None,
+                 quiescence=None, principal_variation=False):
         """
         Initializes the MinMaxAlphaBetaPruning class with a game, heuristic function, and maximum search depth.
         :param game: The current state of the chess game.
         :param heuristic: Heuristic function used for evaluating game states.
         :param max_depth: Maximum depth for the Minimax search. Defaults to 1.
+        :param transposition_table: Transposition table of the searches. Defaults to a new TranspositionTable.
+        :param move_ordering: Move ordering of the nodes (e.g. MoveOrdering). Defaults to the generation order.
+        :param quiescence: Quiescence search of the leaves (e.g. Quiescence). Defaults to evaluating them directly.
+        :param principal_variation: Whether to use principal variation search. Defaults to False.
         """
         self.game = game  # The current state of the chess game.
         self.heuristic = heuristic  # Heuristic function used to evaluate game states.
         self.max_depth = max_depth  # Maximum depth for the Minimax search.
         self.prune_count = 0  # Count of the number of pruned branches.
         self.eval_count = 0  # Count of the number of evaluations performed.
+        # Table of the positions already searched, reused across the moves of the game.
+        self.transposition_table = transposition_table if transposition_table is not None else TranspositionTable()
+        self.move_ordering = move_ordering  # Sorts the moves of each node, None for the generation order.
+        self.quiescence = quiescence  # Extends the captures at the leaves, None to evaluate them directly.
+        self.principal_variation = principal_variation  # Whether to search the moves after the first with null windows.
+        self.research_count = 0  # Count of the null-window searches repeated with the full window.
+        self.cursor = None  # The state wrapping the board walked by the current search.
+        self.deadline = None  # Set by IterativeDeepening to stop the search when its time budget runs out.
 
-    def pick(self, states, parent_turn):
+    def pick(self, moves, values, parent_turn):
         """
-        Selects the best state from a list of states based on the player's turn.
+        Selects the best move from a list of moves based on the player's turn.
 
-        :param states: A list of game states to evaluate.
+        :param moves: A list of moves of the root.
+        :param values: The heuristic value of each move.
         :param parent_turn: A flag indicating if it's the parent player's turn.
-        :return: The state with the maximum (or minimum) heuristic value based on the player's turn.
+        :return: The move with the maximum (or minimum) heuristic value based on the player's turn, and its value.
         """
-        # If it's the parent's turn, choose the state with the maximum heuristic value.
+        # If it's the parent's turn, choose the move with the maximum heuristic value.
         if parent_turn:
-            return max(states, key=lambda state: state.h)
-        # If it's the opponent's turn, choose the state with the minimum heuristic value.
+            return max(zip(moves, values), key=lambda move_value: move_value[1])
+        # If it's the opponent's turn, choose the move with the minimum heuristic value.
         else:
-            return min(states, key=lambda state: state.h)
+            return min(zip(moves, values), key=lambda move_value: move_value[1])
 
-    def evaluate(self, states, parent_turn):
+    def evaluate(self, key, moves, parent_turn, alpha=float("-inf"), beta=float("inf")):
         """
-        Evaluates a list of states and updates their heuristic values.
+        Evaluates a list of moves of the root, playing each one on the board of the search.
+
+        The bound of the best move found so far is carried to the next moves, which are only searched enough to show
+        that they are not better: the value of the best move is exact, the values of the others may be bounds.
+        The best move is the same as with independent full-window searches.
 
-        :param states: A list of game states to evaluate.
+        :param key: The Zobrist key of the root.
+        :param moves: A list of moves of the root.
         :param parent_turn: A flag indicating if it's the parent player's turn.
+        :param alpha: The alpha value of the root. Defaults to -inf.
+        :param beta: The beta value of the root. Defaults to inf.
+        :return: The heuristic value of each move, up to the move that leaves the window (alpha, beta), if any.
         """
-        for state in states:
-            # If a draw can be claimed in the current state, set heuristic value to 0.0.
-            if state.game_board.can_claim_draw():
-                state.h = 0.0
+        board = self.cursor.game_board
+        values = []
+        for move in moves:
+            child_key = push_move(board, key, move)
+            # If a draw can be claimed after the move, set heuristic value to 0.0.
+            if board.can_claim_draw():
+                value = 0.0
             else:
-                # Otherwise, evaluate the state using the Minimax algorithm with Alpha-Beta pruning.
-                state.h = self.__minmax_alpha_beta(state, self.max_depth - 1, float("-inf"), float("inf"),
-                                                   not parent_turn)
+                # Otherwise, evaluate the move with the bound of the best move found so far.
+                value = self.__search_child(child_key, self.max_depth - 1, alpha, beta, parent_turn, not values)
+            board.pop()
+            values.append(value)
+            if parent_turn:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            # Only with a narrower window (or a mate): the value of the root is out of the window.
+            if alpha >= beta:
+                break
+        return values
 
+    def __search_child(self, key, depth, alpha, beta, parent_turn, first):
+        """
+        Searches the position reached by a move, with a null window if principal variation search is enabled.
+
+        The null window is the smallest one around the bound of the parent: (alpha, next float after alpha) for the
+        maximizing player, (previous float before beta, beta) for the minimizing one. If the move turns out to be
+        better than the best move so far without causing a cutoff, its exact value is needed: it is searched again
+        with the full window.
 
-    def __minmax_alpha_beta(self, state, depth, alpha, beta, turn):
+        :param key: The Zobrist key of the position reached by the move, already played on the board.
+        :param depth: The remaining depth of the search of the position.
+        :param alpha: The alpha value of the parent.
+        :param beta: The beta value of the parent.
+        :param parent_turn: Flag indicating if it's the maximizing player's turn in the parent.
+        :param first: Whether the move is the first one searched in the parent.
+        :return: The heuristic value of the position.
+        """
+        if first or not self.principal_variation:
+            return self.__minmax_alpha_beta(key, depth, alpha, beta, not parent_turn)
+        if parent_turn:
+            value = self.__minmax_alpha_beta(key, depth, alpha, math.nextafter(alpha, math.inf), False)
+        else:
+            value = self.__minmax_alpha_beta(key, depth, math.nextafter(beta, -math.inf), beta, True)
+        if alpha < value < beta:
+            self.research_count += 1
+            value = self.__minmax_alpha_beta(key, depth, alpha, beta, not parent_turn)
+        return value
+
+    def __minmax_alpha_beta(self, key, depth, alpha, beta, turn):
         """
         Private method implementing the Minimax algorithm with Alpha-Beta pruning.
 
-        :param state: The current game state.
+        :param key: The Zobrist key of the current position of the board.
         :param depth: The current depth in the game tree.
         :param alpha: The alpha value for Alpha-Beta pruning.
         :param beta: The beta value for Alpha-Beta pruning.
         :param turn: Flag indicating if it's the maximizing player's turn.
-        :return: The heuristic value of the state.
+        :return: The heuristic value of the position.
         """
         self.eval_count += 1
+        board = self.cursor.game_board
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
+
+        # Reuse the value of the position if it was already searched at least as deep with a compatible bound.
+        value = self.transposition_table.lookup(key, depth, alpha, beta)
+        if value is not None:
+            return value
+
+        # At the horizon, extend the captures and promotions until the position is quiet. The result depends on the
+        # window, so it is stored as a bound.
+        if depth == 0 and self.quiescence is not None:
+            value = self.quiescence.search(self.cursor, alpha, beta, turn)
+            self.transposition_table.store(key, depth, value, bound_type(value, alpha, beta))
+            return value
 
-        # Base case: if maximum depth is reached or the game is over, return the heuristic value of the state.
-        if depth == 0 or state.game_board.is_game_over():
-            return self.heuristic.h(state)
+        # Base case: if maximum depth is reached or the game is over, return the heuristic value of the position.
+        if depth == 0 or board.is_game_over():
+            value = self.heuristic.h(self.cursor)
+            self.transposition_table.store(key, depth, value, EXACT)
+            return value
 
-        # Generate all possible moves (neighbors) from the current state.
-        neighbors = self.game.neighbors(state)
+        alpha_start, beta_start = alpha, beta
+        best_move = None
+        # The legal moves are generated one at a time: after a cutoff the remaining ones are never generated.
+        # With a move ordering they are all generated and sorted first.
+        moves = board.legal_moves
+        if self.move_ordering is not None:
+            moves = self.move_ordering.order(board, moves, self.max_depth - depth,
+                                             self.transposition_table.best_move(key))
 
         if turn:  # If it's the maximizing player's turn.
             value = float("-inf")
-            for neighbor in neighbors:
-                # Recursively call the function to evaluate the neighbor state, updating the value and alpha.
-                value = max(value, self.__minmax_alpha_beta(neighbor, depth - 1, alpha, beta, False))
+            for move in moves:
+                # Play the move, evaluate the position recursively and take the move back.
+                move_value = self.__search_child(push_move(board, key, move), depth - 1, alpha, beta, True,
+                                                 best_move is None)
+                board.pop()
+                if best_move is None or move_value > value:
+                    value, best_move = move_value, move
                 alpha = max(alpha, value)
                 # Alpha-Beta pruning: if alpha is greater or equal to beta, prune this branch.
                 if alpha >= beta:
                     self.prune_count += 1
+                    if self.move_ordering is not None:
+                        self.move_ordering.cutoff(board, move, self.max_depth - depth, depth)
                     break
-            return value
         else:  # If it's the minimizing player's turn.
             value = float("inf")
-            for neighbor in neighbors:
+            for move in moves:
                 # Similarly, for the minimizing player, update the value and beta.
-                value = min(value, self.__minmax_alpha_beta(neighbor, depth - 1, alpha, beta, True))
+                move_value = self.__search_child(push_move(board, key, move), depth - 1, alpha, beta, False,
+                                                 best_move is None)
+                board.pop()
+                if best_move is None or move_value < value:
+                    value, best_move = move_value, move
                 beta = min(beta, value)
                 # Alpha-Beta pruning: if beta is less or equal to alpha, prune this branch.
                 if beta <= alpha:
                     self.prune_count += 1
+                    if self.move_ordering is not None:
+                        self.move_ordering.cutoff(board, move, self.max_depth - depth, depth)
                     break
-            return value
 
+        # Store the value with the bound it has with respect to the window the node was searched with.
+        self.transposition_table.store(key, depth, value, bound_type(value, alpha_start, beta_start), best_move)
+        return value
+
+    def new_search(self):
+        """
+        Resets the state kept across the searches of the root: ages the transposition table, forgets the killer moves
+        and ages the history of the move ordering, and removes the deadline.
+        """
+        self.transposition_table.new_search()
+        if self.move_ordering is not None:
+            self.move_ordering.new_search()
+        self.deadline = None
+
+    def root_moves(self, state: StateChessGame):
+        """
+        Prepares the search from a given state and returns the moves of the root to evaluate.
+
+        :param state: The current state of the chess game.
+        :return: The legal moves of the state.
+        """
+        self.new_search()
+        # The search plays the moves on its own copy of the board, leaving the given state untouched.
+        self.cursor = StateChessGame(game_board=state.game_board.copy(), key=state.key)
+        return list(state.game_board.legal_moves)
 
     def search(self, state: StateChessGame):
         """
@@ -109,9 +250,11 @@ class MinMaxAlphaBetaPruning:
         :param state: The current state of the chess game.
         :return: The best next state for the current player.
         """
-        # Generate all possible moves (neighbors) from the current state.
-        neighbors = self.game.neighbors(state)
-        # Evaluate the neighbors to update their heuristic values.
-        self.evaluate(neighbors, state.game_board.turn)
-        # Choose the best move based on the current player's turn.
-        return self.pick(neighbors, state.game_board.turn)
+        moves = self.root_moves(state)
+        # Evaluate the moves of the root to find their heuristic values.
+        values = self.evaluate(state.key, moves, state.game_board.turn)
+        # Choose the best move based on the current player's turn, and build the state it leads to.
+        move, value = self.pick(moves, values, state.game_board.turn)
+        best = self.game.child(state, move)
+        best.h = value
+        return best
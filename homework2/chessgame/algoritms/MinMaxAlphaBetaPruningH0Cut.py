@@ -1,10 +1,18 @@
-from chessgame import StateChessGame
+import time
+
+from chessgame.StateChessGame import StateChessGame
+from chessgame.ZobristHash import push_move
+from chessgame.algoritms.IterativeDeepening import SearchTimeout
+from chessgame.algoritms.TranspositionTable import TranspositionTable, bound_type, EXACT
 
 
 class MinMaxAlphaBetaPruningH0Cut:
     """
     Extends the Minimax algorithm with Alpha-Beta pruning for a chess game, incorporating an h0 cutoff heuristic.
 
+    The search walks the game tree on a single copy of the board, playing each move with push and taking it back with
+    pop; only the chosen child of the root is built as a StateChessGame.
+
     Attributes:
         game (StateChessGame): The current state of the chess game.
         heuristic (function): Main heuristic function for evaluating game states.
@@ -15,10 +23,13 @@ class MinMaxAlphaBetaPruningH0Cut:
         eval_count (int): Count of evaluations in the main search.
         eval_h0_cut_count (int): Count of evaluations for the h0 cutoff.
         prune_h0_cut_count (int): Count of pruned branches due to the h0 cutoff.
-        memoization (dict): Dictionary for memoization to store previously calculated states.
+        transposition_table (TranspositionTable): Table of the positions already searched, keyed by Zobrist key.
+        move_ordering (MoveOrdering): Sorts the moves of each node, None to search them in generation order.
+        cursor (StateChessGame): The state wrapping the board walked by the current search, passed to the heuristics.
+        deadline (float): The time.perf_counter() value at which the search raises SearchTimeout, None for no limit.
     """
 
-    def __init__(self, game, heuristic, h0_cut, k=5, max_depth=1):
+    def __init__(self, game, heuristic, h0_cut, k=5, max_depth=1, transposition_table=None, move_ordering=None):
         """
         Initializes the MinMaxAlphaBetaPruningH0Cut class with game settings, heuristics, and search parameters.
 
@@ -27,6 +38,8 @@ class MinMaxAlphaBetaPruningH0Cut:
         :param h0_cut: Secondary heuristic function used for h0 cutoff.
         :param k: Number of states to consider after applying the h0 cutoff. Defaults to 5.
         :param max_depth: Maximum depth for the Minimax search. Defaults to 1.
+        :param transposition_table: Transposition table of the searches. Defaults to a new TranspositionTable.
+        :param move_ordering: Move ordering of the nodes (e.g. MoveOrdering). Defaults to the generation order.
         """
         self.game = game  # The current state of the chess game.
         self.heuristic = heuristic  # Main heuristic function used to evaluate game states.
@@ -37,108 +50,178 @@ class MinMaxAlphaBetaPruningH0Cut:
         self.eval_count = 0  # Count of evaluations in the main search.
         self.eval_h0_cut_count = 0  # Count of evaluations for the h0 cutoff.
         self.prune_h0_cut_count = 0  # Count of pruned branches due to the h0 cutoff.
-        self.memoization = {}  # Dictionary for storing previously calculated states.
+        # Table of the positions already searched, reused across the moves of the game.
+        self.transposition_table = transposition_table if transposition_table is not None else TranspositionTable()
+        self.move_ordering = move_ordering  # Sorts the moves of each node, None for the generation order.
+        self.cursor = None  # The state wrapping the board walked by the current search.
+        self.deadline = None  # Set by IterativeDeepening to stop the search when its time budget runs out.
 
-    def pick(self, states, parent_turn):
+    def pick(self, moves, values, parent_turn):
         """
-        Selects the best state based on the player's turn.
+        Selects the best move based on the player's turn.
 
-        :param states: A list of game states to evaluate.
+        :param moves: A list of moves of the root.
+        :param values: The heuristic value of each move.
         :param parent_turn: A flag indicating if it's the parent player's turn.
-        :return: The state with the maximum (or minimum) heuristic value based on the player's turn.
+        :return: The move with the maximum (or minimum) heuristic value based on the player's turn, and its value.
         """
-        # Choose the state with the maximum or minimum heuristic value depending on the player's turn.
+        # Choose the move with the maximum or minimum heuristic value depending on the player's turn.
         if parent_turn:
-            return max(states, key=lambda state: state.h)
+            return max(zip(moves, values), key=lambda move_value: move_value[1])
         else:
-            return min(states, key=lambda state: state.h)
+            return min(zip(moves, values), key=lambda move_value: move_value[1])
 
-    def evaluate(self, states, parent_turn):
+    def evaluate(self, key, moves, parent_turn, alpha=float("-inf"), beta=float("inf")):
         """
-        Evaluates a list of states and updates their heuristic values.
+        Evaluates a list of moves of the root, playing each one on the board of the search.
+
+        The bound of the best move found so far is carried to the next moves, which are only searched enough to show
+        that they are not better: the value of the best move is exact, the values of the others may be bounds.
+        The best move is the same as with independent full-window searches.
 
-        :param states: A list of game states to evaluate.
+        :param key: The Zobrist key of the root.
+        :param moves: A list of moves of the root.
         :param parent_turn: A flag indicating if it's the parent player's turn.
+        :param alpha: The alpha value of the root. Defaults to -inf.
+        :param beta: The beta value of the root. Defaults to inf.
+        :return: The heuristic value of each move, up to the move that leaves the window (alpha, beta), if any.
         """
-        for state in states:
-            # If a draw can be claimed, set heuristic value to 0.0.
-            if state.game_board.can_claim_draw():
-                state.h = 0.0
+        board = self.cursor.game_board
+        values = []
+        for move in moves:
+            child_key = push_move(board, key, move)
+            # If a draw can be claimed after the move, set heuristic value to 0.0.
+            if board.can_claim_draw():
+                value = 0.0
             else:
-                # Otherwise, evaluate using the Minimax algorithm with Alpha-Beta pruning.
-                state.h = self.__minmax_alpha_beta(state, self.max_depth - 1, float("-inf"), float("inf"),
-                                                   not parent_turn)
+                # Otherwise, evaluate the move with the bound of the best move found so far.
+                value = self.__minmax_alpha_beta(child_key, self.max_depth - 1, alpha, beta, not parent_turn)
+            board.pop()
+            values.append(value)
+            if parent_turn:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            # Only with a narrower window (or a mate): the value of the root is out of the window.
+            if alpha >= beta:
+                break
+        return values
 
-    def __minmax_alpha_beta(self, state, depth, alpha, beta, turn):
+    def __minmax_alpha_beta(self, key, depth, alpha, beta, turn):
         """
-        Private method implementing the Minimax algorithm with Alpha-Beta pruning and memoization.
+        Private method implementing the Minimax algorithm with Alpha-Beta pruning and a transposition table.
 
-        :param state: The current game state.
+        :param key: The Zobrist key of the current position of the board.
         :param depth: The current depth in the game tree.
         :param alpha: The alpha value for Alpha-Beta pruning.
         :param beta: The beta value for Alpha-Beta pruning.
         :param turn: Flag indicating if it's the maximizing player's turn.
-        :return: The heuristic value of the state.
+        :return: The heuristic value of the position.
         """
         self.eval_count += 1
+        board = self.cursor.game_board
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
 
-        # Check if the state is already evaluated and stored in memoization.
-        if (state, depth, turn) in self.memoization:
-            return self.memoization[(state, depth, turn)]
+        # Reuse the value of the position if it was already searched at least as deep with a compatible bound.
+        value = self.transposition_table.lookup(key, depth, alpha, beta)
+        if value is not None:
+            return value
 
         # Base case: if maximum depth is reached or the game is over, return the heuristic value.
-        if depth == 0 or state.game_board.is_game_over():
-            return self.heuristic.h(state)
+        if depth == 0 or board.is_game_over():
+            value = self.heuristic.h(self.cursor)
+            self.transposition_table.store(key, depth, value, EXACT)
+            return value
 
-        # Generate possible moves (neighbors), applying the h0 cutoff.
-        neighbors = self.game.neighbors(state)
-        top_neighbors = self.__h0_cut(neighbors, state.game_board.turn)
+        # Generate possible moves, applying the h0 cutoff.
+        top_moves = self.__h0_cut(board.turn)
+        if self.move_ordering is not None:
+            top_moves = self.move_ordering.order(board, top_moves, self.max_depth - depth,
+                                                 self.transposition_table.best_move(key))
+        alpha_start, beta_start = alpha, beta
+        best_move = None
 
         if turn:  # Maximizing player's turn.
             value = float("-inf")
-            for neighbor in top_neighbors:
-                # Recursively evaluate the state, update value and alpha.
-                value = max(value, self.__minmax_alpha_beta(neighbor, depth - 1, alpha, beta, False))
+            for move in top_moves:
+                # Play the move, evaluate the position recursively and take the move back.
+                move_value = self.__minmax_alpha_beta(push_move(board, key, move), depth - 1, alpha, beta, False)
+                board.pop()
+                if best_move is None or move_value > value:
+                    value, best_move = move_value, move
                 alpha = max(alpha, value)
                 # Alpha-Beta pruning: prune if alpha >= beta.
                 if alpha >= beta:
                     self.prune_count += 1
+                    if self.move_ordering is not None:
+                        self.move_ordering.cutoff(board, move, self.max_depth - depth, depth)
                     break
-            self.memoization[(state, depth, turn)] = value
-            return value
         else:  # Minimizing player's turn.
             value = float("inf")
-            for neighbor in top_neighbors:
+            for move in top_moves:
                 # Similar evaluation for the minimizing player.
-                value = min(value, self.__minmax_alpha_beta(neighbor, depth - 1, alpha, beta, True))
+                move_value = self.__minmax_alpha_beta(push_move(board, key, move), depth - 1, alpha, beta, True)
+                board.pop()
+                if best_move is None or move_value < value:
+                    value, best_move = move_value, move
                 beta = min(beta, value)
                 # Prune if beta <= alpha.
                 if beta <= alpha:
                     self.prune_count += 1
+                    if self.move_ordering is not None:
+                        self.move_ordering.cutoff(board, move, self.max_depth - depth, depth)
                     break
-            self.memoization[(state, depth, turn)] = value
-            return value
 
-    def __h0_cut(self, states, turn):
+        # Store the value with the bound it has with respect to the window the node was searched with.
+        self.transposition_table.store(key, depth, value, bound_type(value, alpha_start, beta_start), best_move)
+        return value
+
+    def __h0_cut(self, turn):
         """
-        Applies the h0 cutoff heuristic to limit the number of states considered.
+        Applies the h0 cutoff heuristic to limit the number of moves considered.
 
-        :param states: A list of game states.
         :param turn: Flag indicating the current player's turn.
-        :return: A list of states after applying the h0 cutoff.
+        :return: A list of the moves kept after applying the h0 cutoff.
         """
-        initial_count = len(states)
-        # Evaluate states using the h0 heuristic and count evaluations.
-        for state in states:
-            state.h0 = self.h0_cut.h(state)
+        board = self.cursor.game_board
+        scores = []
+        # Evaluate the position after each move using the h0 heuristic and count evaluations.
+        for move in board.legal_moves:
+            board.push(move)
+            scores.append((self.h0_cut.h(self.cursor), move))
+            board.pop()
             self.eval_h0_cut_count += 1
 
-        # Sort and select the top k states based on the h0 heuristic value.
-        sorted_states = sorted(states, key=lambda state: state.h0, reverse=turn)[:self.k]
-        # Count how many states were pruned by this process.
-        self.prune_h0_cut_count += initial_count - len(sorted_states)
+        # Sort and select the top k moves based on the h0 heuristic value.
+        sorted_moves = [move for _, move in sorted(scores, key=lambda score: score[0], reverse=turn)[:self.k]]
+        # Count how many moves were pruned by this process.
+        self.prune_h0_cut_count += len(scores) - len(sorted_moves)
+
+        return sorted_moves
+
+    def new_search(self):
+        """
+        Resets the state kept across the searches of the root: ages the transposition table, forgets the killer moves
+        and ages the history of the move ordering, and removes the deadline.
+        """
+        self.transposition_table.new_search()
+        if self.move_ordering is not None:
+            self.move_ordering.new_search()
+        self.deadline = None
 
-        return sorted_states
+    def root_moves(self, state: StateChessGame):
+        """
+        Prepares the search from a given state and returns the moves of the root to evaluate.
+
+        :param state: The current state of the chess game.
+        :return: The moves of the state kept by the h0 cutoff, from the best to the worst.
+        """
+        self.new_search()
+        # The search plays the moves on its own copy of the board, leaving the given state untouched.
+        self.cursor = StateChessGame(game_board=state.game_board.copy(), key=state.key)
+        # Generate possible moves, applying the h0 cutoff.
+        return self.__h0_cut(state.game_board.turn)
 
     def search(self, state: StateChessGame):
         """
@@ -147,9 +230,10 @@ class MinMaxAlphaBetaPruningH0Cut:
         :param state: The current state of the chess game.
         :return: The best next state for the current player.
         """
-        # Generate possible moves, applying the h0 cutoff.
-        neighbors = self.game.neighbors(state)
-        top_neighbors = self.__h0_cut(neighbors, state.game_board.turn)
-        # Evaluate the top neighbors and choose the best move based on the player's turn.
-        self.evaluate(top_neighbors, state.game_board.turn)
-        return self.pick(top_neighbors, state.game_board.turn)
+        top_moves = self.root_moves(state)
+        # Evaluate the top moves and choose the best one based on the player's turn.
+        values = self.evaluate(state.key, top_moves, state.game_board.turn)
+        move, value = self.pick(top_moves, values, state.game_board.turn)
+        best = self.game.child(state, move)
+        best.h = value
+        return best
@@ -1,7 +1,13 @@
+import time
+
 import joblib
-import pandas as pd
+import numpy as np
 
-from chessgame import StateChessGame
+from chessgame.StateChessGame import StateChessGame
+from chessgame.ZobristHash import push_move
+from chessgame.algoritms.IterativeDeepening import SearchTimeout
+from chessgame.algoritms.MLPNetwork import MLPNetwork
+from chessgame.algoritms.TranspositionTable import TranspositionTable, bound_type, EXACT
 from chessgame.heuristics.ObservationBoard import ObservationBoard
 from sklearn.neural_network import MLPRegressor
 
@@ -10,6 +16,12 @@ class MinMaxAlphaBetaPruningHrCut:
     """
     Implements the Minimax algorithm with Alpha-Beta pruning for a chess game, incorporating a machine learning-based heuristic evaluation (hr cut).
 
+    The search walks the game tree on a single copy of the board, playing each move with push and taking it back with
+    pop; only the chosen child of the root is built as a StateChessGame.
+
+    The hr cut extracts the observations of all the children of a node into one array and evaluates them with a
+    single forward pass of the weights of the regressor (MLPNetwork).
+
     Attributes:
         game (StateChessGame): The current state of the chess game.
         heuristic (function): Main heuristic function used to evaluate game states.
@@ -19,12 +31,16 @@ class MinMaxAlphaBetaPruningHrCut:
         eval_count (int): Count of evaluations in the main search.
         eval_hr_cut_count (int): Count of evaluations for the hr cutoff.
         prune_hr_cut_count (int): Count of pruned branches due to the hr cutoff.
-        memoization (dict): Dictionary for storing previously calculated states.
+        transposition_table (TranspositionTable): Table of the positions already searched, keyed by Zobrist key.
+        move_ordering (MoveOrdering): Sorts the moves of each node, None to search them in generation order.
+        cursor (StateChessGame): The state wrapping the board walked by the current search, passed to the heuristics.
+        deadline (float): The time.perf_counter() value at which the search raises SearchTimeout, None for no limit.
         mlp_regressor (joblib model): Loaded machine learning model for regression.
+        network (MLPNetwork): The forward pass of the regressor on a batch of observations.
         observation (ObservationBoard): Observation board for normalizing results.
     """
 
-    def __init__(self, game, heuristic, k=5, max_depth=1):
+    def __init__(self, game, heuristic, k=5, max_depth=1, transposition_table=None, move_ordering=None):
         """
         Initializes the MinMaxAlphaBetaPruningHrCut class with game settings, heuristics, and search parameters.
 
@@ -32,6 +48,8 @@ class MinMaxAlphaBetaPruningHrCut:
         :param heuristic: Main heuristic function used for evaluating game states.
         :param k: Number of states to consider after applying the hr cutoff. Defaults to 5.
         :param max_depth: Maximum depth for the Minimax search. Defaults to 1.
+        :param transposition_table: Transposition table of the searches. Defaults to a new TranspositionTable.
+        :param move_ordering: Move ordering of the nodes (e.g. MoveOrdering). Defaults to the generation order.
         """
         self.game = game  # The current state of the chess game.
         self.heuristic = heuristic  # Main heuristic function used to evaluate game states.
@@ -41,124 +59,189 @@ class MinMaxAlphaBetaPruningHrCut:
         self.eval_count = 0  # Count of evaluations in the main search.
         self.eval_hr_cut_count = 0  # Count of evaluations for the h0 cutoff.
         self.prune_hr_cut_count = 0  # Count of pruned branches due to the h0 cutoff.
-        self.memoization = {}  # Dictionary for storing previously calculated states.
+        # Table of the positions already searched, reused across the moves of the game.
+        self.transposition_table = transposition_table if transposition_table is not None else TranspositionTable()
+        self.move_ordering = move_ordering  # Sorts the moves of each node, None for the generation order.
+        self.cursor = None  # The state wrapping the board walked by the current search.
+        self.deadline = None  # Set by IterativeDeepening to stop the search when its time budget runs out.
         self.mlp_regressor = joblib.load('./mlp_regressor_model.joblib')  # Load the ML regressor model.
+        self.network = MLPNetwork(self.mlp_regressor)  # Batched forward pass of the regressor.
         self.observation = ObservationBoard(normalize_result=True)  # Initialize the observation board.
 
-    def pick(self, states, parent_turn):
+    def pick(self, moves, values, parent_turn):
         """
-        Selects the best state from a list of states based on the player's turn.
+        Selects the best move based on the player's turn.
 
-        :param states: A list of game states to evaluate.
+        :param moves: A list of moves of the root.
+        :param values: The heuristic value of each move.
         :param parent_turn: A flag indicating if it's the parent player's turn.
-        :return: The state with the maximum (or minimum) heuristic value based on the player's turn.
+        :return: The move with the maximum (or minimum) heuristic value based on the player's turn, and its value.
         """
-        # Choose the state with the maximum or minimum heuristic value depending on the player's turn.
+        # Choose the move with the maximum or minimum heuristic value depending on the player's turn.
         if parent_turn:
-            return max(states, key=lambda state: state.h)
+            return max(zip(moves, values), key=lambda move_value: move_value[1])
         else:
-            return min(states, key=lambda state: state.h)
+            return min(zip(moves, values), key=lambda move_value: move_value[1])
 
-    def evaluate(self, states, parent_turn):
+    def evaluate(self, key, moves, parent_turn, alpha=float("-inf"), beta=float("inf")):
         """
-        Evaluates a list of states and updates their heuristic values.
+        Evaluates a list of moves of the root, playing each one on the board of the search.
+
+        The bound of the best move found so far is carried to the next moves, which are only searched enough to show
+        that they are not better: the value of the best move is exact, the values of the others may be bounds.
+        The best move is the same as with independent full-window searches.
 
-        :param states: A list of game states to evaluate.
+        :param key: The Zobrist key of the root.
+        :param moves: A list of moves of the root.
         :param parent_turn: A flag indicating if it's the parent player's turn.
+        :param alpha: The alpha value of the root. Defaults to -inf.
+        :param beta: The beta value of the root. Defaults to inf.
+        :return: The heuristic value of each move, up to the move that leaves the window (alpha, beta), if any.
         """
-        for state in states:
-            # If a draw can be claimed, set heuristic value to 0.0.
-            if state.game_board.can_claim_draw():
-                state.h = 0.0
+        board = self.cursor.game_board
+        values = []
+        for move in moves:
+            child_key = push_move(board, key, move)
+            # If a draw can be claimed after the move, set heuristic value to 0.0.
+            if board.can_claim_draw():
+                value = 0.0
             else:
-                # Otherwise, evaluate using the Minimax algorithm with Alpha-Beta pruning.
-                state.h = self.__minmax_alpha_beta(state, self.max_depth - 1, float("-inf"), float("inf"),
-                                                   not parent_turn)
+                # Otherwise, evaluate the move with the bound of the best move found so far.
+                value = self.__minmax_alpha_beta(child_key, self.max_depth - 1, alpha, beta, not parent_turn)
+            board.pop()
+            values.append(value)
+            if parent_turn:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            # Only with a narrower window (or a mate): the value of the root is out of the window.
+            if alpha >= beta:
+                break
+        return values
 
-    def __minmax_alpha_beta(self, state, depth, alpha, beta, turn):
+    def __minmax_alpha_beta(self, key, depth, alpha, beta, turn):
         """
-        Private method implementing the Minimax algorithm with Alpha-Beta pruning.
+        Private method implementing the Minimax algorithm with Alpha-Beta pruning and a transposition table.
 
-        :param state: The current game state.
+        :param key: The Zobrist key of the current position of the board.
         :param depth: The current depth in the game tree.
         :param alpha: The alpha value for Alpha-Beta pruning.
         :param beta: The beta value for Alpha-Beta pruning.
         :param turn: Flag indicating if it's the maximizing player's turn.
-        :return: The heuristic value of the state.
+        :return: The heuristic value of the position.
         """
         self.eval_count += 1
+        board = self.cursor.game_board
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
 
-        # Check if the state is already evaluated and stored in memoization.
-        if (state, depth, turn) in self.memoization:
-            return self.memoization[(state, depth, turn)]
+        # Reuse the value of the position if it was already searched at least as deep with a compatible bound.
+        value = self.transposition_table.lookup(key, depth, alpha, beta)
+        if value is not None:
+            return value
 
         # Base case: if maximum depth is reached or the game is over, return the heuristic value.
-        if depth == 0 or state.game_board.is_game_over():
-            return self.heuristic.h(state)
+        if depth == 0 or board.is_game_over():
+            value = self.heuristic.h(self.cursor)
+            self.transposition_table.store(key, depth, value, EXACT)
+            return value
 
-        # Generate possible moves (neighbors), applying the hr cutoff.
-        neighbors = self.game.neighbors(state)
-        top_neighbors = self.__hr_cut(neighbors, state.game_board.turn)
+        # Generate possible moves, applying the hr cutoff.
+        top_moves = self.__hr_cut(board.turn)
+        if self.move_ordering is not None:
+            top_moves = self.move_ordering.order(board, top_moves, self.max_depth - depth,
+                                                 self.transposition_table.best_move(key))
+        alpha_start, beta_start = alpha, beta
+        best_move = None
 
         if turn:  # Maximizing player's turn.
             value = float("-inf")
-            for neighbor in top_neighbors:
-                # Recursively evaluate the state, update value and alpha.
-                value = max(value, self.__minmax_alpha_beta(neighbor, depth - 1, alpha, beta, False))
+            for move in top_moves:
+                # Play the move, evaluate the position recursively and take the move back.
+                move_value = self.__minmax_alpha_beta(push_move(board, key, move), depth - 1, alpha, beta, False)
+                board.pop()
+                if best_move is None or move_value > value:
+                    value, best_move = move_value, move
                 alpha = max(alpha, value)
                 # Alpha-Beta pruning: prune if alpha >= beta.
                 if alpha >= beta:
                     self.prune_count += 1
+                    if self.move_ordering is not None:
+                        self.move_ordering.cutoff(board, move, self.max_depth - depth, depth)
                     break
-            self.memoization[(state, depth, turn)] = value
-            return value
         else:  # Minimizing player's turn.
             value = float("inf")
-            for neighbor in top_neighbors:
+            for move in top_moves:
                 # Similar evaluation for the minimizing player.
-                value = min(value, self.__minmax_alpha_beta(neighbor, depth - 1, alpha, beta, True))
+                move_value = self.__minmax_alpha_beta(push_move(board, key, move), depth - 1, alpha, beta, True)
+                board.pop()
+                if best_move is None or move_value < value:
+                    value, best_move = move_value, move
                 beta = min(beta, value)
                 # Prune if beta <= alpha.
                 if beta <= alpha:
                     self.prune_count += 1
+                    if self.move_ordering is not None:
+                        self.move_ordering.cutoff(board, move, self.max_depth - depth, depth)
                     break
-            self.memoization[(state, depth, turn)] = value
-            return value
 
-    def __hr_cut(self, states, turn):
+        # Store the value with the bound it has with respect to the window the node was searched with.
+        self.transposition_table.store(key, depth, value, bound_type(value, alpha_start, beta_start), best_move)
+        return value
+
+    def __hr_cut(self, turn):
         """
-        Applies the hr cutoff using the ML regressor to limit the number of states considered.
+        Applies the hr cutoff using the ML regressor to limit the number of moves considered.
 
-        :param states: A list of game states.
         :param turn: Flag indicating the current player's turn.
-        :return: A list of states after applying the hr cutoff.
+        :return: A list of the moves kept after applying the hr cutoff.
         """
-        initial_count = len(states)
+        board = self.cursor.game_board
+        moves = list(board.legal_moves)
+        # The observations of the children, one row per distinct observation: children with the same observations
+        # get exactly the same value, and keep their generation order in the sort.
+        observations = {}
+        rows = []
+        for move in moves:
+            board.push(move)
+            rows.append(observations.setdefault(tuple(self.observation.h_piccoli(board)), len(observations)))
+            board.pop()
+        self.eval_hr_cut_count += len(moves)
+        if not moves:
+            return []
+        # Evaluate all the children with a single forward pass of the regressor.
+        values = self.network.predict(np.array(list(observations)))[rows].tolist()
+        scores = list(zip(values, moves))
 
-        for state in states:
-            observations = self.observation.h_piccoli(state.game_board)  # Get observations from the board.
-            state.hr = self.__regressor_eval(observations)  # Evaluate state using the ML regressor.
-            self.eval_hr_cut_count += 1
+        # Sort and select the top k moves based on the hr value.
+        sorted_moves = [move for _, move in sorted(scores, key=lambda score: score[0], reverse=turn)[:self.k]]
+        # Count how many moves were pruned by this process.
+        self.prune_hr_cut_count += len(scores) - len(sorted_moves)
 
-        # Sort and select the top k states based on the hr value.
-        sorted_states = sorted(states, key=lambda state: state.hr, reverse=turn)[:self.k]
-        # Count how many states were pruned by this process.
-        self.prune_hr_cut_count += initial_count - len(sorted_states)
+        return sorted_moves
 
-        return sorted_states
+    def new_search(self):
+        """
+        Resets the state kept across the searches of the root: ages the transposition table, forgets the killer moves
+        and ages the history of the move ordering, and removes the deadline.
+        """
+        self.transposition_table.new_search()
+        if self.move_ordering is not None:
+            self.move_ordering.new_search()
+        self.deadline = None
 
-    def __regressor_eval(self, observations):
+    def root_moves(self, state: StateChessGame):
         """
-        Evaluates a state using the ML regressor.
+        Prepares the search from a given state and returns the moves of the root to evaluate.
 
-        :param observations: The observations extracted from the chess board.
-        :return: The predicted value from the ML regressor.
+        :param state: The current state of the chess game.
+        :return: The moves of the state kept by the hr cutoff, from the best to the worst.
         """
-        colonne = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'h7', 'h8', 'h9', 'h10',
-                   'h11', 'h12', 'h13', 'h14', 'h15', 'h16', 'h17', 'h18', 'h19',
-                   'h20']
-        df = pd.DataFrame([observations], columns=colonne)
-        return self.mlp_regressor.predict(df)[0]  # Predict and return the first value.
+        self.new_search()
+        # The search plays the moves on its own copy of the board, leaving the given state untouched.
+        self.cursor = StateChessGame(game_board=state.game_board.copy(), key=state.key)
+        # Generate possible moves, applying the hr cutoff.
+        return self.__hr_cut(state.game_board.turn)
 
     def search(self, state: StateChessGame):
         """
@@ -167,9 +250,10 @@ class MinMaxAlphaBetaPruningHrCut:
         :param state: The current state of the chess game.
         :return: The best next state for the current player.
         """
-        # Generate possible moves, applying the h0 cutoff.
-        neighbors = self.game.neighbors(state)
-        top_neighbors = self.__hr_cut(neighbors, state.game_board.turn)
-        # Evaluate the top neighbors and choose the best move based on the player's turn.
-        self.evaluate(top_neighbors, state.game_board.turn)
-        return self.pick(top_neighbors, state.game_board.turn)
+        top_moves = self.root_moves(state)
+        # Evaluate the top moves and choose the best one based on the player's turn.
+        values = self.evaluate(state.key, top_moves, state.game_board.turn)
+        move, value = self.pick(top_moves, values, state.game_board.turn)
+        best = self.game.child(state, move)
+        best.h = value
+        return best
@@ -0,0 +1,148 @@
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from chessgame.StateChessGame import StateChessGame
+
+# The search and the shared bound of the worker processes, set by _init_worker.
+_search_algorithm = None
+_bound = None
+_search_id = None
+
+
+def _init_worker(search_algorithm, bound):
+    """
+    Initializes a worker process with its own copy of the search and the bound shared by the workers.
+
+    :param search_algorithm: The search copied into the worker, with its own transposition table.
+    :param bound: The shared value of the best move of the root found so far.
+    """
+    global _search_algorithm, _bound
+    _search_algorithm = search_algorithm
+    _bound = bound
+
+
+def _search_move(search_id, board, key, move, parent_turn):
+    """
+    Searches a move of the root in a worker process, with the window given by the shared bound.
+
+    The window stops just short of the bound (one float below alpha, or above beta): a move as good as the best one
+    so far gets its exact value, and a value equal to the best value of the root is never a bound.
+
+    :param search_id: The number of the search of the root, to reset the search on the first move of each one.
+    :param board: The chess board of the root, with its move stack for the repetitions.
+    :param key: The Zobrist key of the root.
+    :param move: The move to search.
+    :param parent_turn: Flag indicating if it's the maximizing player's turn at the root.
+    :return: The value of the move, and the evaluations and the prunings of its search.
+    """
+    global _search_id
+    # Only the state kept across searches is reset: the moves of the root (and their cutoff) come from the main process.
+    if search_id != _search_id:
+        _search_id = search_id
+        _search_algorithm.new_search()
+    _search_algorithm.cursor = StateChessGame(game_board=board, key=key)
+    eval_start, prune_start = _search_algorithm.eval_count, _search_algorithm.prune_count
+
+    bound = _bound.value
+    if parent_turn:
+        alpha, beta = math.nextafter(bound, -math.inf), math.inf
+    else:
+        alpha, beta = -math.inf, math.nextafter(bound, math.inf)
+    value = _search_algorithm.evaluate(key, [move], parent_turn, alpha, beta)[0]
+    with _bound.get_lock():
+        _bound.value = max(_bound.value, value) if parent_turn else min(_bound.value, value)
+    return value, _search_algorithm.eval_count - eval_start, _search_algorithm.prune_count - prune_start
+
+
+class ParallelRootSearch:
+    """
+    Splits the moves of the root of a depth-limited search (MinMaxAlphaBetaPruning or one of its cut variants) across
+    a pool of worker processes.
+
+    The first move is searched in the main process with the full window, to get a bound (young brothers wait). The
+    other moves are then searched by the workers, each with its own copy of the search and of the transposition table.
+    The value of the best move found so far is kept in shared memory: each worker reads it when it starts a move, as
+    the alpha (or beta) of its window, and updates it when it finishes. The chosen move is the first of the moves with
+    the best value, as with the sequential search.
+
+    The workers don't share the transposition table, and a worker doesn't see the bound of a move finished after it
+    started its own: the parallel search evaluates more states than the sequential one (search overhead).
+
+    Attributes:
+        search_algorithm: The depth-limited search, also run in the main process for the first move of the root.
+        game: The chess game of the search.
+        workers (int): The number of worker processes. With 1 the root is searched sequentially, without a pool.
+        eval_count (int): Count of the evaluations of the main process and of the workers.
+        prune_count (int): Count of the pruned branches of the main process and of the workers.
+        search_id (int): The number of the searches of the root.
+        bound (multiprocessing.Value): The value of the best move of the root found so far, shared with the workers.
+        executor (ProcessPoolExecutor): The pool of the workers, started by the first search.
+    """
+
+    def __init__(self, search_algorithm, workers=None):
+        """
+        Initializes the ParallelRootSearch with a depth-limited search and a number of workers.
+
+        :param search_algorithm: The depth-limited search whose root is split.
+        :param workers: The number of worker processes. Defaults to the number of CPUs.
+        """
+        self.search_algorithm = search_algorithm
+        self.game = search_algorithm.game
+        self.workers = workers or os.cpu_count()
+        self.eval_count = 0
+        self.prune_count = 0
+        self.search_id = 0
+        self.bound = None
+        self.executor = None
+
+    def search(self, state):
+        """
+        Searches the moves of the root from the given state on the worker processes.
+
+        :param state: The current state of the chess game.
+        :return: The best next state for the current player.
+        """
+        search_algorithm = self.search_algorithm
+        turn = state.game_board.turn
+        eval_start, prune_start = search_algorithm.eval_count, search_algorithm.prune_count
+        moves = search_algorithm.root_moves(state)
+        if self.workers == 1 or len(moves) == 1:
+            values = search_algorithm.evaluate(state.key, moves, turn)
+            self.eval_count += search_algorithm.eval_count - eval_start
+            self.prune_count += search_algorithm.prune_count - prune_start
+        else:
+            if self.executor is None:
+                self.bound = multiprocessing.Value("d", 0.0)
+                self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                    initargs=(search_algorithm, self.bound))
+            # The first move gets the bound that the workers start from.
+            values = search_algorithm.evaluate(state.key, moves[:1], turn)
+            self.eval_count += search_algorithm.eval_count - eval_start
+            self.prune_count += search_algorithm.prune_count - prune_start
+            self.search_id += 1
+            with self.bound.get_lock():
+                self.bound.value = values[0]
+            # As in the sequential search, a mate in the first move ends the search.
+            mate = values[0] == (float("inf") if turn else float("-inf"))
+            futures = [self.executor.submit(_search_move, self.search_id, state.game_board, state.key, move, turn)
+                       for move in (moves[1:] if not mate else [])]
+            for future in futures:
+                value, eval_count, prune_count = future.result()
+                values.append(value)
+                self.eval_count += eval_count
+                self.prune_count += prune_count
+
+        move, value = search_algorithm.pick(moves, values, turn)
+        best = self.game.child(state, move)
+        best.h = value
+        return best
+
+    def close(self):
+        """
+        Stops the worker processes.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
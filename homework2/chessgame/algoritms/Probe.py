@@ -0,0 +1,123 @@
+import os
+import time
+
+import chess
+import chess.polyglot
+import chess.syzygy
+
+
+class Probe:
+    """
+    Looks up the move of a position in an opening book and in endgame tablebases, before the agent searches it.
+
+    - Opening book: a Polyglot file. The move with the highest weight among the entries of the position is played.
+    - Tablebases: a directory of Syzygy files, probed when the position has no more pieces than the largest table
+      and no castling rights. The move keeping the best outcome (win, draw, loss) is played: among the winning moves
+      the one with the shortest distance to the next zeroing move (DTZ), among the losing ones the longest.
+    A missing file or directory disables its source, and a position that the sources can't answer (out of book,
+    missing table) returns None, so that the agent falls back to its search.
+
+    Attributes:
+        book (chess.polyglot.MemoryMappedReader): The reader of the opening book, None without a book.
+        tablebase (chess.syzygy.Tablebase): The Syzygy tablebases, None without tablebases.
+        max_pieces (int): The number of pieces of the largest table, 0 without tablebases.
+        book_moves (int): Count of the moves served from the opening book.
+        tablebase_moves (int): Count of the moves served from the tablebases.
+        probe_time (float): The seconds spent probing, including the probes that found nothing.
+    """
+
+    def __init__(self, book_path=None, tablebase_path=None):
+        """
+        Initializes the Probe with its sources.
+
+        :param book_path: The path of the Polyglot opening book. Defaults to None, i.e. no book.
+        :param tablebase_path: The directory of the Syzygy tablebases. Defaults to None, i.e. no tablebases.
+        """
+        self.book = None
+        self.tablebase = None
+        self.max_pieces = 0
+        if book_path is not None and os.path.isfile(book_path):
+            self.book = chess.polyglot.open_reader(book_path)
+        if tablebase_path is not None and os.path.isdir(tablebase_path):
+            tablebase = chess.syzygy.open_tablebase(tablebase_path)
+            # The names of the tables list their pieces, e.g. KRPvKR.
+            self.max_pieces = max((len(name) - 1 for name in tablebase.wdl), default=0)
+            if self.max_pieces:
+                self.tablebase = tablebase
+            else:
+                tablebase.close()
+        self.book_moves = 0
+        self.tablebase_moves = 0
+        self.probe_time = 0.0
+
+    def probe(self, board):
+        """
+        Looks up the move of a position in the opening book, then in the tablebases.
+
+        :param board: The chess board of the position.
+        :return: The move to play, or None if neither source knows the position.
+        """
+        start_time = time.perf_counter()
+        move = self.book_move(board)
+        if move is not None:
+            self.book_moves += 1
+        else:
+            move = self.tablebase_move(board)
+            if move is not None:
+                self.tablebase_moves += 1
+        self.probe_time += time.perf_counter() - start_time
+        return move
+
+    def book_move(self, board):
+        """
+        Looks up the move of a position in the opening book.
+
+        :param board: The chess board of the position.
+        :return: The legal move with the highest weight, None if the position is not in the book.
+        """
+        if self.book is None:
+            return None
+        for entry in sorted(self.book.find_all(board), key=lambda book_entry: book_entry.weight, reverse=True):
+            if entry.move in board.legal_moves:
+                return entry.move
+        return None
+
+    def tablebase_move(self, board):
+        """
+        Looks up the best move of a position in the tablebases.
+
+        :param board: The chess board of the position.
+        :return: The move keeping the best outcome, None if the position is not covered by the tablebases.
+        """
+        if self.tablebase is None or board.castling_rights or chess.popcount(board.occupied) > self.max_pieces:
+            return None
+        try:
+            self.tablebase.probe_wdl(board)
+        except KeyError:
+            return None  # The table of the position is missing.
+
+        best_move, best_rank = None, None
+        for move in board.legal_moves:
+            board.push(move)
+            try:
+                # The outcome for the side that played the move, and the DTZ of the opponent.
+                wdl = -self.tablebase.probe_wdl(board)
+                dtz = self.tablebase.probe_dtz(board)
+            except KeyError:
+                return None  # A table reached by a capture or a promotion is missing.
+            finally:
+                board.pop()
+            # The best outcome first, then the quickest win or the slowest loss.
+            rank = (wdl, -abs(dtz) if wdl > 0 else abs(dtz))
+            if best_rank is None or rank > best_rank:
+                best_move, best_rank = move, rank
+        return best_move
+
+    def close(self):
+        """
+        Closes the files of the opening book and of the tablebases.
+        """
+        if self.book is not None:
+            self.book.close()
+        if self.tablebase is not None:
+            self.tablebase.close()
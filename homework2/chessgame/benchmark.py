@@ -0,0 +1,335 @@
+import csv
+import os
+import time
+
+import chess
+import joblib
+import numpy as np
+import pandas as pd
+
+from ChessGame import ChessGame
+from StateChessGame import StateChessGame
+from ZobristHash import zobrist_hash
+from algoritms.MinMaxAlphaBetaPruning import MinMaxAlphaBetaPruning
+from chessgame.algoritms.IterativeDeepening import IterativeDeepening
+from algoritms.MinMaxAlphaBetaPruningH0Cut import MinMaxAlphaBetaPruningH0Cut
+from algoritms.MinMaxAlphaBetaPruningHlCut import MinMaxAlphaBetaPruningHlCut
+from algoritms.MoveOrdering import MoveOrdering
+from chessgame.algoritms.Quiescence import Quiescence
+from chessgame.algoritms.MLPNetwork import MLPNetwork
+from chessgame.algoritms.ParallelRootSearch import ParallelRootSearch
+from chessgame.algoritms.MinMaxAlphaBetaPruningHrCut import MinMaxAlphaBetaPruningHrCut
+from chessgame.heuristics.ObservationBoard import ObservationBoard
+from heuristics.HardBoardEvaluationChessGame import HardBoardEvaluationChessGame
+from heuristics.SoftBoardEvaluationChessGame import SoftBoardEvaluationChessGame
+
+# The positions of the evaluation benchmark.
+CHESSDATA = "../csv/chessdata/chessData_partizione_130.csv"
+
+# Opening, middlegame and endgame positions of the benchmarks.
+POSITIONS = [
+    chess.STARTING_FEN,
+    "r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3",
+    "r2q1rk1/pp2bppp/2n1pn2/3p4/3P1B2/2PB1N2/PP1N1PPP/R2Q1RK1 w - - 4 10",
+    "r1bq1rk1/pp3ppp/2n1pn2/2bp4/2P5/2N1PN2/PP1B1PPP/R2QKB1R w KQ - 0 8",
+    "8/5pk1/6p1/3R4/5P2/r5P1/5K2/8 w - - 0 40",
+]
+
+# Positions in the middle of exchanges, where the value of a leaf depends on the captures that follow.
+TACTICAL_POSITIONS = [
+    "rnbqkbnr/ppp2ppp/8/3pp3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 0 3",
+    "r1bqkbnr/pppp1ppp/2n5/4p3/3PP3/5N2/PPP2PPP/RNBQKB1R b KQkq - 0 3",
+    "r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/2NP1N2/PPP2PPP/R1BQK2R b KQkq - 0 5",
+    "r2qkb1r/ppp2ppp/2np1n2/4p2b/2B1P3/2NP1N1P/PPP2PP1/R1BQK2R w KQkq - 1 7",
+    "r1b2rk1/pp1nqppp/2p1pn2/3p4/2PP4/2NBPN2/PP3PPP/R2QK2R w KQ - 2 9",
+]
+
+
+def searchers(move_ordering):
+    """
+    Builds the alpha-beta searches compared by the benchmarks, each with its own transposition table.
+    :param move_ordering: Whether the searches sort the moves of the nodes.
+    :return: A list of (name, search) pairs.
+    """
+    game = ChessGame()
+    heuristic = HardBoardEvaluationChessGame()
+    cutoff_heuristic = SoftBoardEvaluationChessGame()
+
+    def ordering():
+        return MoveOrdering() if move_ordering else None
+
+    return [
+        ("MinMaxAlphaBetaPruning d=3", MinMaxAlphaBetaPruning(game=game, heuristic=heuristic, max_depth=3,
+                                                              move_ordering=ordering())),
+        ("H0Cut d=4 k=5", MinMaxAlphaBetaPruningH0Cut(game=game, heuristic=heuristic, h0_cut=cutoff_heuristic, k=5,
+                                                      max_depth=4, move_ordering=ordering())),
+        ("HlCut d=4 k=5 l=2", MinMaxAlphaBetaPruningHlCut(game=game, heuristic=heuristic, h0_cut=cutoff_heuristic,
+                                                          k=5, l=2, max_depth=4, move_ordering=ordering())),
+        ("HrCut d=3 k=5", MinMaxAlphaBetaPruningHrCut(game=game, heuristic=heuristic, k=5, max_depth=3,
+                                                      move_ordering=ordering())),
+    ]
+
+
+def bench_move_ordering(positions=POSITIONS):
+    print(f"Move ordering benchmark (fixed depth, {len(positions)} positions)")
+    totals = {}
+    for move_ordering in [False, True]:
+        for name, search_algorithm in searchers(move_ordering):
+            nodes, prunes, elapsed = 0, 0, 0.0
+            for fen in positions:
+                board = chess.Board(fen)
+                state = StateChessGame(game_board=board, key=zobrist_hash(board))
+                eval_start, prune_start = search_algorithm.eval_count, search_algorithm.prune_count
+                start_time = time.perf_counter()
+                best = search_algorithm.search(state)
+                elapsed += time.perf_counter() - start_time
+                nodes += search_algorithm.eval_count - eval_start
+                prunes += search_algorithm.prune_count - prune_start
+                print(f"{name:<28} ordering={str(move_ordering):<5} move={best.move.uci():<6} value={best.h:<10.3f} "
+                      f"nodes={search_algorithm.eval_count - eval_start:<7} fen={fen}")
+            totals[name, move_ordering] = nodes
+            print(f"{name:<28} ordering={str(move_ordering):<5} nodes={nodes:<8} prunes={prunes:<7} "
+                  f"time={elapsed:.2f}s\n")
+    for name in dict.fromkeys(name for name, _ in totals):
+        print(f"{name:<28} node reduction={1 - totals[name, True] / totals[name, False]:.1%}")
+    print()
+
+
+def play(white, black, max_plies):
+    """
+    Plays a game between two searches from the initial position.
+    :param white: The search of the white player.
+    :param black: The search of the black player.
+    :param max_plies: The number of plies after which the game is stopped.
+    :return: The final state and the seconds spent by each player.
+    """
+    board = chess.Board()
+    state = StateChessGame(game_board=board, key=zobrist_hash(board))
+    elapsed = {chess.WHITE: 0.0, chess.BLACK: 0.0}
+    for _ in range(max_plies):
+        if state.game_board.is_game_over():
+            break
+        turn = state.game_board.turn
+        start_time = time.perf_counter()
+        state = (white if turn else black).search(state)
+        elapsed[turn] += time.perf_counter() - start_time
+    return state, elapsed
+
+
+def bench_quiescence(positions=TACTICAL_POSITIONS + POSITIONS[1:4], games=2, max_plies=80):
+    print(f"Quiescence benchmark ({len(positions)} positions, {games} games of at most {max_plies} plies)")
+    game = ChessGame()
+    heuristic = HardBoardEvaluationChessGame()
+
+    def search_algorithm(depth, quiescence):
+        return MinMaxAlphaBetaPruning(game=game, heuristic=heuristic, max_depth=depth, move_ordering=MoveOrdering(),
+                                      quiescence=Quiescence(heuristic) if quiescence else None)
+
+    setups = [("d=2", 2, False), ("d=2 + quiescence", 2, True), ("d=3", 3, False), ("d=3 + quiescence", 3, True)]
+    for name, depth, quiescence in setups:
+        nodes, quiescence_nodes, elapsed, moves = 0, 0, 0.0, []
+        for fen in positions:
+            search = search_algorithm(depth, quiescence)
+            board = chess.Board(fen)
+            start_time = time.perf_counter()
+            best = search.search(StateChessGame(game_board=board, key=zobrist_hash(board)))
+            elapsed += time.perf_counter() - start_time
+            nodes += search.eval_count
+            quiescence_nodes += search.quiescence.eval_count if quiescence else 0
+            moves.append(best.move.uci())
+        print(f"{name:<18} nodes={nodes:<7} quiescence nodes={quiescence_nodes:<7} time={elapsed:.2f}s "
+              f"moves={' '.join(moves)}")
+
+    # A shallower search with quiescence against a deeper one without, each side playing both colors.
+    for index in range(games):
+        players = [("d=2 + quiescence", search_algorithm(2, True)), ("d=3", search_algorithm(3, False))]
+        if index % 2:
+            players.reverse()
+        (white_name, white), (black_name, black) = players
+        state, elapsed = play(white, black, max_plies)
+        board = state.game_board
+        if board.is_game_over():
+            result = board.result()
+        else:
+            # Unfinished games are adjudicated by the heuristic.
+            value = heuristic.h(state)
+            result = "1-0 (adjudicated)" if value > 1 else "0-1 (adjudicated)" if value < -1 else "1/2-1/2 (adjudicated)"
+        print(f"White {white_name:<18} {elapsed[chess.WHITE]:.1f}s vs Black {black_name:<18} "
+              f"{elapsed[chess.BLACK]:.1f}s result={result} plies={board.ply()}")
+    print()
+
+
+def bench_root_search(positions=POSITIONS + TACTICAL_POSITIONS, depth=3, aspiration_window=2.0):
+    print(f"Root search benchmark (depth={depth}, {len(positions)} positions, aspiration window={aspiration_window})")
+    game = ChessGame()
+    heuristic = HardBoardEvaluationChessGame()
+
+    def search_algorithm(principal_variation=False):
+        return MinMaxAlphaBetaPruning(game=game, heuristic=heuristic, max_depth=depth, move_ordering=MoveOrdering(),
+                                      principal_variation=principal_variation)
+
+    def independent(search, state):
+        # Each move of the root searched with its own full window, as before the root carried its bound.
+        moves = search.root_moves(state)
+        values = [search.evaluate(state.key, [move], state.game_board.turn)[0] for move in moves]
+        return search.pick(moves, values, state.game_board.turn)
+
+    def driver(search, state):
+        moves = search.root_moves(state)
+        return search.pick(moves, search.evaluate(state.key, moves, state.game_board.turn), state.game_board.turn)
+
+    def deepening(search, state, window):
+        best = IterativeDeepening(search, time_budget=None, max_depth=depth, aspiration_window=window).search(state)
+        return best.move, best.h
+
+    setups = [
+        ("independent root searches", False, independent),
+        ("root bound", False, driver),
+        ("root bound + PVS", True, driver),
+        ("deepening + PVS", True, lambda search, state: deepening(search, state, None)),
+        ("deepening + PVS + aspiration", True, lambda search, state: deepening(search, state, aspiration_window)),
+    ]
+    reference = None
+    for name, principal_variation, run in setups:
+        nodes, elapsed, results = 0, 0.0, []
+        for fen in positions:
+            search = search_algorithm(principal_variation)
+            board = chess.Board(fen)
+            start_time = time.perf_counter()
+            move, value = run(search, StateChessGame(game_board=board, key=zobrist_hash(board)))
+            elapsed += time.perf_counter() - start_time
+            nodes += search.eval_count
+            results.append((move, value))
+        if reference is None:
+            reference, reference_results = nodes, results
+        # The value of the root must not change; the move only may, among moves with the same value.
+        moves = sum(move != reference_move for (move, _), (reference_move, _) in zip(results, reference_results))
+        values = sum(abs(value - reference_value) > 1e-9
+                     for (_, value), (_, reference_value) in zip(results, reference_results))
+        print(f"{name:<30} nodes={nodes:<8} ({nodes / reference:.0%}) time={elapsed:.2f}s "
+              f"different moves={moves} different values={values}")
+    print()
+
+
+def bench_evaluation(path=CHESSDATA, limit=None):
+    """
+    Checks that the single-pass evaluation of HardBoardEvaluationChessGame is identical to the weighted sum of its
+    evaluation components on the positions of a csv file with a FEN column, and compares their speed.
+    :param path: The csv file of the positions.
+    :param limit: The maximum number of positions, None for all of them.
+    :return: The number of positions whose evaluations differ.
+    """
+    with open(path, newline="") as file:
+        fens = [row["FEN"] for row in csv.DictReader(file)][:limit]
+    print(f"Evaluation benchmark ({len(fens)} positions of {path})")
+    single_pass = HardBoardEvaluationChessGame()
+    components = HardBoardEvaluationChessGame(single_pass=False)
+    mismatches, single_pass_time, components_time = 0, 0.0, 0.0
+    for fen in fens:
+        board = chess.Board(fen)
+        state = StateChessGame(game_board=board, key=0)
+        start_time = time.perf_counter()
+        value = single_pass.h(state)
+        single_pass_time += time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        reference = components.h(state)
+        components_time += time.perf_counter() - start_time
+        # repr round-trips the floats, so equal representations are equal bits.
+        if repr(value) != repr(reference):
+            mismatches += 1
+            print(f"mismatch fen={fen} single pass={value!r} components={reference!r}")
+    print(f"components  {components_time / len(fens) * 1e6:.1f}us per position")
+    print(f"single pass {single_pass_time / len(fens) * 1e6:.1f}us per position "
+          f"(x{components_time / single_pass_time:.2f}), mismatches={mismatches}\n")
+    return mismatches
+
+
+def bench_hr_inference(path=CHESSDATA, positions=300):
+    """
+    Compares the evaluation of the children of a node by the regressor of the hr cut: one pandas DataFrame and one
+    MLPRegressor.predict call per child, against a single forward pass of MLPNetwork on all the children.
+    :param path: The csv file of the positions, with a FEN column.
+    :param positions: The number of positions, taken evenly from the file.
+    """
+    with open(path, newline="") as file:
+        fens = [row["FEN"] for row in csv.DictReader(file)]
+    fens = fens[::max(1, len(fens) // positions)][:positions]
+    print(f"hr cut inference benchmark ({len(fens)} positions of {path})")
+    mlp_regressor = joblib.load('./mlp_regressor_model.joblib')
+    network = MLPNetwork(mlp_regressor)
+    observation = ObservationBoard(normalize_result=True)
+    columns = [f"h{index}" for index in range(1, 21)]
+    nodes, same_rankings, max_difference = 0, 0, 0.0
+    features_time, predict_time, network_time = 0.0, 0.0, 0.0
+    for fen in fens:
+        board = chess.Board(fen)
+        moves = list(board.legal_moves)
+        start_time = time.perf_counter()
+        observations = []
+        for move in moves:
+            board.push(move)
+            observations.append(observation.h_piccoli(board))
+            board.pop()
+        features_time += time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        reference = [mlp_regressor.predict(pd.DataFrame([row], columns=columns))[0] for row in observations]
+        predict_time += time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        # As in the hr cut: one row per distinct observation, a single forward pass.
+        distinct = {}
+        rows = [distinct.setdefault(tuple(row), len(distinct)) for row in observations]
+        values = network.predict(np.array(list(distinct)))[rows].tolist() if moves else []
+        network_time += time.perf_counter() - start_time
+        nodes += len(moves)
+
+        def ranking(scores):
+            return [move for _, move in sorted(zip(scores, moves), key=lambda score: score[0], reverse=board.turn)]
+
+        same_rankings += ranking(values) == ranking(reference)
+        max_difference = max([max_difference] + [abs(value - expected) for value, expected in zip(values, reference)])
+    print(f"observations            {features_time / nodes * 1e6:8.1f}us per node")
+    print(f"DataFrame + predict     {predict_time / nodes * 1e6:8.1f}us per node")
+    print(f"batched MLPNetwork      {network_time / nodes * 1e6:8.1f}us per node "
+          f"(x{predict_time / network_time:.0f})")
+    print(f"same rankings={same_rankings}/{len(fens)} max difference={max_difference:.1e} nodes={nodes}\n")
+
+
+def bench_parallel_root_search(positions=POSITIONS + TACTICAL_POSITIONS, depth=4, workers=(1, 2, 4, 8)):
+    """
+    Measures the speedup and the search overhead of the parallel root search at fixed depth, for each number of
+    workers, against the sequential search (1 worker).
+    :param positions: The FENs of the searched positions.
+    :param depth: The depth of the searches.
+    :param workers: The numbers of worker processes to compare.
+    """
+    print(f"Parallel root search benchmark (depth={depth}, {len(positions)} positions, {os.cpu_count()} CPUs)")
+    game = ChessGame()
+    heuristic = HardBoardEvaluationChessGame()
+    reference = None
+    for worker_count in workers:
+        search = ParallelRootSearch(MinMaxAlphaBetaPruning(game=game, heuristic=heuristic, max_depth=depth,
+                                                           move_ordering=MoveOrdering()), workers=worker_count)
+        elapsed, results = 0.0, []
+        for fen in positions:
+            board = chess.Board(fen)
+            start_time = time.perf_counter()
+            best = search.search(StateChessGame(game_board=board, key=zobrist_hash(board)))
+            elapsed += time.perf_counter() - start_time
+            results.append((best.move, best.h))
+        search.close()
+        if reference is None:
+            reference = elapsed, search.eval_count, results
+        moves = sum(move != reference_move for (move, _), (reference_move, _) in zip(results, reference[2]))
+        print(f"workers={worker_count:<2} time={elapsed:.2f}s speedup={reference[0] / elapsed:.2f} "
+              f"nodes={search.eval_count:<8} overhead={search.eval_count / reference[1]:.2f} "
+              f"different moves={moves}")
+    print()
+
+
+if __name__ == '__main__':
+    bench_evaluation()
+    bench_hr_inference()
+    bench_move_ordering()
+    bench_quiescence()
+    bench_root_search()
+    bench_parallel_root_search()
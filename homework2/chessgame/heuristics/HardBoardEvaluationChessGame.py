@@ -1,3 +1,6 @@
+import chess
+import numpy as np
+
 from chessgame import StateChessGame
 from .EvaluateBoardWithoutKing import EvaluateBoardWithoutKing
 from .EvaluateCentralControlScore import EvaluateCentralControlScore
@@ -5,6 +8,17 @@ from .EvaluateKingSafety import EvaluateKingSafety
 from .EvaluateMobility import EvaluateMobility
 from .EvaluatePawnStructure import EvaluatePawnStructure
 from .EvaluatePiecePositions import EvaluatePiecePositions
+from .constants import *
+
+# The piece types in the order of the bitboards of the single pass: pawn, knight, bishop, rook, queen, king.
+PIECE_TYPES = (chess.PAWN, chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN, chess.KING)
+# The piece-square tables of EvaluatePiecePositions as one vector per king table, indexed by
+# (piece type - 1) * 64 + square. The tables are not mirrored for black, and EvaluatePiecePositions subtracts the
+# negated score of black: the pieces of both colors add the value of their square.
+_TABLES = (PAWN_TABLE, KNIGHT_TABLE, BISHOP_TABLE, ROOK_TABLE, QUEEEN_TABLE)
+PIECE_SQUARE_TABLES = np.array(_TABLES + (KING_INITGAME_TABLE,), dtype=np.int64).reshape(-1)
+PIECE_SQUARE_TABLES_ENDGAME = np.array(_TABLES + (KING_ENDGAME_TABLE,), dtype=np.int64).reshape(-1)
+CENTER_SQUARES = (chess.D4, chess.E4, chess.D5, chess.E5)
 
 
 class HardBoardEvaluationChessGame:
@@ -27,14 +41,18 @@ class HardBoardEvaluationChessGame:
         evaluate_pawn_structure (EvaluatePawnStructure): Evaluation component focusing on the pawn structure.
         evaluate_piece_positions (EvaluatePiecePositions): Evaluation component focusing on the positions
                                                            of all pieces except the king.
+        single_pass (bool): If True, computes the six components in a single pass over the bitboards of the board,
+                            with the same result as the evaluation components.
         """
 
-    def __init__(self, balance_evaluation=True, print_evaluation=False):
+    def __init__(self, balance_evaluation=True, print_evaluation=False, single_pass=True):
         """
         Initializes the evaluation components for different aspects of the chess game.
 
         :param balance_evaluation: If True, uses a weighted approach for combining different evaluation metrics.
         :param print_evaluation: If True, prints the evaluation scores.
+        :param single_pass: If True, evaluates the board in a single pass over its bitboards instead of calling the
+                            evaluation components. Defaults to True.
         """
         self.balance_evaluation = balance_evaluation  # Flag to use weighted evaluation scores.
         self.print_evaluation = print_evaluation  # Flag to print the evaluation results.
@@ -45,6 +63,7 @@ class HardBoardEvaluationChessGame:
         self.evaluate_mobility = EvaluateMobility(normalize_result=True)
         self.evaluate_pawn_structure = EvaluatePawnStructure(normalize_result=True)
         self.evaluate_piece_positions = EvaluatePiecePositions(normalize_result=True)
+        self.single_pass = single_pass  # Flag to evaluate the board in a single pass.
 
     def h(self, state: StateChessGame):
         """
@@ -54,6 +73,8 @@ class HardBoardEvaluationChessGame:
         :return: A combined heuristic score representing the board evaluation.
         """
         board = state.game_board
+        if self.single_pass:
+            return self.__h_single_pass(board)
         # Special handling for endgame phase.
         game_over_eval = None
         # Assign extreme values for checkmate situations.
@@ -78,25 +99,284 @@ class HardBoardEvaluationChessGame:
             mobility = self.evaluate_mobility.h(state)
             pawn_structure = self.evaluate_pawn_structure.h(state)
             piece_positions = self.evaluate_piece_positions.h(state)
-            # Optionally print the evaluation scores.
-            if self.print_evaluation:
-                print("Valutazione: ", board_without_king, central_control_score, king_safety, mobility, pawn_structure,
-                      piece_positions)
-            # Combine the scores either using weighted or simple sum approach.
-            if self.balance_evaluation:
-                return (
-                        board_without_king * 0.35 +  # Bilancio del materiale
-                        central_control_score * 0.20 +  # Controllo del centro
-                        king_safety * 0.15 +  # Sicurezza del re
-                        mobility * 0.10 +  # Mobilità
-                        pawn_structure * 0.10 +  # Struttura dei pedoni
-                        piece_positions * 0.10  # Posizione dei pezzi
-                )
+            return self.__combine(board_without_king, central_control_score, king_safety, mobility, pawn_structure,
+                                  piece_positions)
+
+    def __combine(self, board_without_king, central_control_score, king_safety, mobility, pawn_structure,
+                  piece_positions):
+        """
+        Combines the normalized scores of the evaluation components.
+
+        :return: The weighted sum of the scores, or their simple sum if balance_evaluation is False.
+        """
+        # Optionally print the evaluation scores.
+        if self.print_evaluation:
+            print("Valutazione: ", board_without_king, central_control_score, king_safety, mobility, pawn_structure,
+                  piece_positions)
+        # Combine the scores either using weighted or simple sum approach.
+        if self.balance_evaluation:
             return (
-                    board_without_king +
-                    central_control_score +
-                    king_safety +
-                    mobility +
-                    pawn_structure +
-                    piece_positions
+                    board_without_king * 0.35 +  # Bilancio del materiale
+                    central_control_score * 0.20 +  # Controllo del centro
+                    king_safety * 0.15 +  # Sicurezza del re
+                    mobility * 0.10 +  # Mobilità
+                    pawn_structure * 0.10 +  # Struttura dei pedoni
+                    piece_positions * 0.10  # Posizione dei pezzi
             )
+        return (
+                board_without_king +
+                central_control_score +
+                king_safety +
+                mobility +
+                pawn_structure +
+                piece_positions
+        )
+
+    def __h_single_pass(self, board):
+        """
+        Evaluates the board in a single pass over its bitboards.
+
+        The legal moves are counted once, both for the end of the game and for the mobility, the squares attacked by
+        each side are computed once for the central control and the king safety, the pawn structure is evaluated with
+        shifts of the pawn bitboards, and the piece positions with a dot product of the piece-square tables and the
+        bits of the board. Each component is computed with the same floating point operations, in the same order, as
+        the corresponding evaluation component, so the result is identical.
+
+        :param board: The chess board to evaluate.
+        :return: A combined heuristic score representing the board evaluation.
+        """
+        occupied = board.occupied
+        white, black = board.occupied_co[chess.WHITE], board.occupied_co[chess.BLACK]
+        piece_bitboards = (board.pawns, board.knights, board.bishops, board.rooks, board.queens, board.kings)
+        bitboards = [bitboard & black for bitboard in piece_bitboards] + \
+                    [bitboard & white for bitboard in piece_bitboards]
+        # The squares attacked by each side.
+        attacks = [self.__attacks(bitboards, color, occupied) for color in (chess.BLACK, chess.WHITE)]
+
+        # The end of the game, as in the evaluation with the components: the draws take precedence.
+        king = chess.msb(bitboards[6 * board.turn + 5])
+        check = bool(attacks[not board.turn] & chess.BB_SQUARES[king])
+        legal_moves = self.__count_legal_moves(board, bitboards, king, check, attacks[not board.turn])
+        game_over_eval = None
+        if legal_moves == 0 and check:
+            game_over_eval = float("-inf") if board.turn else float("inf")
+        if (legal_moves == 0 and not check) or board.is_insufficient_material() or \
+                (board.halfmove_clock >= 150 and legal_moves > 0) or board.is_fivefold_repetition():
+            game_over_eval = 0
+        if game_over_eval is not None:
+            return game_over_eval
+
+        # Material (EvaluateBoardWithoutKing).
+        counts = [chess.popcount(bitboard) for bitboard in bitboards]
+        material = sum(PIECE_VALUE[piece_type] * (counts[6 + index] - counts[index])
+                       for index, piece_type in enumerate(PIECE_TYPES))
+        material += 0.1 if board.turn else -0.1
+
+        # Central control (EvaluateCentralControlScore), summed in the same order.
+        central_control = 0
+        for square in CENTER_SQUARES:
+            if attacks[chess.WHITE] & chess.BB_SQUARES[square]:
+                central_control += 0.3
+            if attacks[chess.BLACK] & chess.BB_SQUARES[square]:
+                central_control -= 0.3
+        central_control = central_control if board.turn else -central_control
+
+        # King safety (EvaluateKingSafety): the scores are multiples of 0.25, so their sums are exact in any order.
+        white_king_attacks = chess.BB_KING_ATTACKS[chess.msb(bitboards[11])]
+        black_king_attacks = chess.BB_KING_ATTACKS[chess.msb(bitboards[5])]
+        king_safety = 0.5 * chess.popcount(bitboards[6] & white_king_attacks)
+        king_safety += -0.75 * chess.popcount(white_king_attacks & attacks[chess.BLACK])
+        king_safety -= 0.5 * chess.popcount(bitboards[0] & black_king_attacks)
+        king_safety -= -0.75 * chess.popcount(black_king_attacks & attacks[chess.WHITE])
+
+        # Mobility (EvaluateMobility): the legal moves are all moves of the side to move.
+        mobility = legal_moves
+
+        # Pawn structure (EvaluatePawnStructure).
+        white_pawns, black_pawns = bitboards[6], bitboards[0]
+        pawn_structure = self.__pawn_structure_score(white_pawns, black_pawns, chess.WHITE, ~occupied & chess.BB_ALL)
+        pawn_structure -= self.__pawn_structure_score(black_pawns, white_pawns, chess.BLACK, ~occupied & chess.BB_ALL)
+
+        # Piece positions (EvaluatePiecePositions), with the king table of the phase of the game.
+        bits = np.unpackbits(np.array(piece_bitboards, dtype="<u8").view(np.uint8), bitorder="little")
+        tables = PIECE_SQUARE_TABLES_ENDGAME if self.__is_endgame(counts) else PIECE_SQUARE_TABLES
+        piece_positions = int(tables @ bits)
+
+        return self.__combine(normalize(material, 99, -99), normalize(central_control, 1.2, -1.2),
+                              normalize(king_safety, 9.5, -9.5), normalize(mobility, 90, -10),
+                              normalize(pawn_structure, 430, -430), normalize(piece_positions, 505, -420))
+
+    @staticmethod
+    def __attacks(bitboards, color, occupied):
+        """
+        Computes the squares attacked by a side, i.e. the squares for which board.is_attacked_by is True.
+
+        :param bitboards: The bitboards of the pieces of the single pass.
+        :param color: The color of the side.
+        :param occupied: The bitboard of the occupied squares.
+        :return: The bitboard of the attacked squares.
+        """
+        pawns = bitboards[6 * color]
+        if color == chess.WHITE:
+            attacks = ((pawns & ~chess.BB_FILE_A) << 7 | (pawns & ~chess.BB_FILE_H) << 9) & chess.BB_ALL
+        else:
+            attacks = (pawns & ~chess.BB_FILE_A) >> 9 | (pawns & ~chess.BB_FILE_H) >> 7
+        for square in chess.scan_forward(bitboards[6 * color + 1]):
+            attacks |= chess.BB_KNIGHT_ATTACKS[square]
+        for square in chess.scan_forward(bitboards[6 * color + 2] | bitboards[6 * color + 4]):
+            attacks |= chess.BB_DIAG_ATTACKS[square][chess.BB_DIAG_MASKS[square] & occupied]
+        for square in chess.scan_forward(bitboards[6 * color + 3] | bitboards[6 * color + 4]):
+            attacks |= (chess.BB_RANK_ATTACKS[square][chess.BB_RANK_MASKS[square] & occupied] |
+                        chess.BB_FILE_ATTACKS[square][chess.BB_FILE_MASKS[square] & occupied])
+        return attacks | chess.BB_KING_ATTACKS[chess.msb(bitboards[6 * color + 5])]
+
+    @staticmethod
+    def __count_legal_moves(board, bitboards, king, check, attacked):
+        """
+        Counts the legal moves of the side to move without generating them.
+
+        Out of check, a move is legal unless it is a king move to an attacked square or the move of a pinned piece
+        off the line of its pin, so the moves are counted on the attack bitboards; castling and en passant, which
+        have their own rules, are left to the move generator of the board. In check, the evasions are generated.
+
+        :param board: The chess board.
+        :param bitboards: The bitboards of the pieces of the single pass.
+        :param king: The square of the king of the side to move.
+        :param check: Whether the side to move is in check.
+        :param attacked: The bitboard of the squares attacked by the opponent.
+        :return: The number of legal moves, as board.legal_moves.count().
+        """
+        if check:
+            return board.legal_moves.count()
+        turn = board.turn
+        occupied = board.occupied
+        ours, theirs = board.occupied_co[turn], board.occupied_co[not turn]
+
+        # The pieces pinned to the king: the only piece between the king and a slider of the opponent.
+        pinned = 0
+        snipers = ((chess.BB_RANK_ATTACKS[king][0] | chess.BB_FILE_ATTACKS[king][0]) & (board.rooks | board.queens) |
+                   chess.BB_DIAG_ATTACKS[king][0] & (board.bishops | board.queens)) & theirs
+        for sniper in chess.scan_forward(snipers):
+            blockers = chess.between(king, sniper) & occupied
+            if blockers and not blockers & (blockers - 1):
+                pinned |= blockers & ours
+
+        def pin_line(square):
+            return chess.ray(king, square) if pinned & chess.BB_SQUARES[square] else chess.BB_ALL
+
+        count = chess.popcount(chess.BB_KING_ATTACKS[king] & ~ours & ~attacked)
+        for square in chess.scan_forward(bitboards[6 * turn + 1] & ~pinned):
+            count += chess.popcount(chess.BB_KNIGHT_ATTACKS[square] & ~ours)
+        for square in chess.scan_forward(bitboards[6 * turn + 2] | bitboards[6 * turn + 4]):
+            count += chess.popcount(chess.BB_DIAG_ATTACKS[square][chess.BB_DIAG_MASKS[square] & occupied] & ~ours &
+                                    pin_line(square))
+        for square in chess.scan_forward(bitboards[6 * turn + 3] | bitboards[6 * turn + 4]):
+            count += chess.popcount((chess.BB_RANK_ATTACKS[square][chess.BB_RANK_MASKS[square] & occupied] |
+                                     chess.BB_FILE_ATTACKS[square][chess.BB_FILE_MASKS[square] & occupied]) & ~ours &
+                                    pin_line(square))
+
+        def pawn_moves(pawns, targets):
+            # The pushes and the captures of the pawns to the target squares, four for each promotion.
+            if turn == chess.WHITE:
+                single = pawns << 8 & ~occupied
+                double = single << 8 & ~occupied & chess.BB_RANK_4
+                captures = ((pawns & ~chess.BB_FILE_A) << 7) & theirs, ((pawns & ~chess.BB_FILE_H) << 9) & theirs
+            else:
+                single = pawns >> 8 & ~occupied
+                double = single >> 8 & ~occupied & chess.BB_RANK_5
+                captures = ((pawns & ~chess.BB_FILE_A) >> 9) & theirs, ((pawns & ~chess.BB_FILE_H) >> 7) & theirs
+            moves = chess.popcount(double & targets)
+            for destinations in (single & targets, captures[0] & targets, captures[1] & targets):
+                moves += chess.popcount(destinations & ~chess.BB_BACKRANKS) + \
+                    4 * chess.popcount(destinations & chess.BB_BACKRANKS)
+            return moves
+
+        pawns = bitboards[6 * turn]
+        count += pawn_moves(pawns & ~pinned, chess.BB_ALL)
+        for square in chess.scan_forward(pawns & pinned):
+            count += pawn_moves(chess.BB_SQUARES[square], chess.ray(king, square))
+        if board.ep_square is not None:
+            count += sum(1 for _ in board.generate_legal_ep())
+        return count + sum(1 for _ in board.generate_castling_moves())
+
+    @staticmethod
+    def __pawn_structure_score(our_pawns, their_pawns, color, empty):
+        """
+        Computes the pawn structure score of a side with shifts of the pawn bitboards: isolated, doubled and backward
+        pawns are penalized and passed pawns are rewarded, as in EvaluatePawnStructure.
+
+        :param our_pawns: The bitboard of the pawns of the side.
+        :param their_pawns: The bitboard of the pawns of the opponent.
+        :param color: The color of the side.
+        :param empty: The bitboard of the empty squares.
+        :return: The pawn structure score of the side.
+        """
+        score = 0
+        all_pawns = our_pawns | their_pawns
+        neighbour_files = 0
+        for file in range(8):
+            on_file = chess.popcount(our_pawns & chess.BB_FILES[file])
+            if on_file:
+                if on_file > 1:
+                    score -= 10 * on_file  # Doubled pawns.
+                if file > 0:
+                    neighbour_files |= chess.BB_FILES[file - 1]
+                if file < 7:
+                    neighbour_files |= chess.BB_FILES[file + 1]
+        score -= 20 * chess.popcount(our_pawns & ~neighbour_files)  # Isolated pawns.
+
+        # A pawn is supported by a pawn of either side beside it or beside its advance square; the squares are taken
+        # by index, so they may wrap around the edge of the board.
+        if color == chess.WHITE:
+            supported = (all_pawns << 1 | all_pawns >> 1 | all_pawns >> 7 | all_pawns >> 9) & chess.BB_ALL
+            advance_empty = empty >> 8
+            # The squares in front of the pawns of the opponent, towards the first rank.
+            front = their_pawns >> 8
+            front |= front >> 8
+            front |= front >> 16
+            front |= front >> 32
+        else:
+            supported = (all_pawns << 1 | all_pawns >> 1 | all_pawns << 7 | all_pawns << 9) & chess.BB_ALL
+            advance_empty = (empty << 8) & chess.BB_ALL
+            front = (their_pawns << 8) & chess.BB_ALL
+            front |= (front << 8) & chess.BB_ALL
+            front |= (front << 16) & chess.BB_ALL
+            front |= (front << 32) & chess.BB_ALL
+        score -= 15 * chess.popcount(our_pawns & ~supported & advance_empty)  # Backward pawns.
+        score += 50 * chess.popcount(our_pawns & ~front)  # Passed pawns.
+        return score
+
+    @staticmethod
+    def __is_endgame(counts):
+        """
+        Determines if the board is in the endgame phase, as in EvaluatePiecePositions.
+
+        :param counts: The number of pieces of each bitboard of the single pass.
+        :return: True if it's the endgame phase, False otherwise.
+        """
+        white_queens, black_queens = counts[10], counts[4]
+        if white_queens == 0 and black_queens == 0:
+            return True
+        white_endgame_condition_with_queen = white_queens == 1 and counts[9] == 0 and counts[7] + counts[8] <= 1
+        black_endgame_condition_with_queen = black_queens == 1 and counts[3] == 0 and counts[1] + counts[2] <= 1
+        return (white_endgame_condition_with_queen and black_queens == 0) or \
+            (black_endgame_condition_with_queen and white_queens == 0) or \
+            (white_endgame_condition_with_queen and black_endgame_condition_with_queen)
+
+
+def normalize(value, h_max_value, h_min_value, maxv=100, minv=-100):
+    """
+    Normalizes an evaluation value as the evaluation components do.
+
+    :param value: The value to be normalized.
+    :param h_max_value: The maximum heuristic value of the component.
+    :param h_min_value: The minimum heuristic value of the component.
+    :param maxv: The maximum value for normalization. Defaults to 100.
+    :param minv: The minimum value for normalization. Defaults to -100.
+    :return: The normalized value.
+    """
+    if value >= 0:
+        normalized = (value / h_max_value) * 100
+    else:
+        normalized = (value / abs(h_min_value)) * 100
+    return max(min(normalized, maxv), minv)
@@ -0,0 +1,43 @@
+import csv
+import os
+import sys
+import unittest
+
+import chess
+
+# The modules of the game import each other by their path from the homework2 folder.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from chessgame.StateChessGame import StateChessGame  # noqa: E402
+from chessgame.heuristics.HardBoardEvaluationChessGame import HardBoardEvaluationChessGame  # noqa: E402
+
+# The FEN corpus of bench_evaluation.
+CHESSDATA = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                         "csv", "chessdata", "chessData_partizione_130.csv")
+
+
+class TestHardBoardEvaluation(unittest.TestCase):
+    """
+    Tests of the single-pass evaluation of HardBoardEvaluationChessGame.
+    """
+
+    def test_single_pass_matches_components(self):
+        """
+        The single-pass evaluation returns the same floats as the weighted sum of the evaluation components, with and
+        without balance evaluation, on every position of the corpus.
+        """
+        with open(CHESSDATA, newline="") as file:
+            fens = [row["FEN"] for row in csv.DictReader(file)]
+        self.assertTrue(fens)
+        for balance_evaluation in (True, False):
+            single_pass = HardBoardEvaluationChessGame(balance_evaluation=balance_evaluation)
+            components = HardBoardEvaluationChessGame(balance_evaluation=balance_evaluation, single_pass=False)
+            for fen in fens:
+                state = StateChessGame(game_board=chess.Board(fen), key=0)
+                # repr round-trips the floats, so equal representations are equal bits.
+                self.assertEqual(repr(single_pass.h(state)), repr(components.h(state)),
+                                 f"fen={fen} balance_evaluation={balance_evaluation}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import csv
+import os
+import sys
+import unittest
+
+import chess
+import joblib
+import numpy as np
+import pandas as pd
+
+# The modules of the game import each other by their path from the homework2 folder.
+CHESSGAME = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(CHESSGAME))
+
+from chessgame.ChessGame import ChessGame  # noqa: E402
+from chessgame.StateChessGame import StateChessGame  # noqa: E402
+from chessgame.ZobristHash import zobrist_hash  # noqa: E402
+from chessgame.algoritms.MLPNetwork import MLPNetwork  # noqa: E402
+from chessgame.algoritms.MinMaxAlphaBetaPruningHrCut import MinMaxAlphaBetaPruningHrCut  # noqa: E402
+from chessgame.heuristics.HardBoardEvaluationChessGame import HardBoardEvaluationChessGame  # noqa: E402
+from chessgame.heuristics.ObservationBoard import ObservationBoard  # noqa: E402
+
+# The FEN corpus of bench_hr_inference, and the number of positions taken evenly from it.
+CHESSDATA = os.path.join(os.path.dirname(CHESSGAME), "csv", "chessdata", "chessData_partizione_130.csv")
+POSITIONS = 60
+
+# The features of the regressor, as named when it was trained.
+COLUMNS = [f"h{index}" for index in range(1, 21)]
+
+
+class TestHrCutInference(unittest.TestCase):
+    """
+    Tests of the batched forward pass of the regressor of the hr cut against MLPRegressor.predict.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        with open(CHESSDATA, newline="") as file:
+            fens = [row["FEN"] for row in csv.DictReader(file)]
+        cls.fens = fens[::len(fens) // POSITIONS][:POSITIONS]
+        # The hr cut loads the regressor from the working directory.
+        working_directory = os.getcwd()
+        os.chdir(CHESSGAME)
+        try:
+            cls.search = MinMaxAlphaBetaPruningHrCut(game=ChessGame(), heuristic=HardBoardEvaluationChessGame())
+            cls.mlp_regressor = joblib.load("mlp_regressor_model.joblib")
+        finally:
+            os.chdir(working_directory)
+        cls.observation = ObservationBoard(normalize_result=True)
+
+    def children_observations(self, board):
+        """
+        Extracts the observations of the children of a position, in the order of the legal moves.
+
+        :param board: The chess board of the position.
+        :return: The list of the observations, one per legal move.
+        """
+        observations = []
+        for move in board.legal_moves:
+            board.push(move)
+            observations.append(self.observation.h_piccoli(board))
+            board.pop()
+        return observations
+
+    def test_predict_matches_regressor(self):
+        network = MLPNetwork(self.mlp_regressor)
+        for fen in self.fens:
+            observations = self.children_observations(chess.Board(fen))
+            if not observations:
+                continue
+            expected = [self.mlp_regressor.predict(pd.DataFrame([row], columns=COLUMNS))[0] for row in observations]
+            np.testing.assert_allclose(network.predict(np.array(observations)), expected, rtol=1e-9, atol=1e-9,
+                                       err_msg=fen)
+
+    def test_hr_cut_ranking_matches_regressor(self):
+        # With k above the number of moves, the hr cut returns all the children of the root, from the best to the
+        # worst: the same order as with one MLPRegressor.predict call per child.
+        self.search.k = 1000
+        for fen in self.fens:
+            board = chess.Board(fen)
+            moves = list(board.legal_moves)
+            values = [self.mlp_regressor.predict(pd.DataFrame([row], columns=COLUMNS))[0]
+                      for row in self.children_observations(board)]
+            expected = [move for _, move in sorted(zip(values, moves), key=lambda score: score[0],
+                                                   reverse=board.turn)]
+            state = StateChessGame(game_board=board, key=zobrist_hash(board))
+            self.assertEqual(self.search.root_moves(state), expected, fen)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import sys
+import unittest
+
+import chess
+
+# The modules of the game import each other by their path from the homework2 folder.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from chessgame.ChessGame import ChessGame  # noqa: E402
+from chessgame.StateChessGame import StateChessGame  # noqa: E402
+from chessgame.ZobristHash import zobrist_hash  # noqa: E402
+from chessgame.algoritms.IterativeDeepening import IterativeDeepening  # noqa: E402
+from chessgame.algoritms.MinMaxAlphaBetaPruning import MinMaxAlphaBetaPruning  # noqa: E402
+from chessgame.algoritms.MoveOrdering import MoveOrdering  # noqa: E402
+from chessgame.algoritms.ParallelRootSearch import ParallelRootSearch  # noqa: E402
+from chessgame.heuristics.HardBoardEvaluationChessGame import HardBoardEvaluationChessGame  # noqa: E402
+
+# Positions of bench_root_search: an opening, a middlegame, an endgame and a position in the middle of exchanges.
+POSITIONS = [
+    "r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3",
+    "r2q1rk1/pp2bppp/2n1pn2/3p4/3P1B2/2PB1N2/PP1N1PPP/R2Q1RK1 w - - 4 10",
+    "8/5pk1/6p1/3R4/5P2/r5P1/5K2/8 w - - 0 40",
+    "r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/2NP1N2/PPP2PPP/R1BQK2R b KQkq - 0 5",
+]
+DEPTH = 3
+
+
+class TestRootSearch(unittest.TestCase):
+    """
+    Tests that the root of MinMaxAlphaBetaPruning gets the same value with every way of searching it as with an
+    independent full-window search of each move.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.game = ChessGame()
+        cls.heuristic = HardBoardEvaluationChessGame()
+        # The value of each move of the root, each searched with its own full window.
+        cls.independent = {}
+        for fen in POSITIONS:
+            search, state = cls.search_algorithm(), cls.state(fen)
+            moves = search.root_moves(state)
+            cls.independent[fen] = {move: search.evaluate(state.key, [move], state.game_board.turn)[0]
+                                    for move in moves}
+
+    @classmethod
+    def search_algorithm(cls, principal_variation=False):
+        """
+        Builds the search of the tests, with move ordering.
+
+        :param principal_variation: Whether to use principal variation search. Defaults to False.
+        :return: A MinMaxAlphaBetaPruning search of depth DEPTH.
+        """
+        return MinMaxAlphaBetaPruning(game=cls.game, heuristic=cls.heuristic, max_depth=DEPTH,
+                                      move_ordering=MoveOrdering(), principal_variation=principal_variation)
+
+    @staticmethod
+    def state(fen):
+        """
+        Builds the state of a position.
+
+        :param fen: The FEN of the position.
+        :return: The StateChessGame of the position, with its Zobrist key.
+        """
+        board = chess.Board(fen)
+        return StateChessGame(game_board=board, key=zobrist_hash(board))
+
+    def assert_best(self, fen, move, value):
+        """
+        Asserts that a move and its value are a best move of the root and the value of the root.
+
+        :param fen: The FEN of the root.
+        :param move: The move chosen by the search.
+        :param value: The value of the root found by the search.
+        """
+        values = self.independent[fen]
+        best = (max if chess.Board(fen).turn else min)(values.values())
+        self.assertAlmostEqual(value, best, delta=1e-9, msg=fen)
+        # The move may differ from the one of the independent searches, but only among moves of the same value.
+        self.assertAlmostEqual(values[move], best, delta=1e-9, msg=fen)
+
+    def test_root_bound(self):
+        for principal_variation in (False, True):
+            for fen in POSITIONS:
+                search, state = self.search_algorithm(principal_variation), self.state(fen)
+                moves = search.root_moves(state)
+                move, value = search.pick(moves, search.evaluate(state.key, moves, state.game_board.turn),
+                                          state.game_board.turn)
+                self.assert_best(fen, move, value)
+
+    def test_iterative_deepening(self):
+        # Without a window, with a window wide enough and with one so narrow that most iterations are searched again.
+        for aspiration_window in (None, 2.0, 0.01):
+            failures = 0
+            for fen in POSITIONS:
+                search = IterativeDeepening(self.search_algorithm(principal_variation=True), time_budget=None,
+                                            max_depth=DEPTH, aspiration_window=aspiration_window)
+                best = search.search(self.state(fen))
+                self.assert_best(fen, best.move, best.h)
+                failures += search.aspiration_failures
+            if aspiration_window == 0.01:
+                self.assertGreater(failures, 0)
+
+    def test_parallel_root_search(self):
+        # The same workers search the roots one after the other, resetting their search between two roots.
+        for principal_variation in (False, True):
+            search = ParallelRootSearch(self.search_algorithm(principal_variation), workers=2)
+            try:
+                for fen in POSITIONS:
+                    best = search.search(self.state(fen))
+                    self.assert_best(fen, best.move, best.h)
+            finally:
+                search.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import sys
+import unittest
+
+# The modules of the game import each other by their path from the homework2 folder.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from chessgame.algoritms.TranspositionTable import (TranspositionTable, DEPTH_PREFERRED, LRU, EXACT, LOWER,  # noqa: E402
+                                                     UPPER)
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """
+    Tests of the replacement of the entry of a position already in the TranspositionTable, with both policies.
+    """
+
+    def test_keeps_deeper_bound(self):
+        """
+        A shallower bound of the same search doesn't replace a deeper entry.
+        """
+        for policy in (DEPTH_PREFERRED, LRU):
+            table = TranspositionTable(size=16, policy=policy)
+            table.store(5, 4, 1.0, LOWER, "deep")
+            table.store(5, 2, -1.0, UPPER, "shallow")
+            self.assertEqual(table.probe(5)[1:5], (4, 1.0, LOWER, "deep"), policy)
+
+    def test_exact_replaces_deeper_bound(self):
+        """
+        An exact value replaces a deeper entry of the same search.
+        """
+        for policy in (DEPTH_PREFERRED, LRU):
+            table = TranspositionTable(size=16, policy=policy)
+            table.store(5, 4, 1.0, LOWER, "deep")
+            table.store(5, 2, 0.5, EXACT, "exact")
+            self.assertEqual(table.probe(5)[1:5], (2, 0.5, EXACT, "exact"), policy)
+
+    def test_new_search_replaces_deeper_entry(self):
+        """
+        Any entry of a new search replaces a deeper entry of an older one.
+        """
+        for policy in (DEPTH_PREFERRED, LRU):
+            table = TranspositionTable(size=16, policy=policy)
+            table.store(5, 4, 1.0, EXACT, "old")
+            table.new_search()
+            table.store(5, 2, -1.0, UPPER, "new")
+            self.assertEqual(table.probe(5)[1:5], (2, -1.0, UPPER, "new"), policy)
+
+
+if __name__ == '__main__':
+    unittest.main()